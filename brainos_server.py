@@ -6,6 +6,7 @@ Minimal entry point with modular tool registration.
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastmcp import FastMCP
@@ -23,9 +24,41 @@ from src.tools import register_memory_tools, register_agent_tools
 # Import observability to trigger Phoenix setup (auto-initializes on import)
 from src.utils import observability
 
+from src.database.connection import get_connection, close_connection
+from src.database.schema import run_migrations
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Connect to Neo4j, apply schema migrations, load the embedder and start background tasks."""
+    from src.core.config import scheduler as scheduler_config
+    from src.tasks.scheduler import start_scheduler, stop_scheduler
+    from src.utils.embeddings import load_embedder
+
+    # Startup failures still stop the scheduler and close the driver
+    try:
+        connection = await get_connection()
+        await run_migrations(connection)
+        await load_embedder()
+        if scheduler_config.enabled:
+            await start_scheduler(
+                max_concurrency=scheduler_config.max_concurrency,
+                jitter_fraction=scheduler_config.jitter_fraction,
+                tick_seconds=scheduler_config.tick_seconds,
+                lease_seconds=scheduler_config.lease_seconds
+            )
+        yield
+    finally:
+        try:
+            await stop_scheduler()
+        finally:
+            await close_connection()
+
+
 # Create FastMCP instance with comprehensive instructions
 mcp = FastMCP(
     "Brain OS",
+    lifespan=lifespan,
     instructions="""
     You are interacting with Brain OS, a cognitive operating system designed as a symbiotic AI-human system.
 
@@ -69,6 +102,7 @@ mcp = FastMCP(
 
     **Creating Memories:**
     - Use `create_memory` for ANY information worth remembering
+    - Use `create_memories` to import many memories at once (e.g., a day's meeting notes)
     - Always include WHY in content, not just WHAT
     - Use observations for nuanced context, rationale, trade-offs
     - Keep entity names consistent across memories (e.g., always "FastTrack" not "fast track")
@@ -190,6 +224,7 @@ async def tool_reference_resource() -> str:
 
 ## Memory Management
 - **create_memory**: Store information with sector, salience, entities
+- **create_memories**: Bulk import many memories in one call
 - **get_memory**: Quick keyword search
 - **get_all_memories**: Complete overview with statistics
 
@@ -341,20 +376,16 @@ When using cognitive_balance prompt, aim for:
 @mcp.resource("brainos://visualize/sectors{?format}")
 async def sectors_visualization_resource(format: str = "ascii") -> str:
     """Generate sector distribution visualization. format: 'ascii' (default) or 'json'."""
-    from src.database.connection import get_driver
-    from src.database.queries.memory import get_bubble_count
-
-    driver = await get_driver()
+    from src.database.queries.memory import get_memory_stats
 
-    # Get sector counts
+    # Get sector counts in a single aggregation
+    stats = await get_memory_stats()
     sectors = ["Episodic", "Semantic", "Procedural", "Emotional", "Reflective"]
-    counts = {}
-    total = 0
-
-    for sector in sectors:
-        count = await get_bubble_count(driver, sector)
-        counts[sector] = count
-        total += count
+    counts = {
+        sector: stats.sectors[sector].count if sector in stats.sectors else 0
+        for sector in sectors
+    }
+    total = sum(counts.values())
 
     if total == 0:
         return "No memories found in the Synaptic Graph."
@@ -398,39 +429,37 @@ async def sectors_visualization_resource(format: str = "ascii") -> str:
 @mcp.resource("brainos://visualize/relations/{bubble_id}")
 async def relations_visualization_resource(bubble_id: str) -> str:
     """Generate Mermaid diagram for a memory's relationships."""
-    from src.database.connection import get_driver
-    from neo4j import AsyncGraphDatabase
+    from src.database.connection import get_driver, session_defaults
+    from src.database.queries.memory import bubble_id_predicate
 
     driver = await get_driver()
 
-    # Extract numeric ID from various formats
-    import re
-    match = re.search(r'\d+', bubble_id)
-    if not match:
-        return "Error: Invalid bubble ID format. Please provide a numeric ID."
-    numeric_id = int(match.group())
+    lookup = bubble_id_predicate(bubble_id)
+    if lookup is None:
+        return "Error: Invalid bubble ID format. Please provide a memory ID."
+    predicate, bubble_ref = lookup
 
-    query = """
+    query = f"""
         MATCH (b:Bubble)
-        WHERE id(b) = $id AND b.valid_to IS NULL
+        WHERE {predicate} AND b.valid_to IS NULL
         OPTIONAL MATCH (b)-[r:LINKED]->(other:Bubble)
         WHERE other.valid_to IS NULL
-        RETURN b, collect({
-            id: id(other),
+        RETURN b {{.uid, .sector, .content}} as bubble, collect({{
+            id: other.uid,
             content: other.content,
             sector: other.sector,
             type: r.type
-        }) as relations
+        }}) as relations
     """
 
-    async with driver.session() as session:
-        result = await session.run(query, id=numeric_id)
+    async with driver.session(**session_defaults()) as session:
+        result = await session.run(query, bubble_ref=bubble_ref)
         record = await result.single()
 
         if not record:
-            return f"Memory with ID {numeric_id} not found."
+            return f"Memory with ID {bubble_id} not found."
 
-        node = record["b"]
+        node = record["bubble"]
         relations = record["relations"]
 
         # Build Mermaid diagram
@@ -459,7 +488,7 @@ async def relations_visualization_resource(bubble_id: str) -> str:
         lines.append("**Neo4j Browser Query:**")
         lines.append(f"```cypher")
         lines.append(f'MATCH (b)-[r:LINKED]->(other)')
-        lines.append(f'WHERE id(b) = {numeric_id}')
+        lines.append(f'WHERE b.uid = "{node.get("uid")}"')
         lines.append(f'RETURN b, r, other')
         lines.append(f"```")
 
@@ -558,6 +587,7 @@ if __name__ == "__main__":
     logger.info(f"Starting Brain OS MCP Server on {host}:{port}...")
     logger.info("Available tools:")
     logger.info("  - create_memory: Store a new memory in the Synaptic Graph")
+    logger.info("  - create_memories: Store many memories in one call")
     logger.info("  - get_memory: Retrieve memories by search query")
     logger.info("  - get_all_memories: Retrieve all memories")
     logger.info("  - list_sectors: List all cognitive sectors")
@@ -5,6 +5,8 @@ Loads environment variables and provides global settings.
 
 import os
 from dataclasses import dataclass
+from typing import Optional
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -13,17 +15,36 @@ load_dotenv()
 
 @dataclass(frozen=True)
 class Neo4jConfig:
-    """Neo4j database configuration."""
+    """Neo4j database configuration.
+
+    Pool and session settings default to the driver's own defaults.
+    Timeouts and lifetimes are in seconds.
+    """
     uri: str
     user: str
     password: str
+    database: Optional[str] = None
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0
+    max_connection_lifetime: float = 3600.0
+    liveness_check_timeout: Optional[float] = None
+    fetch_size: int = 1000
+    max_transaction_retry_time: float = 30.0
 
     @classmethod
     def from_env(cls) -> "Neo4jConfig":
+        liveness_check_timeout = os.getenv("NEO4J_LIVENESS_CHECK_TIMEOUT")
         return cls(
             uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
             user=os.getenv("NEO4J_USER", "neo4j"),
-            password=os.getenv("NEO4J_PASSWORD", "brainos_password_123")
+            password=os.getenv("NEO4J_PASSWORD", "brainos_password_123"),
+            database=os.getenv("NEO4J_DATABASE") or None,
+            max_connection_pool_size=int(os.getenv("NEO4J_MAX_POOL_SIZE", "100")),
+            connection_acquisition_timeout=float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "60")),
+            max_connection_lifetime=float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600")),
+            liveness_check_timeout=float(liveness_check_timeout) if liveness_check_timeout else None,
+            fetch_size=int(os.getenv("NEO4J_FETCH_SIZE", "1000")),
+            max_transaction_retry_time=float(os.getenv("NEO4J_MAX_RETRY_TIME", "30"))
         )
 
 
@@ -67,8 +88,29 @@ class OpenRouterConfig:
         )
 
 
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """Background task scheduler configuration."""
+    enabled: bool
+    max_concurrency: int
+    jitter_fraction: float
+    tick_seconds: float
+    lease_seconds: float
+
+    @classmethod
+    def from_env(cls) -> "SchedulerConfig":
+        return cls(
+            enabled=os.getenv("BRAINOS_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes"),
+            max_concurrency=int(os.getenv("BRAINOS_SCHEDULER_MAX_CONCURRENCY", "2")),
+            jitter_fraction=float(os.getenv("BRAINOS_SCHEDULER_JITTER", "0.05")),
+            tick_seconds=float(os.getenv("BRAINOS_SCHEDULER_TICK_SECONDS", "30")),
+            lease_seconds=float(os.getenv("BRAINOS_SCHEDULER_LEASE_SECONDS", "300"))
+        )
+
+
 # Global configuration instances
 neo4j = Neo4jConfig.from_env()
+scheduler = SchedulerConfig.from_env()
 groq = GroqConfig.from_env()
 openrouter = OpenRouterConfig.from_env()
 
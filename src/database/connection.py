@@ -1,11 +1,12 @@
 """
 Neo4j async connection management.
-Handles driver lifecycle and connection pooling.
+Handles driver lifecycle, connection pooling and managed transactions.
 """
 
 import logging
+import time
 from typing import Optional
-from neo4j import AsyncGraphDatabase
+from neo4j import AsyncGraphDatabase, Record
 from neo4j.exceptions import ServiceUnavailable
 
 from src.core.config import neo4j
@@ -13,13 +14,58 @@ from src.core.config import neo4j
 logger = logging.getLogger(__name__)
 
 
+def session_defaults() -> dict:
+    """
+    Session settings from configuration.
+
+    Pass these to driver.session() when using the raw driver, so every
+    session targets the configured database and fetch size.
+    """
+    defaults = {"fetch_size": neo4j.fetch_size}
+    if neo4j.database:
+        defaults["database"] = neo4j.database
+    return defaults
+
+
+async def fetch_all(tx, cypher: str, params: dict) -> list[Record]:
+    """Transaction function that runs a query and buffers every record.
+
+    Records must be consumed inside the transaction function, since a retry
+    re-runs it from scratch.
+    """
+    result = await tx.run(cypher, params)
+    return [record async for record in result]
+
+
 class Neo4jConnection:
     """Async Neo4j connection manager."""
 
-    def __init__(self, uri: str, user: str, password: str):
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        database: Optional[str] = None,
+        fetch_size: int = 1000,
+        **driver_options
+    ):
+        """
+        Args:
+            uri: Bolt/neo4j URI
+            user: Username
+            password: Password
+            database: Default database for sessions (None = server default)
+            fetch_size: Records fetched per batch by sessions
+            **driver_options: Driver settings, e.g. max_connection_pool_size,
+                connection_acquisition_timeout, max_connection_lifetime,
+                liveness_check_timeout, max_transaction_retry_time
+        """
         self.uri = uri
         self.user = user
         self.password = password
+        self.database = database
+        self.fetch_size = fetch_size
+        self.driver_options = {k: v for k, v in driver_options.items() if v is not None}
         self.driver: Optional[AsyncGraphDatabase.driver] = None
 
     async def connect(self) -> None:
@@ -27,7 +73,8 @@ class Neo4jConnection:
         try:
             self.driver = AsyncGraphDatabase.driver(
                 self.uri,
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                **self.driver_options
             )
             # Verify connection
             await self.driver.verify_connectivity()
@@ -42,11 +89,104 @@ class Neo4jConnection:
             await self.driver.close()
             logger.info("Neo4j connection closed")
 
-    def session(self):
-        """Get a new async session from the driver."""
+    def session(self, **config):
+        """
+        Get a new async session from the driver.
+
+        Uses the connection's database and fetch size unless overridden
+        in config. Sessions share the driver's bookmark manager, so a read
+        issued after a write sees that write even when routed to a replica.
+        """
+        if not self.driver:
+            raise RuntimeError("Driver not initialized. Call connect() first.")
+        config.setdefault("fetch_size", self.fetch_size)
+        config.setdefault("bookmark_manager", self.driver.execute_query_bookmark_manager)
+        if self.database:
+            config.setdefault("database", self.database)
+        return self.driver.session(**config)
+
+    async def read(self, cypher: str, /, **params) -> list[Record]:
+        """
+        Run a query in a managed read transaction.
+
+        Reads are routed to followers/read replicas on a cluster, and the
+        driver retries transient failures (leader switches, deadlocks,
+        dropped connections) for up to max_transaction_retry_time.
+
+        Args:
+            cypher: Read-only Cypher query
+            **params: Query parameters
+
+        Returns:
+            All result records
+        """
+        async with self.session() as session:
+            return await session.execute_read(fetch_all, cypher, params)
+
+    async def write(self, cypher: str, /, **params) -> list[Record]:
+        """
+        Run a query in a managed write transaction.
+
+        Routed to the leader and retried on transient failures like read().
+        The query may run more than once, so it must be safe to retry.
+
+        Args:
+            cypher: Cypher query that writes
+            **params: Query parameters
+
+        Returns:
+            All result records
+        """
+        async with self.session() as session:
+            return await session.execute_write(fetch_all, cypher, params)
+
+    def pool_metrics(self) -> dict:
+        """
+        Snapshot of connection pool utilization.
+
+        The driver has no public pool metrics API, so this reads its pool
+        internals on a best-effort basis; in_use and idle are None if the
+        driver's internals change.
+
+        Returns:
+            Dict with max_size, in_use and idle connection counts
+        """
+        metrics = {
+            "max_size": self.driver_options.get("max_connection_pool_size"),
+            "in_use": None,
+            "idle": None,
+        }
+        pool = getattr(self.driver, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return metrics
+        try:
+            in_use = idle = 0
+            for address_connections in list(connections.values()):
+                for connection in list(address_connections):
+                    if getattr(connection, "in_use", False):
+                        in_use += 1
+                    else:
+                        idle += 1
+            metrics["in_use"] = in_use
+            metrics["idle"] = idle
+        except Exception as e:
+            logger.debug(f"Could not read pool metrics: {e}")
+        return metrics
+
+    async def measure_acquisition(self) -> float:
+        """
+        Time acquiring a pooled connection and checking it is alive.
+
+        Returns:
+            Milliseconds spent, which grows when the pool is exhausted and
+            callers wait for a free connection
+        """
         if not self.driver:
             raise RuntimeError("Driver not initialized. Call connect() first.")
-        return self.driver.session()
+        start = time.perf_counter()
+        await self.driver.verify_connectivity()
+        return (time.perf_counter() - start) * 1000
 
 
 # Global connection instance
@@ -60,7 +200,14 @@ async def get_connection() -> Neo4jConnection:
         _connection = Neo4jConnection(
             uri=neo4j.uri,
             user=neo4j.user,
-            password=neo4j.password
+            password=neo4j.password,
+            database=neo4j.database,
+            fetch_size=neo4j.fetch_size,
+            max_connection_pool_size=neo4j.max_connection_pool_size,
+            connection_acquisition_timeout=neo4j.connection_acquisition_timeout,
+            max_connection_lifetime=neo4j.max_connection_lifetime,
+            liveness_check_timeout=neo4j.liveness_check_timeout,
+            max_transaction_retry_time=neo4j.max_transaction_retry_time
         )
         await _connection.connect()
     return _connection
@@ -5,14 +5,28 @@ Each query type is in its own module for scalability.
 
 from src.database.queries.memory import (
     upsert_bubble,
+    upsert_bubbles_batch,
     search_bubbles,
+    search_bubbles_multi,
+    vector_search_bubbles,
     get_bubble_by_id,
     get_all_bubbles,
+    get_bubbles_page,
+    search_bubbles_page,
+    bubble_id_predicate,
+    update_bubble_observations,
 )
 
 __all__ = [
     "upsert_bubble",
+    "upsert_bubbles_batch",
     "search_bubbles",
+    "search_bubbles_multi",
+    "vector_search_bubbles",
     "get_bubble_by_id",
     "get_all_bubbles",
+    "get_bubbles_page",
+    "search_bubbles_page",
+    "bubble_id_predicate",
+    "update_bubble_observations",
 ]
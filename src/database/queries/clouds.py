@@ -0,0 +1,210 @@
+"""
+Cypher query functions for clouds (Reflective syntheses of memory clusters).
+
+A cluster is the set of high-salience bubbles sharing an entity (clusters
+whose entities co-occur in mostly the same bubbles are merged). A cloud is
+a Reflective bubble synthesized from one cluster, with source CLOUD_SOURCE,
+LINKED to its sources and tagged with the cluster's cloud_key and
+cloud_entities. Clouds are told apart by their source, not their sector:
+users store Reflective memories too. A new cloud retires
+every active cloud sharing one of its entities, so clouds are replaced even
+when merging changes a cluster's key.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from src.database.connection import get_connection
+
+logger = logging.getLogger(__name__)
+
+# Sector of synthesized clouds
+CLOUD_SECTOR = "Reflective"
+
+# Source of synthesized clouds; excluded from clustering so clouds don't feed on themselves
+CLOUD_SOURCE = "cloud_synthesis"
+
+# LINKED relation type from a cloud to each of its source bubbles
+CLOUD_LINK_TYPE = "synthesizes"
+
+
+async def find_entity_clusters(
+    since: datetime,
+    min_salience: float = 0.7,
+    min_cluster_size: int = 5,
+    max_members: int = 25
+) -> list[dict]:
+    """
+    Find entity clusters that gained bubbles since a watermark.
+
+    One aggregation query: entities of bubbles created after since (a range
+    seek on created_at) select the clusters to reconsider, then a single pass
+    groups every high-salience bubble under those entities. Entities that
+    share an active cloud with a selected entity are reconsidered too, so a
+    merged cloud is re-synthesized as a whole. Entities are compared trimmed
+    and case-insensitively.
+
+    Every qualifying cluster is returned, so a caller that processes them
+    all can advance its watermark without losing any.
+
+    Args:
+        since: Watermark; only clusters with a bubble created after it qualify
+        min_salience: Minimum salience for a bubble to count
+        min_cluster_size: Minimum bubbles per cluster
+        max_members: Maximum member bubbles returned per cluster, most salient first
+
+    Returns:
+        List of dicts with entity, size and members (uid, content, sector,
+        salience), largest first
+    """
+    conn = await get_connection()
+
+    cypher = """
+    MATCH (n:Bubble)
+    WHERE n.created_at > $since
+    AND n.valid_to IS NULL
+    AND n.salience >= $min_salience
+    AND coalesce(n.source, '') <> $cloud_source
+    UNWIND n.entities AS raw_entity
+    WITH collect(DISTINCT toLower(trim(raw_entity))) AS fresh
+    WHERE size(fresh) > 0
+    OPTIONAL MATCH (c:Bubble {source: $cloud_source})
+    WHERE c.valid_to IS NULL
+    AND c.cloud_key IS NOT NULL
+    AND any(e IN coalesce(c.cloud_entities, split(c.cloud_key, '|')) WHERE e IN fresh)
+    WITH fresh, collect(coalesce(c.cloud_entities, split(c.cloud_key, '|'))) AS cloud_groups
+    WITH reduce(
+        entities = fresh, grouped IN cloud_groups |
+        entities + [e IN grouped WHERE NOT e IN entities]
+    ) AS fresh
+    MATCH (b:Bubble)
+    WHERE b.valid_to IS NULL
+    AND b.salience >= $min_salience
+    AND coalesce(b.source, '') <> $cloud_source
+    UNWIND b.entities AS raw_entity
+    WITH fresh, toLower(trim(raw_entity)) AS entity, b
+    WHERE entity IN fresh
+    WITH entity, b
+    ORDER BY b.salience DESC
+    WITH entity, collect(DISTINCT b {.uid, .content, .sector, .salience}) AS members
+    WHERE size(members) >= $min_cluster_size
+    RETURN entity, size(members) AS size, members[..$max_members] AS members
+    ORDER BY size DESC
+    """
+
+    records = await conn.read(
+        cypher,
+        since=since,
+        min_salience=min_salience,
+        cloud_source=CLOUD_SOURCE,
+        min_cluster_size=min_cluster_size,
+        max_members=max_members
+    )
+    clusters = [
+        {"entity": r["entity"], "size": r["size"], "members": r["members"]}
+        for r in records
+    ]
+    logger.info(f"Found {len(clusters)} entity clusters with new bubbles since {since.isoformat()}")
+    return clusters
+
+
+def merge_cooccurring_clusters(clusters: list[dict], min_overlap: float = 0.5) -> list[dict]:
+    """
+    Merge entity clusters whose entities mostly co-occur in the same bubbles.
+
+    Two clusters merge when the Jaccard similarity of their member uids is at
+    least min_overlap, so e.g. "fastapi" and "brain os" collapse into one
+    cloud when they are mentioned together. Larger clusters absorb smaller
+    ones; members stay ordered by salience.
+
+    Args:
+        clusters: Output of find_entity_clusters
+        min_overlap: Minimum Jaccard similarity of member sets to merge
+
+    Returns:
+        List of dicts with entities (sorted), members and key (stable cluster id)
+    """
+    merged: list[dict] = []
+    for cluster in sorted(clusters, key=lambda c: c["size"], reverse=True):
+        uids = {m["uid"] for m in cluster["members"]}
+        for target in merged:
+            overlap = len(uids & target["uids"]) / len(uids | target["uids"])
+            if overlap >= min_overlap:
+                target["entities"].add(cluster["entity"])
+                target["members"].extend(m for m in cluster["members"] if m["uid"] not in target["uids"])
+                target["uids"] |= uids
+                break
+        else:
+            merged.append({
+                "entities": {cluster["entity"]},
+                "members": list(cluster["members"]),
+                "uids": uids,
+            })
+
+    result = []
+    for cluster in merged:
+        entities = sorted(cluster["entities"])
+        result.append({
+            "key": "|".join(entities),
+            "entities": entities,
+            "members": sorted(cluster["members"], key=lambda m: m.get("salience") or 0, reverse=True),
+        })
+    return result
+
+
+async def link_cloud(
+    cloud_uid: str,
+    cloud_key: str,
+    entities: list[str],
+    source_uids: list[str]
+) -> int:
+    """
+    Tag a cloud with its cluster, retire the clouds it supersedes, and link
+    it to its sources.
+
+    Any active cloud sharing an entity with this one is retired, not just
+    one with the same key: when clusters merge or split, the key changes
+    but the new cloud still covers those entities.
+
+    Args:
+        cloud_uid: uid of the new cloud bubble
+        cloud_key: Stable identifier of the cluster
+        entities: Normalized entities of the cluster
+        source_uids: uids of the bubbles the cloud was synthesized from
+
+    Returns:
+        Number of LINKED edges to sources
+    """
+    conn = await get_connection()
+    now = datetime.now(timezone.utc)
+
+    cypher = """
+    MATCH (c:Bubble {uid: $cloud_uid})
+    SET c.cloud_key = $cloud_key,
+        c.cloud_entities = $entities
+    WITH c
+    OPTIONAL MATCH (old:Bubble {source: $cloud_source})
+    WHERE old <> c
+    AND old.valid_to IS NULL
+    AND old.cloud_key IS NOT NULL
+    AND any(e IN coalesce(old.cloud_entities, split(old.cloud_key, '|')) WHERE e IN $entities)
+    SET old.valid_to = $now
+    WITH DISTINCT c
+    UNWIND $source_uids AS source_uid
+    MATCH (s:Bubble {uid: source_uid})
+    MERGE (c)-[r:LINKED]->(s)
+    ON CREATE SET r.type = $link_type, r.created_at = $now
+    RETURN count(r) AS linked
+    """
+
+    records = await conn.write(
+        cypher,
+        cloud_uid=cloud_uid,
+        cloud_key=cloud_key,
+        entities=entities,
+        source_uids=source_uids,
+        cloud_source=CLOUD_SOURCE,
+        link_type=CLOUD_LINK_TYPE,
+        now=now
+    )
+    return records[0]["linked"] if records else 0
@@ -5,28 +5,198 @@ Single-purpose database operations for bubbles and clouds.
 Phase 3 Enhanced: Supports memory_type, activation_threshold, entities, observations.
 """
 
+import base64
+import hashlib
+import json
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+import os
+import re
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence
+
+from neo4j.exceptions import ClientError
 
 from src.database.connection import get_connection
-from src.utils.schemas import BubbleCreate, BubbleResponse
+from src.database.schema import BUBBLE_FULLTEXT_INDEX, BUBBLE_VECTOR_INDEX
+from src.utils.embeddings import embed_texts
+from src.utils.schemas import BubbleCreate, BubblePage, BubbleResponse, MemoryStats, SectorStats
 
 logger = logging.getLogger(__name__)
 
+# Rows per transaction for batched writes
+DEFAULT_BATCH_SIZE = 500
 
-async def upsert_bubble(data: BubbleCreate) -> BubbleResponse:
+# Stored Bubble properties that can be requested through a field projection
+BUBBLE_PROPERTIES = (
+    "content", "sector", "source", "salience", "created_at", "valid_from",
+    "valid_to", "memory_type", "activation_threshold", "entities",
+    "observations", "access_count", "last_accessed",
+)
+
+# Characters with special meaning in Lucene query syntax
+_LUCENE_SPECIAL_CHARS = set('+-&|!(){}[]^"~*?:\\/')
+
+# Neo4j 5 element ids: "<format>:<database id>:<entity id>", e.g. "4:abc123:14"
+_ELEMENT_ID = re.compile(r"\d+:[^:\s]+:\d+")
+
+
+def _parse_datetime(value) -> Optional[datetime]:
     """
-    Store a new memory bubble in Neo4j.
+    Convert a stored timestamp to a datetime.
 
-    Phase 3 Enhanced: Stores memory_type, activation_threshold, entities, observations.
-    Uses MERGE on content to avoid duplicates, or CREATE if new.
-    Sets automatic timestamp fields for temporal evolution tracking.
+    Timestamps are stored as native Neo4j DATETIME values; ISO strings written
+    before schema migration 5 are still accepted.
     """
-    conn = await get_connection()
-    now = datetime.now(timezone.utc)
+    if value is None or isinstance(value, datetime):
+        return value
+    if hasattr(value, "to_native"):
+        return value.to_native()
+    return datetime.fromisoformat(value)
+
+
+def _projection(fields: Optional[Sequence[str]], alias: str = "b") -> str:
+    """
+    Build the RETURN expression for a bubble as a map projection.
+
+    Whole nodes are never returned: they would carry the stored embedding
+    vector, which no caller reads.
+
+    Args:
+        fields: Bubble properties to return, or None for all of
+            BUBBLE_PROPERTIES. "id" is accepted and ignored (the ID is
+            always returned separately).
+        alias: Cypher variable bound to the bubble
+
+    Returns:
+        Cypher expression, e.g. "b {.sector, .salience}"
+    """
+    if fields is None:
+        fields = BUBBLE_PROPERTIES
+    unknown = set(fields) - set(BUBBLE_PROPERTIES) - {"id"}
+    if unknown:
+        raise ValueError(f"Unknown bubble fields: {', '.join(sorted(unknown))}")
+    properties = ", ".join(f".{f}" for f in fields if f != "id")
+    return f"{alias} {{{properties}}}"
+
+
+def _or_default(value, default):
+    """Value of a bubble property, or default if it is missing (null)."""
+    return default if value is None else value
+
+
+def node_to_bubble(node, bubble_id, validate: bool = False) -> BubbleResponse:
+    """
+    Map a Bubble node (or map projection) to a BubbleResponse.
+
+    Rows read back from Neo4j were validated when they were written, so by
+    default the response is built with model_construct, which skips Pydantic
+    validation. Pass validate=True for data that did not come from the
+    database.
+
+    Args:
+        node: Neo4j Node or dict of bubble properties; missing or null
+            properties get the model defaults
+        bubble_id: Identifier to expose as BubbleResponse.id
+        validate: Run full Pydantic validation
+
+    Returns:
+        BubbleResponse for the node
+    """
+    fields = {
+        "id": str(bubble_id),
+        "content": node.get("content"),
+        "sector": node.get("sector"),
+        "source": node.get("source"),
+        "salience": node.get("salience"),
+        "created_at": _parse_datetime(node.get("created_at")),
+        "valid_from": _parse_datetime(node.get("valid_from")),
+        "valid_to": _parse_datetime(node.get("valid_to")),
+        "memory_type": _or_default(node.get("memory_type"), "thinking"),
+        "activation_threshold": _or_default(node.get("activation_threshold"), 0.65),
+        "entities": _or_default(node.get("entities"), []),
+        "observations": _or_default(node.get("observations"), []),
+        "accessed_count": _or_default(node.get("access_count"), 0),
+        "last_accessed": _parse_datetime(node.get("last_accessed")),
+    }
+    if validate:
+        return BubbleResponse(**fields)
+    return BubbleResponse.model_construct(**fields)
+
+
+def new_bubble_uid() -> str:
+    """
+    Generate a public bubble ID (UUIDv7).
+
+    UUIDv7 leads with a millisecond timestamp, so IDs sort roughly by
+    creation time and index inserts stay append-mostly.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | rand & ((1 << 62) - 1)
+    )
+    return str(uuid.UUID(int=value))
+
+
+def bubble_id_predicate(bubble_id, alias: str = "b") -> tuple[str, object]:
+    """
+    Build the WHERE predicate that looks a bubble up by ID.
+
+    Public IDs are UUIDs stored on b.uid and served by a unique constraint,
+    so lookups are index seeks. Legacy numeric ids (id(b)) and element ids
+    are still accepted for callers holding IDs issued before uids existed.
+
+    Args:
+        bubble_id: uid, numeric internal id, or element id
+        alias: Cypher variable bound to the bubble
 
-    # Auto-calculate activation_threshold if not provided
+    Returns:
+        (predicate, value) to bind as $bubble_ref
+
+    Raises:
+        ValueError: If bubble_id is none of the accepted forms
+    """
+    value = str(bubble_id).strip()
+    try:
+        return f"{alias}.uid = $bubble_ref", str(uuid.UUID(value))
+    except ValueError:
+        pass
+    if value.isdigit():
+        return f"id({alias}) = $bubble_ref", int(value)
+    if _ELEMENT_ID.fullmatch(value):
+        return f"elementId({alias}) = $bubble_ref", value
+    raise ValueError(
+        f"Invalid bubble ID {value!r}: expected a uid like "
+        "'01927c3e-8f1a-7b2c-9d4e-5f6a7b8c9d0e', a legacy numeric id or an element id"
+    )
+
+
+def compute_content_hash(content: str) -> str:
+    """
+    Compute the identity hash of a bubble's content.
+
+    Whitespace runs are collapsed and case is folded before hashing, so
+    contents differing only in spacing or capitalization share one bubble.
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    normalized = " ".join(content.split()).casefold()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _bubble_row(data: BubbleCreate) -> dict:
+    """
+    Build the Cypher parameters for writing a bubble.
+
+    Auto-calculates activation_threshold from memory_type if not provided.
+    """
     activation_threshold = data.activation_threshold
     if activation_threshold is None:
         thresholds = {
@@ -36,9 +206,38 @@ async def upsert_bubble(data: BubbleCreate) -> BubbleResponse:
         }
         activation_threshold = thresholds.get(data.memory_type, 0.65)
 
-    cypher = """
-    MERGE (b:Bubble {content: $content})
+    return {
+        "content_hash": compute_content_hash(data.content),
+        "content": data.content,
+        "sector": data.sector,
+        "source": data.source,
+        "salience": data.salience,
+        "memory_type": data.memory_type,
+        "activation_threshold": activation_threshold,
+        "entities": data.entities or [],
+        "observations": data.observations or [],
+    }
+
+
+async def upsert_bubble(data: BubbleCreate) -> BubbleResponse:
+    """
+    Store a new memory bubble in Neo4j.
+
+    Phase 3 Enhanced: Stores memory_type, activation_threshold, entities, observations.
+    Uses MERGE on the normalized content hash to avoid duplicates, or CREATE if new.
+    Sets automatic timestamp fields for temporal evolution tracking.
+    last_accessed starts at the creation time, so it is never null; a bubble
+    that was never accessed is one with access_count 0.
+    The content is embedded locally for semantic search (see src.utils.embeddings).
+    """
+    conn = await get_connection()
+    now = datetime.now(timezone.utc)
+
+    cypher = f"""
+    MERGE (b:Bubble {{content_hash: $content_hash}})
     ON CREATE SET
+        b.uid = $uid,
+        b.content = $content,
         b.sector = $sector,
         b.source = $source,
         b.salience = $salience,
@@ -50,65 +249,204 @@ async def upsert_bubble(data: BubbleCreate) -> BubbleResponse:
         b.valid_from = $now,
         b.valid_to = NULL,
         b.access_count = 0,
-        b.last_accessed = NULL
+        b.last_accessed = $now,
+        b.embedding = $embedding
     ON MATCH SET
         b.salience = $salience,
         b.accessed_at = $now,
         b.access_count = coalesce(b.access_count, 0) + 1,
-        b.last_accessed = $now
-    RETURN b, id(b) as internal_id
+        b.last_accessed = $now,
+        b.embedding = coalesce(b.embedding, $embedding)
+    RETURN {_projection(None)} as bubble, b.uid as uid
     """
 
-    async with conn.session() as session:
-        result = await session.run(
-            cypher,
-            content=data.content,
-            sector=data.sector,
-            source=data.source,
-            salience=data.salience,
-            memory_type=data.memory_type,
-            activation_threshold=activation_threshold,
-            entities=data.entities or [],
-            observations=data.observations or [],
-            now=now.isoformat()
-        )
-        record = await result.single()
-        if record:
-            node = record["b"]
-            internal_id = record["internal_id"]
-            logger.info(f"Stored bubble (type={data.memory_type}): {data.content[:50]}...")
-            return BubbleResponse(
-                id=str(internal_id),  # Use simple numeric ID
-                content=node["content"],
-                sector=node["sector"],
-                source=node["source"],
-                salience=node["salience"],
-                created_at=datetime.fromisoformat(node["created_at"]),
-                valid_from=datetime.fromisoformat(node["valid_from"]),
-                valid_to=None,
-                memory_type=node.get("memory_type", "thinking"),
-                activation_threshold=node.get("activation_threshold", 0.65),
-                entities=node.get("entities", []),
-                observations=node.get("observations", []),
-                accessed_count=node.get("access_count", 0),
-                last_accessed=node.get("last_accessed")
-            )
+    vectors = await embed_texts([data.content])
+    records = await conn.write(
+        cypher,
+        **_bubble_row(data),
+        uid=new_bubble_uid(),
+        now=now,
+        embedding=vectors[0] if vectors else None
+    )
+    if records:
+        record = records[0]
+        logger.info(f"Stored bubble (type={data.memory_type}): {data.content[:50]}...")
+        return node_to_bubble(record["bubble"], record["uid"])
     raise RuntimeError("Failed to create bubble")
 
 
-async def search_bubbles(query: str, limit: int = 10, memory_type: Optional[str] = None) -> list[BubbleResponse]:
+async def upsert_bubbles_batch(
+    items: list[BubbleCreate],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> list[BubbleResponse]:
+    """
+    Store many memory bubbles with chunked UNWIND writes.
+
+    Same MERGE semantics as upsert_bubble, but each chunk of batch_size rows
+    is written in a single transaction and round trip. Items repeating the
+    same content (after normalization) resolve to the same bubble. As there,
+    new bubbles start with last_accessed at their creation time.
+
+    Args:
+        items: Bubbles to store
+        batch_size: Rows per transaction
+
+    Returns:
+        One BubbleResponse per input item, in input order
+    """
+    if not items:
+        return []
+
+    conn = await get_connection()
+    now = datetime.now(timezone.utc)
+
+    cypher = f"""
+    UNWIND $rows AS row
+    MERGE (b:Bubble {{content_hash: row.content_hash}})
+    ON CREATE SET
+        b.uid = row.uid,
+        b.content = row.content,
+        b.sector = row.sector,
+        b.source = row.source,
+        b.salience = row.salience,
+        b.memory_type = row.memory_type,
+        b.activation_threshold = row.activation_threshold,
+        b.entities = row.entities,
+        b.observations = row.observations,
+        b.created_at = $now,
+        b.valid_from = $now,
+        b.valid_to = NULL,
+        b.access_count = 0,
+        b.last_accessed = $now,
+        b.embedding = row.embedding
+    ON MATCH SET
+        b.salience = row.salience,
+        b.accessed_at = $now,
+        b.access_count = coalesce(b.access_count, 0) + 1,
+        b.last_accessed = $now,
+        b.embedding = coalesce(b.embedding, row.embedding)
+    RETURN row.idx as idx, {_projection(None)} as bubble, b.uid as uid
+    """
+
+    vectors = await embed_texts([item.content for item in items]) or [None] * len(items)
+    rows = [
+        {"idx": i, "uid": new_bubble_uid(), "embedding": vectors[i], **_bubble_row(item)}
+        for i, item in enumerate(items)
+    ]
+    results: list[Optional[BubbleResponse]] = [None] * len(rows)
+
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
+        for record in await conn.write(cypher, rows=chunk, now=now):
+            results[record["idx"]] = node_to_bubble(record["bubble"], record["uid"])
+        logger.debug(f"Stored bubble batch rows {start}-{start + len(chunk) - 1}")
+
+    if any(r is None for r in results):
+        raise RuntimeError("Failed to store all bubbles in batch")
+
+    logger.info(f"Stored {len(results)} bubbles in batches of {batch_size}")
+    return results
+
+
+def _to_fulltext_query(text: str) -> str:
     """
-    Search for bubbles containing the query string.
+    Convert free text into a Lucene query for the bubble full-text index.
+
+    Each whitespace-separated term is escaped and lowercased (so words like
+    AND/OR are not treated as operators). Terms are OR-ed, which lets BM25
+    rank bubbles matching more of the terms higher.
+    """
+    terms = []
+    for term in text.split():
+        escaped = "".join(
+            f"\\{char}" if char in _LUCENE_SPECIAL_CHARS else char
+            for char in term.lower()
+        )
+        terms.append(escaped)
+    return " ".join(terms)
+
+
+async def search_bubbles(
+    query: str,
+    limit: int = 10,
+    memory_type: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None
+) -> list[BubbleResponse]:
+    """
+    Search for bubbles matching the query string.
 
     Phase 3 Enhanced: Optional filtering by memory_type.
-    Uses CONTAINS for case-insensitive partial matching.
-    Returns results ordered by recency (most recent first).
+    Uses the bubble full-text index (content, entities, observations, sector)
+    and returns results ranked by BM25 score, most recent first on ties.
+    Falls back to a case-insensitive CONTAINS scan ordered by recency when
+    the full-text index is missing. An empty query returns the most recent bubbles.
 
     Args:
         query: Search term
         limit: Maximum results
         memory_type: Optional filter for memory type (instinctive/thinking/dormant)
+        fields: Optional bubble properties to return (see BUBBLE_PROPERTIES);
+            properties not requested are left empty on the responses
     """
+    fulltext_query = _to_fulltext_query(query)
+    if fulltext_query:
+        try:
+            bubbles = await _search_bubbles_fulltext(fulltext_query, limit, memory_type, fields)
+            logger.info(f"Found {len(bubbles)} bubbles for query: {query}")
+            return bubbles
+        except ClientError as e:
+            logger.warning(
+                f"Full-text index '{BUBBLE_FULLTEXT_INDEX}' unavailable, falling back to scan: {e.code}"
+            )
+
+    bubbles = await _search_bubbles_scan(query, limit, memory_type, fields)
+    logger.info(f"Found {len(bubbles)} bubbles for query: {query}")
+    return bubbles
+
+
+async def _search_bubbles_fulltext(
+    fulltext_query: str,
+    limit: int,
+    memory_type: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None
+) -> list[BubbleResponse]:
+    """Search bubbles through the full-text index, ordered by BM25 score."""
+    conn = await get_connection()
+
+    where_clauses = ["b.valid_to IS NULL"]
+    if memory_type:
+        where_clauses.append("b.memory_type = $memory_type")
+
+    where_clause = " AND ".join(where_clauses)
+
+    cypher = f"""
+    CALL db.index.fulltext.queryNodes($index_name, $search_query)
+    YIELD node AS b, score
+    WHERE {where_clause}
+    RETURN {_projection(fields)} as bubble, b.uid as uid
+    ORDER BY score DESC, b.created_at DESC
+    LIMIT $result_limit
+    """
+
+    params = {
+        "index_name": BUBBLE_FULLTEXT_INDEX,
+        "search_query": fulltext_query,
+        "result_limit": limit
+    }
+    if memory_type:
+        params["memory_type"] = memory_type
+
+    records = await conn.read(cypher, **params)
+    return [node_to_bubble(record["bubble"], record["uid"]) for record in records]
+
+
+async def _search_bubbles_scan(
+    query: str,
+    limit: int,
+    memory_type: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None
+) -> list[BubbleResponse]:
+    """Search bubbles with a CONTAINS label scan, ordered by recency."""
     conn = await get_connection()
 
     # Build dynamic query based on filters
@@ -125,7 +463,7 @@ async def search_bubbles(query: str, limit: int = 10, memory_type: Optional[str]
     cypher = f"""
     MATCH (b:Bubble)
     WHERE {where_clause}
-    RETURN b, id(b) as internal_id
+    RETURN {_projection(fields)} as bubble, b.uid as uid
     ORDER BY b.created_at DESC
     LIMIT $result_limit
     """
@@ -137,119 +475,462 @@ async def search_bubbles(query: str, limit: int = 10, memory_type: Optional[str]
     if memory_type:
         params["memory_type"] = memory_type
 
-    async with conn.session() as session:
-        result = await session.run(cypher, **params)
-        bubbles = []
-        async for record in result:
-            node = record["b"]
-            internal_id = record["internal_id"]
-            bubbles.append(BubbleResponse(
-                id=str(internal_id),  # Use simple numeric ID
-                content=node["content"],
-                sector=node["sector"],
-                source=node["source"],
-                salience=node["salience"],
-                created_at=datetime.fromisoformat(node["created_at"]),
-                valid_from=datetime.fromisoformat(node["valid_from"]),
-                valid_to=datetime.fromisoformat(node["valid_to"]) if node.get("valid_to") else None,
-                memory_type=node.get("memory_type", "thinking"),
-                activation_threshold=node.get("activation_threshold", 0.65),
-                entities=node.get("entities", []),
-                observations=node.get("observations", []),
-                accessed_count=node.get("access_count", 0),
-                last_accessed=node.get("last_accessed")
-            ))
-        logger.info(f"Found {len(bubbles)} bubbles for query: {query}")
-        return bubbles
+    records = await conn.read(cypher, **params)
+    return [node_to_bubble(record["bubble"], record["uid"]) for record in records]
+
+
+async def search_bubbles_multi(
+    terms: Sequence[str],
+    limit_per_term: int = 5,
+    memory_type: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None
+) -> list[tuple[BubbleResponse, list[str]]]:
+    """
+    Search for several terms in one round trip.
+
+    Each term is matched like search_bubbles (full-text index, CONTAINS scan
+    fallback) inside a single UNWIND $terms query, keeping its top
+    limit_per_term bubbles. The union is de-duplicated server-side, so
+    latency no longer grows with one query per term.
+
+    Args:
+        terms: Search terms (blank terms and case-insensitive duplicates are ignored)
+        limit_per_term: Maximum bubbles kept per term
+        memory_type: Optional filter for memory type (instinctive/thinking/dormant)
+        fields: Optional bubble properties to return (see BUBBLE_PROPERTIES)
+
+    Returns:
+        List of (bubble, matched terms) pairs, bubbles matching more terms
+        first, then by best score
+    """
+    # Both search paths ignore case, so terms differing only in case are one term
+    unique = {}
+    for term in terms:
+        if not isinstance(term, str):
+            continue
+        fulltext_query = _to_fulltext_query(term.strip())
+        if fulltext_query:
+            unique.setdefault(fulltext_query, {"text": term.strip(), "query": fulltext_query})
+    rows = list(unique.values())
+    if not rows:
+        return []
+
+    try:
+        results = await _search_bubbles_multi(rows, limit_per_term, memory_type, fields, fulltext=True)
+    except ClientError as e:
+        logger.warning(
+            f"Full-text index '{BUBBLE_FULLTEXT_INDEX}' unavailable, falling back to scan: {e.code}"
+        )
+        results = await _search_bubbles_multi(rows, limit_per_term, memory_type, fields, fulltext=False)
+
+    logger.info(f"Found {len(results)} bubbles for {len(rows)} terms")
+    return results
+
+
+async def _search_bubbles_multi(
+    rows: list[dict],
+    limit_per_term: int,
+    memory_type: Optional[str],
+    fields: Optional[Sequence[str]],
+    fulltext: bool
+) -> list[tuple[BubbleResponse, list[str]]]:
+    """Run the UNWIND multi-term search through the full-text index or a scan."""
+    conn = await get_connection()
+
+    memory_type_clause = "AND b.memory_type = $memory_type" if memory_type else ""
+    if fulltext:
+        match = f"""
+        CALL db.index.fulltext.queryNodes($index_name, term.query)
+        YIELD node AS b, score
+        WHERE b.valid_to IS NULL {memory_type_clause}
+        """
+    else:
+        match = f"""
+        MATCH (b:Bubble)
+        WHERE toLower(b.content) CONTAINS toLower(term.text)
+        AND b.valid_to IS NULL {memory_type_clause}
+        WITH b, 0.0 AS score
+        """
+
+    cypher = f"""
+    UNWIND $terms AS term
+    CALL {{
+        WITH term
+        {match}
+        RETURN b, score
+        ORDER BY score DESC, b.created_at DESC
+        LIMIT $limit_per_term
+    }}
+    WITH b, collect(term.text) AS matched_terms, max(score) AS best_score
+    RETURN {_projection(fields)} as bubble, b.uid as uid, matched_terms
+    ORDER BY size(matched_terms) DESC, best_score DESC, b.created_at DESC
+    """
+
+    params = {
+        "terms": rows,
+        "limit_per_term": limit_per_term,
+        "index_name": BUBBLE_FULLTEXT_INDEX,
+    }
+    if memory_type:
+        params["memory_type"] = memory_type
+
+    records = await conn.read(cypher, **params)
+    return [
+        (node_to_bubble(record["bubble"], record["uid"]), record["matched_terms"])
+        for record in records
+    ]
+
+
+async def vector_search_bubbles(
+    query: str,
+    limit: int = 10,
+    memory_type: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    min_score: float = 0.0
+) -> list[BubbleResponse]:
+    """
+    Search for bubbles semantically similar to the query string.
+
+    Embeds the query with the configured local embedder and looks up the
+    nearest bubble embeddings in the vector index (cosine similarity).
+    Returns nothing when embeddings are disabled or the index is missing,
+    so callers can always combine it with keyword search.
+
+    Args:
+        query: Search text
+        limit: Maximum results
+        memory_type: Optional filter for memory type (instinctive/thinking/dormant)
+        fields: Optional bubble properties to return (see BUBBLE_PROPERTIES)
+        min_score: Minimum similarity score (0-1) for a bubble to count as a match
+
+    Returns:
+        Bubbles ordered by similarity, most similar first
+    """
+    if not query.strip():
+        return []
+    vectors = await embed_texts([query])
+    if not vectors:
+        return []
+
+    conn = await get_connection()
+
+    where_clauses = ["score >= $min_score", "b.valid_to IS NULL"]
+    if memory_type:
+        where_clauses.append("b.memory_type = $memory_type")
+
+    where_clause = " AND ".join(where_clauses)
+
+    # The index returns the nearest neighbours before filtering, so
+    # over-fetch to leave enough after soft-deleted/other-type bubbles
+    cypher = f"""
+    CALL db.index.vector.queryNodes($index_name, $candidates, $embedding)
+    YIELD node AS b, score
+    WHERE {where_clause}
+    RETURN {_projection(fields)} as bubble, b.uid as uid
+    ORDER BY score DESC
+    LIMIT $result_limit
+    """
+
+    params = {
+        "index_name": BUBBLE_VECTOR_INDEX,
+        "candidates": limit * 3,
+        "embedding": vectors[0],
+        "min_score": min_score,
+        "result_limit": limit
+    }
+    if memory_type:
+        params["memory_type"] = memory_type
+
+    try:
+        records = await conn.read(cypher, **params)
+    except ClientError as e:
+        logger.warning(f"Vector index '{BUBBLE_VECTOR_INDEX}' unavailable, skipping semantic search: {e.code}")
+        return []
+
+    bubbles = [node_to_bubble(record["bubble"], record["uid"]) for record in records]
+    logger.info(f"Found {len(bubbles)} semantically similar bubbles for query: {query}")
+    return bubbles
 
 
 async def get_bubble_by_id(bubble_id: str) -> Optional[BubbleResponse]:
-    """Retrieve a single bubble by its internal node ID.
+    """Retrieve a single bubble by its uid (or a legacy numeric/element id).
 
     Phase 3 Enhanced: Returns all fields including memory_type and activation_threshold.
+    Raises ValueError for a malformed ID (see bubble_id_predicate).
     """
-    import re
     conn = await get_connection()
 
-    # Extract numeric ID from various formats
-    match = re.search(r'\d+', str(bubble_id))
-    if not match:
-        return None
-    numeric_id = int(match.group())
+    predicate, bubble_ref = bubble_id_predicate(bubble_id)
 
-    cypher = """
+    cypher = f"""
     MATCH (b:Bubble)
-    WHERE id(b) = $bubble_id
+    WHERE {predicate}
     AND b.valid_to IS NULL
-    RETURN b
+    RETURN {_projection(None)} as bubble, b.uid as uid
     """
 
-    async with conn.session() as session:
-        result = await session.run(cypher, bubble_id=numeric_id)
-        record = await result.single()
-        if record:
-            node = record["b"]
-            return BubbleResponse(
-                id=str(numeric_id),  # Use simple numeric ID
-                content=node["content"],
-                sector=node["sector"],
-                source=node["source"],
-                salience=node["salience"],
-                created_at=datetime.fromisoformat(node["created_at"]),
-                valid_from=datetime.fromisoformat(node["valid_from"]),
-                valid_to=datetime.fromisoformat(node["valid_to"]) if node.get("valid_to") else None,
-                memory_type=node.get("memory_type", "thinking"),
-                activation_threshold=node.get("activation_threshold", 0.65),
-                entities=node.get("entities", []),
-                observations=node.get("observations", []),
-                accessed_count=node.get("access_count", 0),
-                last_accessed=node.get("last_accessed")
-            )
+    records = await conn.read(cypher, bubble_ref=bubble_ref)
+    if records:
+        return node_to_bubble(records[0]["bubble"], records[0]["uid"])
     return None
 
 
-async def get_all_bubbles(limit: int = 100) -> list[BubbleResponse]:
+async def get_all_bubbles(
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None
+) -> list[BubbleResponse]:
     """
     Retrieve all active bubbles from the database.
 
     Phase 3 Enhanced: Returns all fields including memory_type.
     Returns all bubbles ordered by recency (most recent first).
-    Use limit to prevent unbounded result sets.
+    Use limit to prevent unbounded result sets, and fields to fetch only
+    the properties the caller renders.
     """
     conn = await get_connection()
 
-    cypher = """
+    cypher = f"""
     MATCH (b:Bubble)
     WHERE b.valid_to IS NULL
-    RETURN b, id(b) as internal_id
+    RETURN {_projection(fields)} as bubble, b.uid as uid
     ORDER BY b.created_at DESC
     LIMIT $result_limit
     """
 
-    async with conn.session() as session:
-        result = await session.run(cypher, result_limit=limit)
-        bubbles = []
-        async for record in result:
-            node = record["b"]
-            internal_id = record["internal_id"]
-            bubbles.append(BubbleResponse(
-                id=str(internal_id),  # Use simple numeric ID
-                content=node["content"],
-                sector=node["sector"],
-                source=node["source"],
-                salience=node["salience"],
-                created_at=datetime.fromisoformat(node["created_at"]),
-                valid_from=datetime.fromisoformat(node["valid_from"]),
-                valid_to=datetime.fromisoformat(node["valid_to"]) if node.get("valid_to") else None,
-                memory_type=node.get("memory_type", "thinking"),
-                activation_threshold=node.get("activation_threshold", 0.65),
-                entities=node.get("entities", []),
-                observations=node.get("observations", []),
-                accessed_count=node.get("access_count", 0),
-                last_accessed=node.get("last_accessed")
-            ))
-        logger.info(f"Retrieved {len(bubbles)} total bubbles")
-        return bubbles
+    records = await conn.read(cypher, result_limit=limit)
+    bubbles = [node_to_bubble(record["bubble"], record["uid"]) for record in records]
+    logger.info(f"Retrieved {len(bubbles)} total bubbles")
+    return bubbles
+
+
+def encode_cursor(position, uid: str) -> str:
+    """
+    Encode a page position as an opaque cursor.
+
+    Args:
+        position: Sort key of the last bubble on the page: its created_at
+            (recency pages) or its full-text score (search pages)
+        uid: uid of the last bubble on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(position, datetime):
+        payload = {"t": position.isoformat(), "u": uid}
+    else:
+        payload = {"s": float(position), "u": uid}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        (position, uid), where position is a datetime for recency pages
+        and a float score for search pages
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if "t" in payload:
+            return datetime.fromisoformat(payload["t"]), str(payload["u"])
+        return float(payload["s"]), str(payload["u"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+async def _read_bubble_page(
+    match_clause: str,
+    where_clauses: list[str],
+    params: dict,
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[Sequence[str]]
+) -> BubblePage:
+    """
+    Read one page of bubbles, newest first, keyed on (created_at, uid).
+
+    The cursor turns into a range predicate on created_at, so every page is
+    an index seek plus limit + 1 rows no matter how deep it is, unlike
+    SKIP/LIMIT. The extra row only tells whether another page exists.
+    """
+    conn = await get_connection()
+
+    where_clauses = list(where_clauses)
+    params = dict(params)
+    if cursor:
+        cursor_created_at, cursor_uid = decode_cursor(cursor)
+        if not isinstance(cursor_created_at, datetime):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        where_clauses.append(
+            # The <= bound alone is sargable, so the planner can seek the
+            # created_at index; the OR breaks ties on uid within that range
+            "b.created_at <= $cursor_created_at"
+            " AND (b.created_at < $cursor_created_at OR b.uid < $cursor_uid)"
+        )
+        params["cursor_created_at"] = cursor_created_at
+        params["cursor_uid"] = cursor_uid
+
+    cypher = f"""
+    {match_clause}
+    WHERE {" AND ".join(where_clauses)}
+    RETURN {_projection(fields)} as bubble, b.uid as uid, b.created_at as created_at
+    ORDER BY b.created_at DESC, b.uid DESC
+    LIMIT $page_limit
+    """
+
+    records = await conn.read(cypher, **params, page_limit=limit + 1)
+    bubbles = [node_to_bubble(record["bubble"], record["uid"]) for record in records[:limit]]
+
+    next_cursor = None
+    if len(records) > limit:
+        last = records[limit - 1]
+        next_cursor = encode_cursor(_parse_datetime(last["created_at"]), last["uid"])
+    return BubblePage(bubbles=bubbles, next_cursor=next_cursor)
+
+
+async def _read_search_page(
+    fulltext_query: str,
+    where_clauses: list[str],
+    params: dict,
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[Sequence[str]]
+) -> BubblePage:
+    """
+    Read one page of full-text matches, best first, keyed on (score, uid).
+
+    db.index.fulltext.queryNodes yields every hit, so each page filters and
+    sorts all matches: the cost grows with the number of matches, not with
+    the page depth. The cursor predicate is applied before the sort, so
+    only matches after the cursor are ordered for the page.
+    """
+    conn = await get_connection()
+
+    where_clauses = list(where_clauses)
+    params = dict(params)
+    if cursor:
+        cursor_score, cursor_uid = decode_cursor(cursor)
+        if not isinstance(cursor_score, float):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        where_clauses.append(
+            "(score < $cursor_score OR (score = $cursor_score AND b.uid < $cursor_uid))"
+        )
+        params["cursor_score"] = cursor_score
+        params["cursor_uid"] = cursor_uid
+
+    cypher = f"""
+    CALL db.index.fulltext.queryNodes($index_name, $search_query)
+    YIELD node AS b, score
+    WHERE {" AND ".join(where_clauses)}
+    RETURN {_projection(fields)} as bubble, b.uid as uid, score
+    ORDER BY score DESC, b.uid DESC
+    LIMIT $page_limit
+    """
+
+    records = await conn.read(
+        cypher,
+        **params,
+        index_name=BUBBLE_FULLTEXT_INDEX,
+        search_query=fulltext_query,
+        page_limit=limit + 1
+    )
+    bubbles = [node_to_bubble(record["bubble"], record["uid"]) for record in records[:limit]]
+
+    next_cursor = None
+    if len(records) > limit:
+        last = records[limit - 1]
+        next_cursor = encode_cursor(float(last["score"]), last["uid"])
+    return BubblePage(bubbles=bubbles, next_cursor=next_cursor)
+
+
+async def get_bubbles_page(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None
+) -> BubblePage:
+    """
+    Retrieve one page of active bubbles, most recent first.
+
+    Args:
+        limit: Bubbles per page
+        cursor: next_cursor from the previous page, or None for the first page
+        fields: Optional bubble properties to return (see BUBBLE_PROPERTIES)
+
+    Returns:
+        BubblePage with the bubbles and the cursor for the next page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    page = await _read_bubble_page(
+        "MATCH (b:Bubble)", ["b.valid_to IS NULL"], {}, limit, cursor, fields
+    )
+    logger.info(f"Retrieved page of {len(page.bubbles)} bubbles")
+    return page
+
+
+async def search_bubbles_page(
+    query: str,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    memory_type: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None
+) -> BubblePage:
+    """
+    Search for bubbles matching the query, one page at a time.
+
+    Matches and ranks like search_bubbles: full-text pages are ordered by
+    BM25 score, and each page costs a pass over all matches (see
+    _read_search_page). Scores shift when matching bubbles are written, so
+    walking pages while the graph changes can skip or repeat a match. The
+    CONTAINS scan fallback pages by recency over the created_at index.
+
+    Args:
+        query: Search term
+        limit: Bubbles per page
+        cursor: next_cursor from the previous page, or None for the first page
+        memory_type: Optional filter for memory type (instinctive/thinking/dormant)
+        fields: Optional bubble properties to return (see BUBBLE_PROPERTIES)
+
+    Returns:
+        BubblePage with the matches and the cursor for the next page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    where_clauses = ["b.valid_to IS NULL"]
+    params = {}
+    if memory_type:
+        where_clauses.append("b.memory_type = $memory_type")
+        params["memory_type"] = memory_type
+
+    fulltext_query = _to_fulltext_query(query)
+    if fulltext_query:
+        try:
+            page = await _read_search_page(
+                fulltext_query, where_clauses, params, limit, cursor, fields
+            )
+            logger.info(f"Found page of {len(page.bubbles)} bubbles for query: {query}")
+            return page
+        except ClientError as e:
+            logger.warning(
+                f"Full-text index '{BUBBLE_FULLTEXT_INDEX}' unavailable, falling back to scan: {e.code}"
+            )
+
+    page = await _read_bubble_page(
+        "MATCH (b:Bubble)",
+        where_clauses + ["toLower(b.content) CONTAINS toLower($search_query)"],
+        {**params, "search_query": query},
+        limit,
+        cursor,
+        fields
+    )
+    logger.info(f"Found page of {len(page.bubbles)} bubbles for query: {query}")
+    return page
 
 
 async def search_instinctive_bubbles(concepts: list[str], salience_threshold: float = 0.5, limit: int = 10) -> list[BubbleResponse]:
@@ -284,7 +965,7 @@ async def search_instinctive_bubbles(concepts: list[str], salience_threshold: fl
     AND b.activation_threshold < $salience_threshold
     AND b.valid_to IS NULL
     AND ({concept_conditions})
-    RETURN b, id(b) as internal_id
+    RETURN {_projection(None)} as bubble, b.uid as uid
     ORDER BY b.salience DESC
     LIMIT $result_limit
     """
@@ -293,72 +974,47 @@ async def search_instinctive_bubbles(concepts: list[str], salience_threshold: fl
     for i, concept in enumerate(concepts):
         params[f"concept{i}"] = concept
 
-    async with conn.session() as session:
-        result = await session.run(cypher, **params)
-        bubbles = []
-        async for record in result:
-            node = record["b"]
-            internal_id = record["internal_id"]
-            bubbles.append(BubbleResponse(
-                id=str(internal_id),  # Use simple numeric ID
-                content=node["content"],
-                sector=node["sector"],
-                source=node["source"],
-                salience=node["salience"],
-                created_at=datetime.fromisoformat(node["created_at"]),
-                valid_from=datetime.fromisoformat(node["valid_from"]),
-                valid_to=None,
-                memory_type=node.get("memory_type", "instinctive"),
-                activation_threshold=node.get("activation_threshold", 0.25),
-                entities=node.get("entities", []),
-                observations=node.get("observations", []),
-                accessed_count=node.get("access_count", 0),
-                last_accessed=node.get("last_accessed")
-            ))
-        logger.info(f"Found {len(bubbles)} instinctive bubbles for concepts: {concepts}")
-        return bubbles
+    records = await conn.read(cypher, **params)
+    bubbles = [node_to_bubble(record["bubble"], record["uid"]) for record in records]
+    logger.info(f"Found {len(bubbles)} instinctive bubbles for concepts: {concepts}")
+    return bubbles
 
 
 async def delete_bubble(bubble_id: str) -> bool:
     """
-    Delete a single bubble by its internal node ID.
+    Delete a single bubble by its uid (or a legacy numeric/element id).
 
     Uses soft deletion by setting valid_to timestamp.
     This preserves audit trail and maintains temporal evolution tracking.
 
     Args:
-        bubble_id: The numeric node ID (element_id) of the bubble
+        bubble_id: The bubble's uid
 
     Returns:
         True if deleted, False if not found
+
+    Raises:
+        ValueError: If bubble_id is malformed (see bubble_id_predicate)
     """
     conn = await get_connection()
     now = datetime.now(timezone.utc)
 
-    # Extract numeric ID from various formats (e.g., "4:uuid:0", "5", etc.)
-    import re
-    match = re.search(r'\d+', str(bubble_id))
-    if not match:
-        logger.warning(f"Invalid bubble ID format: {bubble_id}")
-        return False
-    numeric_id = int(match.group())
+    predicate, bubble_ref = bubble_id_predicate(bubble_id)
 
-    cypher = """
+    cypher = f"""
     MATCH (b:Bubble)
-    WHERE id(b) = $bubble_id
+    WHERE {predicate}
     AND b.valid_to IS NULL
     SET b.valid_to = $now
     RETURN b.content as content
     """
 
-    async with conn.session() as session:
-        result = await session.run(cypher, bubble_id=numeric_id, now=now.isoformat())
-        record = await result.single()
-        if record:
-            logger.info(f"Deleted bubble {bubble_id}: {record['content'][:50]}...")
-            return True
-        logger.warning(f"Bubble {bubble_id} (numeric: {numeric_id}) not found for deletion")
-        return False
+    records = await conn.write(cypher, bubble_ref=bubble_ref, now=now)
+    if records:
+        logger.info(f"Deleted bubble {bubble_id}: {records[0]['content'][:50]}...")
+        return True
+    logger.warning(f"Bubble {bubble_id} not found for deletion")
+    return False
 
 
 async def delete_all_bubbles() -> int:
@@ -381,11 +1037,9 @@ async def delete_all_bubbles() -> int:
     RETURN count(b) as deleted_count
     """
 
-    async with conn.session() as session:
-        result = await session.run(cypher, now=now.isoformat())
-        record = await result.single()
-        count = record["deleted_count"] if record else 0
-        logger.info(f"Deleted all {count} bubbles")
+    records = await conn.write(cypher, now=now)
+    count = records[0]["deleted_count"] if records else 0
+    logger.info(f"Deleted all {count} bubbles")
 
     return count
 
@@ -420,12 +1074,175 @@ async def get_bubble_count(sector: Optional[str] = None) -> int:
         """
         params = {}
 
+    records = await conn.read(cypher, **params)
+    count = records[0]["bubble_count"] if records else 0
+    logger.debug(f"Counted {count} bubbles" + (f" in sector {sector}" if sector else ""))
+    return count
+
+
+SALIENCE_BINS = ("0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0")
+
+
+async def get_memory_stats(activity_days: int = 7) -> MemoryStats:
+    """
+    Aggregate statistics over all active bubbles in one query.
+
+    Groups the whole graph by (sector, salience bin, activity day) inside
+    Neo4j, so only a few hundred aggregate rows cross the wire no matter how
+    many bubbles exist. Sector counts, per-sector average salience, the
+    salience histogram and daily activity are folded from those rows.
+
+    Args:
+        activity_days: Size of the recent activity window in days
+
+    Returns:
+        MemoryStats covering every active bubble
+    """
+    conn = await get_connection()
+    since = datetime.now(timezone.utc) - timedelta(days=activity_days)
+
+    cypher = """
+    MATCH (b:Bubble)
+    WHERE b.valid_to IS NULL
+    RETURN b.sector as sector,
+           CASE
+               WHEN b.salience < 0.2 THEN 0
+               WHEN b.salience < 0.4 THEN 1
+               WHEN b.salience < 0.6 THEN 2
+               WHEN b.salience < 0.8 THEN 3
+               ELSE 4
+           END as salience_bin,
+           CASE
+               WHEN b.created_at >= $since THEN toString(date(b.created_at))
+           END as day,
+           count(b) as bubble_count,
+           sum(b.salience) as salience_sum
+    """
+
+    total = 0
+    salience_total = 0.0
+    sector_counts: dict[str, int] = {}
+    sector_salience: dict[str, float] = {}
+    salience_bins = {label: 0 for label in SALIENCE_BINS}
+    daily_counts: dict[str, int] = {}
+
+    for record in await conn.read(cypher, since=since):
+        count = record["bubble_count"]
+        salience_sum = record["salience_sum"] or 0.0
+        sector = record["sector"]
+
+        total += count
+        salience_total += salience_sum
+        sector_counts[sector] = sector_counts.get(sector, 0) + count
+        sector_salience[sector] = sector_salience.get(sector, 0.0) + salience_sum
+        salience_bins[SALIENCE_BINS[record["salience_bin"]]] += count
+        if record["day"]:
+            daily_counts[record["day"]] = daily_counts.get(record["day"], 0) + count
+
+    logger.debug(f"Computed memory stats over {total} bubbles")
+
+    return MemoryStats(
+        total=total,
+        avg_salience=salience_total / total if total else 0.0,
+        sectors={
+            sector: SectorStats(count=count, avg_salience=sector_salience[sector] / count)
+            for sector, count in sector_counts.items()
+        },
+        salience_bins=salience_bins,
+        daily_counts=daily_counts,
+    )
+
+
+# Salience multiplier applied per decay cycle, by memory type
+DECAY_RATES = {
+    "instinctive": 0.95,
+    "thinking": 0.90,
+    "dormant": 0.80,
+}
+
+# Rows per transaction for server-side batched maintenance writes
+MAINTENANCE_BATCH_SIZE = 10000
+
+
+async def decay_stale_bubbles(
+    stale_days: int = 30,
+    min_salience: float = 0.1,
+    batch_size: int = MAINTENANCE_BATCH_SIZE
+) -> dict:
+    """
+    Decay the salience of bubbles not accessed in stale_days.
+
+    Runs entirely server-side with CALL { ... } IN TRANSACTIONS, so no
+    bubbles are pulled into the process and each batch commits on its own.
+    Staleness is keyed on last_accessed, which starts at created_at (schema
+    migration 10 backfilled older bubbles), so candidates come from one
+    range seek on bubble_last_accessed and a never-accessed bubble goes
+    stale stale_days after it was created. Each memory type decays at its own
+    rate (DECAY_RATES), salience never drops below min_salience, and
+    instinctive bubbles never drop below their activation_threshold, so
+    they keep surfacing.
+
+    Args:
+        stale_days: Days without access before a bubble decays
+        min_salience: Lowest salience decay can reach
+        batch_size: Rows per transaction
+
+    Returns:
+        Dict with decayed (total), by_memory_type, duration_seconds and
+        rows_per_second
+    """
+    conn = await get_connection()
+    now = datetime.now(timezone.utc)
+
+    cypher = """
+    MATCH (b:Bubble)
+    WHERE b.last_accessed < $cutoff
+    WITH b,
+         coalesce($decay_rates[b.memory_type], $default_rate) AS rate,
+         CASE
+             WHEN b.memory_type = 'instinctive' AND b.activation_threshold > $min_salience
+             THEN b.activation_threshold
+             ELSE $min_salience
+         END AS lower_bound
+    WHERE b.valid_to IS NULL
+    AND b.salience > lower_bound
+    CALL {
+        WITH b, rate, lower_bound
+        SET b.salience = CASE
+                WHEN b.salience * rate < lower_bound THEN lower_bound
+                ELSE b.salience * rate
+            END,
+            b.last_decayed = $now
+    } IN TRANSACTIONS OF $batch_size ROWS
+    RETURN b.memory_type AS memory_type, count(*) AS decayed
+    """
+
+    start = time.perf_counter()
+    by_memory_type: dict[str, int] = {}
+    # CALL { ... } IN TRANSACTIONS needs an auto-commit transaction
     async with conn.session() as session:
-        result = await session.run(cypher, **params)
-        record = await result.single()
-        count = record["bubble_count"] if record else 0
-        logger.debug(f"Counted {count} bubbles" + (f" in sector {sector}" if sector else ""))
-        return count
+        result = await session.run(
+            cypher,
+            cutoff=now - timedelta(days=stale_days),
+            decay_rates=DECAY_RATES,
+            default_rate=DECAY_RATES["thinking"],
+            min_salience=min_salience,
+            batch_size=batch_size,
+            now=now
+        )
+        async for record in result:
+            memory_type = record["memory_type"] or "thinking"
+            by_memory_type[memory_type] = by_memory_type.get(memory_type, 0) + record["decayed"]
+    duration = time.perf_counter() - start
+
+    decayed = sum(by_memory_type.values())
+    logger.info(f"Decayed {decayed} stale bubbles in {duration:.2f}s")
+    return {
+        "decayed": decayed,
+        "by_memory_type": by_memory_type,
+        "duration_seconds": round(duration, 3),
+        "rows_per_second": round(decayed / duration, 1) if duration > 0 else 0.0,
+    }
 
 
 async def update_bubble_observations(
@@ -436,78 +1253,56 @@ async def update_bubble_observations(
     """
     Update observations on an existing bubble.
 
+    Runs as a single atomic statement: the bubble is locked, then the new
+    list is merged (append) or written (replace) server-side.
+
     Args:
-        bubble_id: The numeric node ID (element_id) of the bubble
+        bubble_id: The bubble's uid
         observations: Updated observations list
         append: If True, append to existing observations; if False, replace
 
     Returns:
         Updated BubbleResponse or None if not found
+
+    Raises:
+        ValueError: If bubble_id is malformed (see bubble_id_predicate)
     """
-    import re
     conn = await get_connection()
     now = datetime.now(timezone.utc)
 
-    # Extract numeric ID from various formats (e.g., "4:uuid:0", "5", etc.)
-    match = re.search(r'\d+', str(bubble_id))
-    if not match:
-        logger.warning(f"Invalid bubble ID format: {bubble_id}")
-        return None
-    numeric_id = int(match.group())
-
-    # Get existing bubble to check if it exists
-    existing = await get_bubble_by_id(bubble_id)
-    if not existing:
-        logger.warning(f"Bubble {bubble_id} (numeric: {numeric_id}) not found")
-        return None
-
-    # Merge or replace observations
-    if append:
-        # Append: merge new observations, avoiding duplicates
-        merged = existing.observations + [o for o in observations if o not in existing.observations]
-        final_observations = merged
-    else:
-        # Replace: use new observations directly
-        final_observations = observations
+    predicate, bubble_ref = bubble_id_predicate(bubble_id)
 
-    # Update via Cypher
-    cypher = """
+    # Observations are set after b is write-locked (by the preceding SET), so
+    # append mode reads the committed list and concurrent appends are not lost.
+    # Append keeps existing order and skips observations already present.
+    cypher = f"""
     MATCH (b:Bubble)
-    WHERE id(b) = $bubble_id
+    WHERE {predicate}
     AND b.valid_to IS NULL
-    SET b.observations = $observations,
-        b.last_accessed = $now
-    RETURN b, id(b) as internal_id
+    SET b.last_accessed = $now
+    SET b.observations = CASE
+        WHEN $append THEN reduce(
+            merged = coalesce(b.observations, []),
+            o IN $observations
+            | CASE WHEN o IN merged THEN merged ELSE merged + o END
+        )
+        ELSE $observations
+    END
+    RETURN {_projection(None)} as bubble, b.uid as uid
     """
 
-    async with conn.session() as session:
-        result = await session.run(
-            cypher,
-            bubble_id=numeric_id,
-            observations=final_observations,
-            now=now.isoformat()
-        )
-        record = await result.single()
-
-        if record:
-            node = record["b"]
-            logger.info(f"Updated observations for bubble {bubble_id}: {len(final_observations)} observations")
-            return BubbleResponse(
-                id=str(numeric_id),
-                content=node["content"],
-                sector=node["sector"],
-                source=node["source"],
-                salience=node["salience"],
-                created_at=datetime.fromisoformat(node["created_at"]),
-                valid_from=datetime.fromisoformat(node["valid_from"]),
-                valid_to=None,
-                memory_type=node.get("memory_type", "thinking"),
-                activation_threshold=node.get("activation_threshold", 0.65),
-                entities=node.get("entities", []),
-                observations=final_observations,
-                accessed_count=node.get("access_count", 0),
-                last_accessed=now
-            )
+    records = await conn.write(
+        cypher,
+        bubble_ref=bubble_ref,
+        observations=observations,
+        append=append,
+        now=now
+    )
+
+    if records:
+        bubble = node_to_bubble(records[0]["bubble"], records[0]["uid"])
+        logger.info(f"Updated observations for bubble {bubble_id}: {len(bubble.observations)} observations")
+        return bubble
 
-    logger.warning(f"Failed to update observations for bubble {bubble_id}")
+    logger.warning(f"Bubble {bubble_id} not found")
     return None
@@ -0,0 +1,256 @@
+"""
+Cypher query functions for background task bookkeeping.
+Persists scheduler state on :TaskRun nodes so restarts resume the schedule,
+and coordinates replicas through :TaskLease nodes so each task runs once.
+Incremental tasks also keep a watermark on their :TaskRun node.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.database.connection import get_connection
+
+logger = logging.getLogger(__name__)
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    """Convert a driver DateTime to a Python datetime."""
+    return value.to_native() if value is not None else None
+
+
+async def get_task_runs() -> dict[str, dict]:
+    """
+    Load the persisted state of every background task.
+
+    Returns:
+        Map of task name to a dict with last_run, next_run (datetimes or None),
+        duration_seconds, status and error
+    """
+    conn = await get_connection()
+
+    cypher = """
+    MATCH (t:TaskRun)
+    RETURN t.name as name,
+           t.last_run as last_run,
+           t.next_run as next_run,
+           t.duration_seconds as duration_seconds,
+           t.status as status,
+           t.error as error
+    """
+
+    runs = {}
+    for record in await conn.read(cypher):
+        runs[record["name"]] = {
+            "last_run": _to_datetime(record["last_run"]),
+            "next_run": _to_datetime(record["next_run"]),
+            "duration_seconds": record["duration_seconds"],
+            "status": record["status"],
+            "error": record["error"],
+        }
+    logger.debug(f"Loaded {len(runs)} persisted task runs")
+    return runs
+
+
+async def save_task_run(
+    name: str,
+    last_run: datetime,
+    next_run: datetime,
+    duration_seconds: float,
+    status: str,
+    error: Optional[str] = None,
+    fencing_token: Optional[int] = None
+) -> bool:
+    """
+    Record the outcome of a background task run.
+
+    Args:
+        name: Task name (TASK_REGISTRY key)
+        last_run: When the run started
+        next_run: When the task is next due
+        duration_seconds: Run duration
+        status: "completed" or "failed"
+        error: Error message for failed runs
+        fencing_token: Lease token the run held; the write is dropped if the
+            lease has since been granted to another replica
+
+    Returns:
+        False if the write was fenced off
+    """
+    conn = await get_connection()
+
+    fence = ""
+    if fencing_token is not None:
+        fence = """
+    MATCH (l:TaskLease {name: $name})
+    WHERE l.token = $fencing_token
+    WITH l LIMIT 1
+    """
+
+    cypher = fence + """
+    MERGE (t:TaskRun {name: $name})
+    SET t.last_run = $last_run,
+        t.next_run = $next_run,
+        t.duration_seconds = $duration_seconds,
+        t.status = $status,
+        t.error = $error
+    RETURN t.name as name
+    """
+
+    records = await conn.write(
+        cypher,
+        name=name,
+        last_run=last_run,
+        next_run=next_run,
+        duration_seconds=duration_seconds,
+        status=status,
+        error=error,
+        fencing_token=fencing_token
+    )
+    return bool(records)
+
+
+async def acquire_task_lease(
+    name: str,
+    owner: str,
+    now: datetime,
+    lease_seconds: float
+) -> tuple[Optional[int], Optional[datetime]]:
+    """
+    Try to take the lease that lets one replica run a task.
+
+    The lease is granted if it is free (no owner, or expired) and the task
+    is due (next_due unset or reached). The SET before the check write-locks
+    the lease node, so concurrent replicas serialize and only one wins.
+    Each grant increments the fencing token; writes made on behalf of the
+    run pass it back so a replica whose lease expired cannot clobber state.
+
+    Args:
+        name: Task name
+        owner: Unique identifier of the calling replica
+        now: Current time
+        lease_seconds: Lease duration
+
+    Returns:
+        (fencing token, None) if granted, or (None, next_due) if not; next_due
+        is when the task is next due according to other replicas, if known
+    """
+    conn = await get_connection()
+
+    cypher = """
+    MERGE (l:TaskLease {name: $name})
+    ON CREATE SET l.token = 0
+    SET l.checked_at = $now
+    WITH l,
+         (l.owner IS NULL OR l.expires_at < $now)
+         AND (l.next_due IS NULL OR l.next_due <= $now) AS granted
+    FOREACH (_ IN CASE WHEN granted THEN [1] ELSE [] END |
+        SET l.owner = $owner,
+            l.expires_at = $expires_at,
+            l.token = l.token + 1
+    )
+    RETURN granted, l.token as token, l.next_due as next_due
+    """
+
+    records = await conn.write(
+        cypher,
+        name=name,
+        owner=owner,
+        now=now,
+        expires_at=now + timedelta(seconds=lease_seconds)
+    )
+    record = records[0]
+    if record["granted"]:
+        logger.debug(f"Lease on {name} granted to {owner} (token {record['token']})")
+        return record["token"], None
+    return None, _to_datetime(record["next_due"])
+
+
+async def renew_task_lease(
+    name: str,
+    token: int,
+    now: datetime,
+    lease_seconds: float
+) -> bool:
+    """
+    Extend a held lease while its task is still running.
+
+    Returns:
+        False if the lease was lost (its token changed)
+    """
+    conn = await get_connection()
+
+    cypher = """
+    MATCH (l:TaskLease {name: $name})
+    WHERE l.token = $token
+    SET l.expires_at = $expires_at
+    RETURN l.token as token
+    """
+
+    records = await conn.write(
+        cypher,
+        name=name,
+        token=token,
+        expires_at=now + timedelta(seconds=lease_seconds)
+    )
+    return bool(records)
+
+
+async def release_task_lease(name: str, token: int, next_due: datetime) -> bool:
+    """
+    Release a lease and record when the task is next due.
+
+    Returns:
+        False if the lease was no longer held under this token
+    """
+    conn = await get_connection()
+
+    cypher = """
+    MATCH (l:TaskLease {name: $name})
+    WHERE l.token = $token
+    SET l.owner = NULL,
+        l.expires_at = NULL,
+        l.next_due = $next_due
+    RETURN l.token as token
+    """
+
+    records = await conn.write(cypher, name=name, token=token, next_due=next_due)
+    return bool(records)
+
+
+async def get_task_watermark(name: str) -> Optional[datetime]:
+    """
+    Load the watermark an incremental task has processed data up to.
+
+    Returns:
+        The watermark, or None if the task has never completed a pass
+    """
+    conn = await get_connection()
+
+    cypher = """
+    MATCH (t:TaskRun {name: $name})
+    RETURN t.watermark as watermark
+    """
+
+    records = await conn.read(cypher, name=name)
+    return _to_datetime(records[0]["watermark"]) if records else None
+
+
+async def set_task_watermark(name: str, watermark: datetime) -> None:
+    """
+    Advance an incremental task's watermark.
+
+    The watermark only moves forward, so a late or overlapping run cannot
+    rewind it.
+    """
+    conn = await get_connection()
+
+    cypher = """
+    MERGE (t:TaskRun {name: $name})
+    SET t.watermark = CASE
+        WHEN t.watermark IS NULL OR t.watermark < $watermark THEN $watermark
+        ELSE t.watermark
+    END
+    """
+
+    await conn.write(cypher, name=name, watermark=watermark)
@@ -0,0 +1,434 @@
+"""
+Neo4j schema migrations for Brain OS.
+Creates the constraints and indexes the query layer relies on.
+
+Migrations are applied in order and the latest applied version is recorded
+on a single :SchemaVersion node. Every statement uses IF NOT EXISTS, so
+re-running a migration (e.g. two replicas starting at once) is safe.
+
+Requires Neo4j 5.11 or later: migration 5 uses the `IS :: STRING` type
+predicate (5.9+) and migration 9 creates a vector index (5.11+).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Full-text index backing keyword search over bubbles
+BUBBLE_FULLTEXT_INDEX = "bubble_fulltext"
+
+# Vector index backing semantic search over bubble embeddings
+BUBBLE_VECTOR_INDEX = "bubble_embedding"
+
+# Identifier of the node that stores the applied schema version
+SCHEMA_VERSION_ID = "brainos"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single, idempotent schema migration."""
+
+    version: int
+    """Monotonically increasing schema version"""
+
+    description: str
+    """Human-readable summary, stored on the :SchemaVersion node"""
+
+    statements: tuple = field(default_factory=tuple)
+    """Cypher statements to run, in order"""
+
+    backfill: Optional[Callable[..., Awaitable[None]]] = None
+    """Optional data migration, called with the session after the statements"""
+
+
+# Batch size for data backfills
+BACKFILL_BATCH_SIZE = 1000
+
+# Bubble properties holding timestamps
+BUBBLE_TEMPORAL_PROPERTIES = ("created_at", "valid_from", "valid_to", "last_accessed", "accessed_at")
+
+
+def _convert_to_datetime(prop: str) -> str:
+    """Cypher that converts ISO-string values of a bubble property to DATETIME."""
+    return f"""
+    MATCH (b:Bubble)
+    WHERE b.{prop} IS :: STRING
+    CALL {{
+        WITH b
+        SET b.{prop} = datetime(b.{prop})
+    }} IN TRANSACTIONS OF {BACKFILL_BATCH_SIZE} ROWS
+    """
+
+
+async def backfill_content_hash(session) -> None:
+    """
+    Set content_hash on every bubble that predates hash-based identity.
+
+    When several existing bubbles normalize to the same hash, one keeps it:
+    active bubbles take precedence over soft-deleted ones, then the oldest
+    by created_at (internal id breaks ties). The others are soft-deleted
+    (valid_to set, if not already) and tagged with duplicate_of_hash, which
+    collapses whitespace/case-only duplicates without losing the audit
+    trail. Every visited bubble gets one of the two properties, so each
+    batch simply takes the next unvisited ones.
+    """
+    from src.database.queries.memory import compute_content_hash
+
+    now = datetime.now(timezone.utc)
+
+    result = await session.run(
+        "MATCH (b:Bubble) WHERE b.content_hash IS NOT NULL RETURN b.content_hash as content_hash"
+    )
+    seen = {record["content_hash"] async for record in result}
+
+    hashed = 0
+    duplicates = 0
+    while True:
+        result = await session.run(
+            """
+            MATCH (b:Bubble)
+            WHERE b.content_hash IS NULL
+            AND b.duplicate_of_hash IS NULL
+            RETURN id(b) as internal_id, b.content as content
+            ORDER BY b.valid_to IS NOT NULL, b.created_at, internal_id
+            LIMIT $batch_size
+            """,
+            batch_size=BACKFILL_BATCH_SIZE
+        )
+        records = [record async for record in result]
+        if not records:
+            break
+
+        unique_rows = []
+        duplicate_rows = []
+        for record in records:
+            content_hash = compute_content_hash(record["content"] or "")
+            row = {"id": record["internal_id"], "content_hash": content_hash}
+            if content_hash in seen:
+                duplicate_rows.append(row)
+            else:
+                seen.add(content_hash)
+                unique_rows.append(row)
+
+        result = await session.run(
+            """
+            UNWIND $rows AS row
+            MATCH (b:Bubble) WHERE id(b) = row.id
+            SET b.content_hash = row.content_hash
+            """,
+            rows=unique_rows
+        )
+        await result.consume()
+
+        result = await session.run(
+            """
+            UNWIND $rows AS row
+            MATCH (b:Bubble) WHERE id(b) = row.id
+            SET b.duplicate_of_hash = row.content_hash,
+                b.valid_to = coalesce(b.valid_to, $now)
+            """,
+            rows=duplicate_rows,
+            now=now
+        )
+        await result.consume()
+
+        hashed += len(unique_rows)
+        duplicates += len(duplicate_rows)
+
+    logger.info(f"Content hash backfill: {hashed} bubbles hashed, {duplicates} duplicates collapsed")
+
+
+async def backfill_embeddings(session) -> None:
+    """
+    Embed every bubble stored before embeddings existed.
+
+    Bubbles are visited in uid order, BACKFILL_BATCH_SIZE at a time. Does
+    nothing when embeddings are disabled.
+    """
+    from src.utils.embeddings import embed_texts, load_embedder
+
+    if await load_embedder() is None:
+        logger.info("Embeddings disabled, skipping embedding backfill")
+        return
+
+    last_uid = ""
+    embedded = 0
+    while True:
+        result = await session.run(
+            """
+            MATCH (b:Bubble)
+            WHERE b.uid > $last_uid
+            AND b.embedding IS NULL
+            RETURN b.uid as uid, b.content as content
+            ORDER BY uid
+            LIMIT $batch_size
+            """,
+            last_uid=last_uid,
+            batch_size=BACKFILL_BATCH_SIZE
+        )
+        records = [record async for record in result]
+        if not records:
+            break
+
+        vectors = await embed_texts([record["content"] or "" for record in records])
+        if vectors is None:
+            logger.warning("Embedding backfill stopped: embedder failed")
+            break
+
+        result = await session.run(
+            """
+            UNWIND $rows AS row
+            MATCH (b:Bubble {uid: row.uid})
+            SET b.embedding = row.embedding
+            """,
+            rows=[
+                {"uid": record["uid"], "embedding": vector}
+                for record, vector in zip(records, vectors)
+            ]
+        )
+        await result.consume()
+
+        embedded += len(records)
+        last_uid = records[-1]["uid"]
+
+    logger.info(f"Embedding backfill: {embedded} bubbles embedded")
+
+
+def _create_vector_index() -> str:
+    """Cypher that creates the bubble vector index for the configured embedder."""
+    from src.utils.embeddings import EmbeddingConfig
+
+    dimensions = EmbeddingConfig.from_env().dimensions
+    return f"""
+    CREATE VECTOR INDEX {BUBBLE_VECTOR_INDEX} IF NOT EXISTS
+    FOR (b:Bubble) ON (b.embedding)
+    OPTIONS {{indexConfig: {{
+        `vector.dimensions`: {dimensions},
+        `vector.similarity_function`: 'cosine'
+    }}}}
+    """
+
+
+MIGRATIONS = [
+    Migration(
+        version=1,
+        description="Full-text index for keyword search",
+        statements=(
+            f"""
+            CREATE FULLTEXT INDEX {BUBBLE_FULLTEXT_INDEX} IF NOT EXISTS
+            FOR (b:Bubble) ON EACH [b.content, b.entities, b.observations, b.sector]
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Range indexes for bubble filters",
+        statements=(
+            # Range indexes do not store nulls, so this serves soft-deleted
+            # lookups (valid_to IS NOT NULL / ranges) rather than IS NULL
+            """
+            CREATE INDEX bubble_valid_to IF NOT EXISTS
+            FOR (b:Bubble) ON (b.valid_to)
+            """,
+            """
+            CREATE INDEX bubble_memory_type IF NOT EXISTS
+            FOR (b:Bubble) ON (b.memory_type)
+            """,
+            """
+            CREATE INDEX bubble_sector IF NOT EXISTS
+            FOR (b:Bubble) ON (b.sector)
+            """,
+            """
+            CREATE INDEX bubble_created_at IF NOT EXISTS
+            FOR (b:Bubble) ON (b.created_at)
+            """,
+        ),
+    ),
+    Migration(
+        version=3,
+        description="Backfill normalized content hashes for bubble identity",
+        statements=(
+            # Databases migrated by an earlier version 2 have a uniqueness
+            # constraint on raw content; identity moves to content_hash
+            "DROP CONSTRAINT bubble_content_unique IF EXISTS",
+        ),
+        backfill=backfill_content_hash,
+    ),
+    Migration(
+        version=4,
+        description="Uniqueness constraint on bubble content hash",
+        statements=(
+            """
+            CREATE CONSTRAINT bubble_content_hash_unique IF NOT EXISTS
+            FOR (b:Bubble) REQUIRE b.content_hash IS UNIQUE
+            """,
+        ),
+    ),
+    Migration(
+        version=5,
+        description="Native DATETIME timestamps with range index on last_accessed",
+        # CALL { ... } IN TRANSACTIONS must run in an auto-commit transaction,
+        # which is how the runner executes statements
+        statements=tuple(
+            _convert_to_datetime(prop) for prop in BUBBLE_TEMPORAL_PROPERTIES
+        ) + (
+            """
+            CREATE INDEX bubble_last_accessed IF NOT EXISTS
+            FOR (b:Bubble) ON (b.last_accessed)
+            """,
+        ),
+    ),
+    Migration(
+        version=6,
+        description="Stable public bubble IDs (uid) with uniqueness constraint",
+        statements=(
+            # New bubbles get a UUIDv7 from the application; existing ones
+            # only need a unique value, so a random UUID is enough
+            f"""
+            MATCH (b:Bubble)
+            WHERE b.uid IS NULL
+            CALL {{
+                WITH b
+                SET b.uid = randomUUID()
+            }} IN TRANSACTIONS OF {BACKFILL_BATCH_SIZE} ROWS
+            """,
+            # Backs point lookups in bubble_id_predicate
+            """
+            CREATE CONSTRAINT bubble_uid_unique IF NOT EXISTS
+            FOR (b:Bubble) REQUIRE b.uid IS UNIQUE
+            """,
+        ),
+    ),
+    Migration(
+        version=7,
+        description="Background task run bookkeeping",
+        statements=(
+            # Backs MERGE (t:TaskRun {name: $name}) in save_task_run
+            """
+            CREATE CONSTRAINT task_run_name_unique IF NOT EXISTS
+            FOR (t:TaskRun) REQUIRE t.name IS UNIQUE
+            """,
+        ),
+    ),
+    Migration(
+        version=8,
+        description="Background task leases for multi-replica scheduling",
+        statements=(
+            # Makes concurrent MERGE (l:TaskLease {name: $name}) converge on one node
+            """
+            CREATE CONSTRAINT task_lease_name_unique IF NOT EXISTS
+            FOR (l:TaskLease) REQUIRE l.name IS UNIQUE
+            """,
+        ),
+    ),
+    Migration(
+        version=9,
+        description="Vector index on bubble embeddings for semantic search",
+        statements=(
+            # Dimensions come from BRAINOS_EMBEDDING_DIMENSIONS; changing the
+            # embedding model requires dropping this index and the embeddings
+            _create_vector_index(),
+        ),
+        backfill=backfill_embeddings,
+    ),
+    Migration(
+        version=10,
+        description="Start last_accessed at created_at for never-accessed bubbles",
+        statements=(
+            # Range indexes do not store nulls; with last_accessed always set,
+            # staleness is a single range seek on bubble_last_accessed.
+            # A null last_accessed no longer marks a never-accessed bubble;
+            # access_count = 0 does
+            f"""
+            MATCH (b:Bubble)
+            WHERE b.last_accessed IS NULL
+            CALL {{
+                WITH b
+                SET b.last_accessed = b.created_at
+            }} IN TRANSACTIONS OF {BACKFILL_BATCH_SIZE} ROWS
+            """,
+        ),
+    ),
+    Migration(
+        version=11,
+        description="Range index on bubble source",
+        statements=(
+            # Backs the synthesized-cloud lookups (source = 'cloud_synthesis')
+            """
+            CREATE INDEX bubble_source IF NOT EXISTS
+            FOR (b:Bubble) ON (b.source)
+            """,
+        ),
+    ),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+async def get_schema_version(connection) -> int:
+    """
+    Read the applied schema version.
+
+    Args:
+        connection: A connected Neo4jConnection
+
+    Returns:
+        The applied version, or 0 for a fresh database
+    """
+    async with connection.session() as session:
+        result = await session.run(
+            "MATCH (v:SchemaVersion {id: $id}) RETURN v.version as version",
+            id=SCHEMA_VERSION_ID
+        )
+        record = await result.single()
+        return record["version"] if record and record["version"] is not None else 0
+
+
+async def run_migrations(connection) -> int:
+    """
+    Apply all pending migrations.
+
+    Safe to call on every startup: already-applied migrations are skipped,
+    and each statement is idempotent on its own.
+
+    Args:
+        connection: A connected Neo4jConnection
+
+    Returns:
+        The schema version after migrating
+    """
+    current = await get_schema_version(connection)
+    pending = [m for m in MIGRATIONS if m.version > current]
+
+    if not pending:
+        logger.info(f"Schema up to date (version {current})")
+        return current
+
+    async with connection.session() as session:
+        for migration in pending:
+            logger.info(f"Applying schema migration {migration.version}: {migration.description}")
+            for statement in migration.statements:
+                result = await session.run(statement)
+                await result.consume()
+            if migration.backfill:
+                await migration.backfill(session)
+
+            result = await session.run(
+                """
+                MERGE (v:SchemaVersion {id: $id})
+                SET v.version = $version,
+                    v.description = $description,
+                    v.applied_at = $now
+                """,
+                id=SCHEMA_VERSION_ID,
+                version=migration.version,
+                description=migration.description,
+                now=datetime.now(timezone.utc)
+            )
+            await result.consume()
+
+    logger.info(f"Schema migrated from version {current} to {SCHEMA_VERSION}")
+    return SCHEMA_VERSION
@@ -0,0 +1,131 @@
+"""
+Cloud Synthesis Flow.
+PocketFlow implementation for turning a cluster of related memories into a
+single Reflective insight (a "cloud").
+
+Used by the weekly cloud_synthesis background task; one LLM call per cluster.
+
+Configuration-driven: Modify the node config class to change behavior without code changes.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from pocketflow import AsyncNode, AsyncFlow
+
+from src.utils.llm import get_openrouter_client, get_openrouter_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CloudSynthesisConfig:
+    """
+    Configuration for the cloud synthesis flow.
+
+    Modify these values to change behavior without touching code.
+    """
+
+    model_task: str = "researching"
+    """OpenRouter model task: creative, researching, or planning"""
+
+    temperature: float = 0.4
+    """LLM temperature (0.0 = deterministic, 1.0 = creative)"""
+
+    max_tokens: int = 600
+    """Maximum tokens in the response"""
+
+    max_memory_chars: int = 300
+    """Characters of each memory included in the prompt"""
+
+    system_prompt: str = (
+        "You are a reflective assistant. You distill clusters of related "
+        "memories into one concise, durable insight."
+    )
+    """System prompt to set context"""
+
+
+class SynthesizeCloudNode(AsyncNode):
+    """
+    AsyncNode that writes a Reflective insight for one memory cluster.
+
+    This is a single-node flow (Cell in the Fractal DNA architecture).
+    """
+
+    config: CloudSynthesisConfig = CloudSynthesisConfig()
+
+    async def prep_async(self, shared):
+        """
+        Prepare inputs from shared store.
+
+        Args:
+            shared: Contains 'topic' (shared entities) and 'members' (bubble dicts)
+
+        Returns:
+            Tuple of (topic, members) for exec_async
+        """
+        return shared.get("topic", ""), shared.get("members", [])
+
+    async def exec_async(self, inputs):
+        """
+        Call the LLM to synthesize the cluster.
+
+        Args:
+            inputs: Tuple of (topic, members)
+
+        Returns:
+            Insight text
+        """
+        topic, members = inputs
+
+        memories = "\n".join(
+            f"- [{m.get('sector')}] {(m.get('content') or '')[:self.config.max_memory_chars]}"
+            for m in members
+        )
+        prompt = f"""These {len(members)} memories all concern "{topic}":
+
+{memories}
+
+Write one Reflective insight (3-5 sentences) that captures the pattern,
+lesson or open question these memories share. Refer to specifics, do not
+restate each memory, and do not add a heading."""
+
+        client = get_openrouter_client()
+        model = get_openrouter_model(self.config.model_task)
+
+        logger.info(f"Calling OpenRouter {model} to synthesize cloud for '{topic}' ({len(members)} memories)")
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": self.config.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+
+        return (response.choices[0].message.content or "").strip()
+
+    async def post_async(self, shared, prep_res, exec_res):
+        """Store the insight in the shared store."""
+        shared["insight"] = exec_res
+        return "default"
+
+
+cloud_synthesis_flow = AsyncFlow(start=SynthesizeCloudNode())
+
+
+async def synthesize_cloud(topic: str, members: list[dict]) -> str:
+    """
+    Generate a Reflective insight for a cluster of memories.
+
+    Args:
+        topic: What the cluster shares (e.g. its entities)
+        members: Bubble dicts with at least content and sector
+
+    Returns:
+        Insight text (empty if the model returned nothing)
+    """
+    shared = {"topic": topic, "members": members}
+    await cloud_synthesis_flow.run_async(shared)
+    return shared.get("insight", "")
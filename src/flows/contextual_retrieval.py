@@ -12,16 +12,149 @@ This is an "Organ" in the Fractal DNA architecture - specialized agent cluster.
 Phase 4 Enhancement: Added Context logging and progress reporting.
 """
 
+import asyncio
 import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from pocketflow import AsyncNode, AsyncFlow
 
-from src.database.connection import get_driver
+from src.database.connection import fetch_all, get_driver, session_defaults
 from src.database.queries.memory import search_bubbles
+from src.utils.context_packing import pack_memories, prompt_budget, truncate_to_tokens
 from src.utils.llm import get_groq_client, get_groq_model, get_openrouter_client, get_openrouter_model
+from src.utils.llm_cache import cached_completion
 
 logger = logging.getLogger(__name__)
 
+# Salience above which a bubble passes the "high" salience filter
+HIGH_SALIENCE = 0.6
+
+# Maximum bubbles returned by a contextual query
+RESULT_LIMIT = 20
+
+# Maximum tokens of each bubble's content in the synthesis prompt
+BUBBLE_TOKEN_LIMIT = 60
+
+
+async def query_bubbles(
+    driver,
+    search_terms: list[str],
+    since: Optional[datetime] = None,
+    min_salience: Optional[float] = None
+) -> dict:
+    """
+    Query bubbles containing any of the search terms, with their relations.
+
+    Args:
+        driver: Neo4j async driver
+        search_terms: Terms matched case-insensitively against content
+        since: Only bubbles created after this time (range seek on created_at)
+        min_salience: Only bubbles with salience above this
+
+    Returns:
+        Dictionary with 'bubbles' list (highest salience first) and 'relations' list
+    """
+    # Build base query
+    query = """
+        MATCH (b:Bubble)
+        WHERE b.valid_to IS NULL
+    """
+
+    params = {}
+
+    # Build OR conditions for search terms
+    or_conditions = " OR ".join([
+        f"toLower(b.content) CONTAINS toLower($search{i})"
+        for i in range(len(search_terms))
+    ])
+    query += f" AND ({or_conditions})"
+
+    for i, term in enumerate(search_terms):
+        params[f"search{i}"] = term
+
+    if since is not None:
+        query += " AND b.created_at > $since"
+        params["since"] = since
+
+    if min_salience is not None:
+        query += " AND b.salience > $min_salience"
+        params["min_salience"] = min_salience
+
+    query += """
+        RETURN b {.uid, .content, .sector, .source, .salience, .created_at,
+                  .memory_type, .activation_threshold} as bubble,
+               [(b)-[rel:LINKED]->(other) | {
+                   from: b.uid,
+                   to: other.uid,
+                   type: rel.type
+               }] as relations
+        ORDER BY b.salience DESC
+        LIMIT $result_limit
+    """
+    params["result_limit"] = RESULT_LIMIT
+
+    logger.debug(f"ContextualQuery: Query: {query[:150]}...")
+    logger.debug(f"ContextualQuery: Params: {params}")
+
+    # Managed read transaction: routed to read replicas, retried on transient errors
+    async with driver.session(**session_defaults()) as session:
+        logger.debug("ContextualQuery: Executing Neo4j query")
+        records = await session.execute_read(fetch_all, query, params)
+
+    bubbles = []
+    all_relations = []
+
+    for record in records:
+        node = record["bubble"]
+        bubbles.append({
+            "id": node.get("uid"),
+            "content": node["content"],
+            "sector": node["sector"],
+            "source": node["source"],
+            "salience": node["salience"],
+            "created_at": str(node["created_at"]),
+            "memory_type": node.get("memory_type") or "thinking",
+            "activation_threshold": node.get("activation_threshold") or 0.65,
+        })
+        all_relations.extend(record.get("relations", []))
+
+    return {"bubbles": bubbles, "relations": all_relations}
+
+
+def _resolve_filters(time_scope: str, salience_filter: str) -> tuple[Optional[datetime], Optional[float]]:
+    """Turn time_scope/salience_filter choices into query_bubbles filters."""
+    since = datetime.now(timezone.utc) - timedelta(days=30) if time_scope == "recent" else None
+    min_salience = HIGH_SALIENCE if salience_filter == "high" else None
+    return since, min_salience
+
+
+def _cancel_speculative(shared: dict) -> None:
+    """Cancel a speculative query that no node consumed."""
+    speculative = shared.pop("speculative_query", None)
+    if speculative is None:
+        return
+    if not speculative.cancel() and not speculative.cancelled():
+        # Already finished: retrieve any exception so it is not logged as unhandled
+        speculative.exception()
+
+
+def _merge_results(first: dict, second: dict) -> dict:
+    """Merge two query results, de-duplicating bubbles and relations."""
+    bubbles = {}
+    for bubble in first["bubbles"] + second["bubbles"]:
+        bubbles.setdefault(bubble["id"], bubble)
+
+    ranked = sorted(bubbles.values(), key=lambda b: b["salience"] or 0, reverse=True)[:RESULT_LIMIT]
+    kept = {bubble["id"] for bubble in ranked}
+
+    relations = {}
+    for relation in first["relations"] + second["relations"]:
+        if relation["from"] in kept:
+            relations.setdefault((relation["from"], relation["to"], relation["type"]), relation)
+
+    return {"bubbles": ranked, "relations": list(relations.values())}
+
 
 class PreQueryContextNode(AsyncNode):
     """
@@ -37,6 +170,12 @@ class PreQueryContextNode(AsyncNode):
         """
         Prepare input and context from shared store.
 
+        Unless shared['speculative'] is False, also starts querying the raw
+        user input right away, so retrieval overlaps the LLM analysis. Only
+        explicit filter overrides apply to that query (recorded in
+        shared['speculative_filters']); ContextualQueryNode reuses its
+        results only if the resolved context asks for the same filters.
+
         Args:
             shared: Contains 'user_input' and optional 'conversation_history'
 
@@ -48,6 +187,13 @@ class PreQueryContextNode(AsyncNode):
         time_scope = shared.get("time_scope", "auto")
         salience_filter = shared.get("salience_filter", "auto")
 
+        if shared.get("speculative", True) and user_input:
+            driver = shared.get("neo4j_driver") or await get_driver()
+            shared["speculative_filters"] = (time_scope == "recent", salience_filter == "high")
+            shared["speculative_query"] = asyncio.create_task(
+                query_bubbles(driver, [user_input], *_resolve_filters(time_scope, salience_filter))
+            )
+
         return user_input, conversation_history, time_scope, salience_filter
 
     async def exec_async(self, inputs):
@@ -103,7 +249,8 @@ Rules:
 
         try:
             logger.debug(f"PreQueryContext: Calling Groq for concept extraction")
-            response = groq.chat.completions.create(
+            content = await cached_completion(
+                groq,
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0,
@@ -112,7 +259,7 @@ Rules:
             )
 
             import json
-            context = json.loads(response.choices[0].message.content)
+            context = json.loads(content)
 
             logger.info(f"Context analyzed: {len(context.get('related_concepts', []))} concepts found")
             logger.debug(f"PreQueryContext: Intent={context.get('intent')}, Concepts={context.get('related_concepts')}, TimeScope={context.get('time_scope')}")
@@ -162,19 +309,30 @@ class ContextualQueryNode(AsyncNode):
         Prepare driver and context from shared store.
 
         Args:
-            shared: Contains 'neo4j_driver' and 'query_context'
+            shared: Contains 'neo4j_driver', 'query_context' and, in
+                speculative mode, the 'speculative_query' task and the
+                'speculative_filters' it ran with
 
         Returns:
-            Tuple of (driver, context, user_input)
+            Tuple of (driver, context, user_input, speculative task or None)
         """
         driver = shared.get("neo4j_driver")
         context = shared.get("query_context", {})
         user_input = shared.get("user_input", "")
 
+        resolved = (context.get("time_scope") == "recent", context.get("salience_filter") == "high")
+        if shared.get("speculative_filters") == resolved:
+            speculative = shared.pop("speculative_query", None)
+        else:
+            # The speculative query ran with other filters, so its top
+            # results are not the top results under the resolved ones
+            _cancel_speculative(shared)
+            speculative = None
+
         if not driver:
             driver = await get_driver()
 
-        return driver, context, user_input
+        return driver, context, user_input, speculative
 
     async def exec_async(self, inputs):
         """
@@ -182,92 +340,55 @@ class ContextualQueryNode(AsyncNode):
 
         Phase 4 Enhancement: Added debug logging.
 
+        In speculative mode the raw user input was already queried while the
+        context was being analyzed, with the filters the context resolved
+        to; only the related concepts it adds are fetched here.
+
         Args:
-            inputs: Tuple of (driver, context, user_input)
+            inputs: Tuple of (driver, context, user_input, speculative task or None)
 
         Returns:
             Dictionary with 'bubbles' list and 'relations' list
         """
-        from neo4j import AsyncGraphDatabase
-
-        driver, context, user_input = inputs
-
-        # Phase 4: Debug logging
-        logger.debug("ContextualQuery: Building dynamic Cypher query")
-
-        # Build base query
-        query = """
-            MATCH (b:Bubble)
-            WHERE b.valid_to IS NULL
-        """
-
-        params = {}
-
-        # Add main content filter (include user_input and related concepts)
-        search_terms = [user_input]
-        search_terms.extend(context.get("related_concepts", []))
-
-        # Build OR conditions for search terms
-        or_conditions = " OR ".join([
-            f"toLower(b.content) CONTAINS toLower($search{i})"
-            for i in range(len(search_terms))
-        ])
-        query += f" AND ({or_conditions})"
-
-        for i, term in enumerate(search_terms):
-            params[f"search{i}"] = term
-
-        # Add time filter
-        time_scope = context.get("time_scope", "all_time")
-        if time_scope == "recent":
-            query += " AND b.created_at > datetime() - duration('P30D')"
-
-        # Add salience filter
-        salience_filter = context.get("salience_filter", "any")
-        if salience_filter == "high":
-            query += " AND b.salience > 0.6"
-
-        query += """
-            RETURN b,
-                   [(b)-[rel:LINKED]->(other) | {
-                       from: id(b),
-                       to: id(other),
-                       type: rel.type
-                   }] as relations
-            ORDER BY b.salience DESC
-            LIMIT 20
-        """
+        driver, context, user_input, speculative = inputs
+
+        # Resolve time and salience filters
+        since, min_salience = _resolve_filters(
+            context.get("time_scope", "all_time"), context.get("salience_filter", "any")
+        )
+
+        related = [
+            concept for concept in dict.fromkeys(context.get("related_concepts", []))
+            if isinstance(concept, str) and concept.strip()
+        ]
+
+        raw = None
+        if speculative is not None:
+            try:
+                raw = await speculative
+            except Exception as e:
+                logger.warning(f"ContextualQuery: Speculative query failed, querying all terms: {e}")
+
+        if raw is None:
+            results = await query_bubbles(driver, [user_input] + related, since, min_salience)
+        else:
+            delta = (
+                await query_bubbles(driver, related, since, min_salience)
+                if related else {"bubbles": [], "relations": []}
+            )
+            logger.debug(
+                f"ContextualQuery: {len(raw['bubbles'])} speculative + {len(delta['bubbles'])} concept-expanded bubbles"
+            )
+            results = _merge_results(raw, delta)
 
-        logger.debug(f"ContextualQuery: Query: {query[:150]}...")
-        logger.debug(f"ContextualQuery: Params: {params}")
-
-        async with driver.session() as session:
-            logger.debug("ContextualQuery: Executing Neo4j query")
-            result = await session.run(query, **params)
-
-            bubbles = []
-            all_relations = []
-
-            async for record in result:
-                node = record["b"]
-                bubbles.append({
-                    "id": str(node.element_id),
-                    "content": node["content"],
-                    "sector": node["sector"],
-                    "source": node["source"],
-                    "salience": node["salience"],
-                    "created_at": node["created_at"],
-                    "memory_type": node.get("memory_type", "thinking"),
-                    "activation_threshold": node.get("activation_threshold", 0.65),
-                })
-                all_relations.extend(record.get("relations", []))
+        bubbles = results["bubbles"]
 
         logger.info(f"Query complete: {len(bubbles)} bubbles retrieved")
 
         if len(bubbles) == 0:
             logger.warning("No memories found - check search terms and filters")
 
-        return {"bubbles": bubbles, "relations": all_relations}
+        return results
 
     async def post_async(self, shared, prep_res, results):
         """
@@ -342,11 +463,22 @@ class PostQuerySynthesizeNode(AsyncNode):
                 "relationships": []
             }
 
-        # Format bubbles for LLM
-        bubble_text = "\n".join([
-            f"[{i}] {b['sector']}: {b['content'][:150]}{'...' if len(b['content']) > 150 else ''}"
-            for i, b in enumerate(bubbles[:15])
-        ])
+        client = get_openrouter_client()
+        model = get_openrouter_model("researching")
+
+        # Format bubbles for LLM: most relevant first, within the token budget.
+        # Indices stay those of the bubbles list, which bubble_indices refer to.
+        packed = pack_memories(
+            bubbles,
+            budget_tokens=prompt_budget(model),
+            render=lambda i, b, content: f"[{i}] {b['sector']}: {truncate_to_tokens(content, BUBBLE_TOKEN_LIMIT)}",
+            query=" ".join(
+                term for term in [context.get("intent")] + context.get("related_concepts", [])
+                if isinstance(term, str)
+            ),
+            max_items=15
+        )
+        bubble_text = packed.text()
 
         # Format relations
         relation_text = "\n".join([
@@ -354,9 +486,6 @@ class PostQuerySynthesizeNode(AsyncNode):
             for r in relations[:10]
         ]) if relations else "No relations found"
 
-        client = get_openrouter_client()
-        model = get_openrouter_model("researching")
-
         prompt = f"""Context: User is interested in "{context.get('intent', 'search')}"
 
 Found {len(bubbles)} memories:
@@ -432,6 +561,16 @@ Return JSON only:
         return "default"
 
 
+class ContextualRetrievalFlow(AsyncFlow):
+    """AsyncFlow that cancels an unconsumed speculative query when it ends."""
+
+    async def _run_async(self, shared):
+        try:
+            return await super()._run_async(shared)
+        finally:
+            _cancel_speculative(shared)
+
+
 # Wire the flow: pre_query -> query -> post_query
 pre_query = PreQueryContextNode()
 query_db = ContextualQueryNode()
@@ -440,7 +579,7 @@ post_query = PostQuerySynthesizeNode()
 pre_query - "query" >> query_db
 query_db - "synthesize" >> post_query
 
-contextual_retrieval_flow = AsyncFlow(start=pre_query)
+contextual_retrieval_flow = ContextualRetrievalFlow(start=pre_query)
 
 
 # Convenience function for direct usage
@@ -16,6 +16,7 @@ from pocketflow import AsyncNode, AsyncFlow
 
 from src.database.queries.memory import search_instinctive_bubbles
 from src.utils.llm import get_groq_client
+from src.utils.llm_cache import cached_completion
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +73,8 @@ Rules:
 """
 
         try:
-            response = groq.chat.completions.create(
+            content = await cached_completion(
+                groq,
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0,
@@ -81,7 +83,7 @@ Rules:
             )
 
             import json
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(content)
             concepts = result.get("concepts", [])
 
             logger.info(f"Extracted {len(concepts)} concepts from input")
@@ -13,16 +13,20 @@ Key Features:
 - Confidence scoring (0.0-1.0)
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import zip_longest
 from typing import Optional
 
 from pocketflow import AsyncNode, AsyncFlow
 
 from src.database.connection import get_driver
-from src.database.queries.memory import search_bubbles
+from src.database.queries.memory import search_bubbles, search_bubbles_multi, vector_search_bubbles
+from src.utils.context_packing import pack_memories, prompt_budget
 from src.utils.llm import get_groq_client, get_openrouter_client, get_openrouter_model
+from src.utils.llm_cache import cached_completion
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +61,15 @@ class HybridRetrievalConfig:
     salience_threshold: float = 0.3
     """Minimum salience score to include"""
 
+    semantic_min_score: float = 0.6
+    """Minimum vector score for a semantic hit (Neo4j reports cosine as (1 + cos) / 2)"""
+
+    rrf_k: int = 60
+    """Reciprocal rank fusion constant (higher = flatter rank weighting)"""
+
+    speculative: bool = True
+    """Retrieve on the raw query while it is still being analyzed"""
+
 
 @dataclass(frozen=True)
 class ReflectionConfig:
@@ -91,6 +104,12 @@ class AnswerSynthesisConfig:
     max_answer_sentences: int = 4
     """Maximum sentences in the direct answer"""
 
+    context_budget_tokens: Optional[int] = None
+    """Token budget for memories in the prompt (None = per-model default)"""
+
+    stream_min_chars: int = 40
+    """When streaming, minimum new answer characters between partial updates"""
+
 
 class QueryAnalysisNode(AsyncNode):
     """
@@ -146,7 +165,8 @@ Return ONLY valid JSON, no markdown."""
 
         try:
             client = get_groq_client()
-            response = client.chat.completions.create(
+            content = await cached_completion(
+                client,
                 model="openai/gpt-oss-120b",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=self.config.model_temperature,
@@ -155,7 +175,7 @@ Return ONLY valid JSON, no markdown."""
             )
 
             import json
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(content)
             logger.info(f"Query analyzed: type={result.get('query_type')}, complexity={result.get('complexity')}")
             return result
 
@@ -180,16 +200,41 @@ Return ONLY valid JSON, no markdown."""
         return "default"
 
 
+def reciprocal_rank_fusion(rankings: list[list], k: int = 60) -> list:
+    """
+    Fuse ranked memory lists with reciprocal rank fusion.
+
+    Each memory scores sum(1 / (k + rank)) over the lists it appears in, so
+    memories ranked well by several retrievers rise to the top without
+    needing comparable raw scores.
+
+    Args:
+        rankings: Ranked lists of memories (best first)
+        k: Fusion constant
+
+    Returns:
+        De-duplicated memories, highest fused score first
+    """
+    scores = {}
+    memories = {}
+    for ranking in rankings:
+        for rank, memory in enumerate(ranking, 1):
+            scores[memory.id] = scores.get(memory.id, 0.0) + 1.0 / (k + rank)
+            memories.setdefault(memory.id, memory)
+    return [memories[memory_id] for memory_id in sorted(scores, key=scores.get, reverse=True)]
+
+
 class HybridRetrievalNode(AsyncNode):
     """
     Retrieve relevant memories using hybrid keyword + semantic search.
 
-    Searches across:
+    Keyword search uses the full-text index over:
     - Content field
     - Entities
     - Observations
 
-    Returns memories ordered by salience score.
+    Semantic search uses the bubble embedding vector index. Both rankings
+    are merged with reciprocal rank fusion.
     """
 
     config: HybridRetrievalConfig = HybridRetrievalConfig()
@@ -216,11 +261,19 @@ class HybridRetrievalNode(AsyncNode):
 
         logger.debug(f"Executing hybrid retrieval for: '{search_terms}'")
 
-        # Use keyword search (could be enhanced with semantic search)
-        results = await search_bubbles(
-            query=search_terms,
-            limit=self.config.keyword_limit
+        # Keyword (full-text) and semantic (vector) search run concurrently
+        keyword_hits, semantic_hits = await asyncio.gather(
+            search_bubbles(query=search_terms, limit=self.config.keyword_limit),
+            vector_search_bubbles(
+                query=search_terms,
+                limit=self.config.semantic_limit,
+                min_score=self.config.semantic_min_score
+            )
         )
+        results = reciprocal_rank_fusion(
+            [keyword_hits, semantic_hits], k=self.config.rrf_k
+        )[:self.config.keyword_limit]
+        logger.debug(f"Fused {len(keyword_hits)} keyword + {len(semantic_hits)} semantic hits")
 
         # Filter by salience threshold
         filtered = [
@@ -336,18 +389,16 @@ Return ONLY a JSON list of strings:
             shared["reflection_memories"] = []
             return "default"
 
-        # Search for additional memories using reflection concepts
-        all_additional = []
-        for concept in concepts[:3]:  # Limit to 3 concepts
-            results = await search_bubbles(query=concept, limit=5)
-            all_additional.extend(results)
+        # Search for additional memories using reflection concepts (one query for all)
+        matches = await search_bubbles_multi(concepts[:3], limit_per_term=5)  # Limit to 3 concepts
 
         # Remove duplicates (by ID)
         existing_ids = {m.id for m in shared.get("retrieved_memories", [])}
-        additional = [m for m in all_additional if m.id not in existing_ids]
+        additional = [m for m, _ in matches if m.id not in existing_ids]
 
         shared["reflection_memories"] = additional
         shared["reflection_concepts"] = concepts
+        shared["reflection_provenance"] = {m.id: terms for m, terms in matches if m.id not in existing_ids}
 
         logger.info(f"Reflection retrieved {len(additional)} additional memories")
 
@@ -385,7 +436,27 @@ class AnswerSynthesisNode(AsyncNode):
     async def exec_async(self, inputs):
         """Generate answer with reasoning and confidence."""
         query, analysis, memories = inputs
-
+        return await self.synthesize(query, analysis, memories)
+
+    async def synthesize(self, query, analysis, memories, on_partial=None):
+        """
+        Generate answer with reasoning and confidence.
+
+        With on_partial, the completion is streamed and the "## Answer"
+        section is parsed as it arrives; on_partial is awaited with the
+        answer text so far whenever it has grown by stream_min_chars, and
+        once more when the section is complete. The returned result is the
+        same either way.
+
+        Args:
+            query: The user's question
+            analysis: Output of QueryAnalysisNode
+            memories: Retrieved memories
+            on_partial: Optional async callback taking the partial answer text
+
+        Returns:
+            Dictionary with answer, reasoning, confidence, confidence_label, num_memories_used
+        """
         if not memories:
             # No memories found - return helpful message
             return {
@@ -396,8 +467,11 @@ class AnswerSynthesisNode(AsyncNode):
                 "num_memories_used": 0
             }
 
-        # Format memories for LLM
-        memory_context = self._format_memories(memories)
+        model = get_openrouter_model(self.config.model_task)
+
+        # Pack the most relevant memories into the model's token budget
+        packed = self._pack_memories(memories, query, model)
+        memory_context = packed.text()
 
         # Build synthesis prompt
         query_type = analysis.get("query_type", "factual")
@@ -405,9 +479,8 @@ class AnswerSynthesisNode(AsyncNode):
 
         try:
             client = get_openrouter_client()
-            model = get_openrouter_model(self.config.model_task)
 
-            response = await client.chat.completions.create(
+            request = dict(
                 model=model,
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant that answers questions based on memory data."},
@@ -417,10 +490,14 @@ class AnswerSynthesisNode(AsyncNode):
                 max_tokens=self.config.max_tokens
             )
 
-            result = response.choices[0].message.content
+            if on_partial is None:
+                response = await client.chat.completions.create(**request)
+                result = response.choices[0].message.content
+            else:
+                result = await self._stream_completion(client, request, on_partial)
 
             # Parse the response
-            return self._parse_synthesis_result(result, memories)
+            return self._parse_synthesis_result(result, packed.memories)
 
         except Exception as e:
             logger.error(f"Answer synthesis failed: {e}")
@@ -444,19 +521,83 @@ class AnswerSynthesisNode(AsyncNode):
 
         return "default"
 
-    def _format_memories(self, memories):
-        """Format memories for LLM context."""
-        formatted = []
-        for i, m in enumerate(memories[:20], 1):  # Max 20 memories
-            formatted.append(
-                f"Memory [{i}]:\n"
+    async def _stream_completion(self, client, request, on_partial):
+        """Stream a completion, reporting the answer section as it grows."""
+        stream = await client.chat.completions.create(stream=True, **request)
+
+        chunks = []
+        reported = ""
+        answer_done = False
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            chunks.append(delta)
+            if answer_done:
+                continue
+
+            answer, answer_done = self._partial_answer("".join(chunks))
+            if answer_done or len(answer) - len(reported) >= self.config.stream_min_chars:
+                if answer and answer != reported:
+                    reported = answer
+                    await self._report_partial(on_partial, answer)
+
+        # The model may never have started a "## Reasoning" section
+        answer, _ = self._partial_answer("".join(chunks))
+        if answer and answer != reported:
+            await self._report_partial(on_partial, answer)
+
+        return "".join(chunks)
+
+    @staticmethod
+    async def _report_partial(on_partial, answer):
+        """Deliver a partial answer; delivery failures never abort synthesis."""
+        try:
+            await on_partial(answer)
+        except Exception as e:
+            logger.debug(f"Partial answer not delivered: {e}")
+
+    @staticmethod
+    def _partial_answer(text):
+        """
+        Extract the answer section from a possibly incomplete response.
+
+        Returns:
+            Tuple of (answer text so far, whether the section is complete)
+        """
+        import re
+
+        start = re.search(r"## Answer\s*\n", text)
+        if not start:
+            return "", False
+        body = text[start.end():]
+        end = body.find("## ")
+        if end != -1:
+            return body[:end].strip(), True
+        # Hold back a heading that may be arriving ("\n#", "\n##")
+        return body.rstrip("#").strip(), False
+
+    def _pack_memories(self, memories, query, model):
+        """Select and format memories for LLM context within the token budget."""
+        def render(index, m, content):
+            return (
+                f"Memory [{index + 1}]:\n"
                 f"  ID: {m.id}\n"
                 f"  Sector: {m.sector}\n"
                 f"  Salience: {m.salience:.2f}\n"
                 f"  Created: {m.created_at.strftime('%Y-%m-%d')}\n"
-                f"  Content: {m.content}\n"
+                f"  Content: {content}\n"
             )
-        return "\n".join(formatted)
+
+        return pack_memories(
+            memories,
+            budget_tokens=self.config.context_budget_tokens or prompt_budget(model),
+            render=render,
+            query=query,
+            max_items=20
+        )
 
     def _build_synthesis_prompt(self, query, query_type, memory_context):
         """Build the synthesis prompt based on query type."""
@@ -561,6 +702,68 @@ answer_synthesis_node = AnswerSynthesisNode()
 query_memories_flow = AsyncFlow(start=query_analysis_node)
 
 
+async def analyze_and_retrieve(query: str, conversation_history: Optional[list] = None) -> tuple[dict, list]:
+    """
+    Analyze the query and retrieve memories for it.
+
+    In speculative mode (HybridRetrievalConfig.speculative) retrieval on the
+    raw query starts at the same moment as the Groq analysis. Once the
+    analysis returns, only the concepts and entities it adds are fetched,
+    and both result sets are merged without duplicates. This saves roughly
+    one LLM round trip before retrieval starts.
+
+    Args:
+        query: Natural language question
+        conversation_history: Optional list of recent messages for context
+
+    Returns:
+        Tuple of (query analysis, retrieved memories)
+    """
+    conversation_history = conversation_history or []
+
+    if not hybrid_retrieval_node.config.speculative:
+        analysis = await query_analysis_node.exec_async((query, conversation_history))
+        search_terms = " ".join(
+            [query] + analysis.get("key_concepts", []) + analysis.get("extracted_entities", [])
+        )
+        return analysis, await hybrid_retrieval_node.exec_async(search_terms)
+
+    raw_task = asyncio.create_task(hybrid_retrieval_node.exec_async(query))
+    try:
+        analysis = await query_analysis_node.exec_async((query, conversation_history))
+    except BaseException:
+        raw_task.cancel()
+        raise
+
+    query_lower = query.lower()
+    delta_terms = [
+        term for term in dict.fromkeys(
+            analysis.get("key_concepts", []) + analysis.get("extracted_entities", [])
+        )
+        if isinstance(term, str) and term.strip() and term.lower() not in query_lower
+    ]
+    if delta_terms:
+        raw, expanded = await asyncio.gather(
+            raw_task, hybrid_retrieval_node.exec_async(" ".join(delta_terms))
+        )
+    else:
+        raw, expanded = await raw_task, []
+
+    # Interleave so both the raw-query and the concept-expanded matches are represented
+    merged = {}
+    for pair in zip_longest(raw, expanded):
+        for memory in pair:
+            if memory is not None:
+                merged.setdefault(memory.id, memory)
+    retrieved = list(merged.values())[:hybrid_retrieval_node.config.keyword_limit]
+
+    logger.info(
+        f"Speculative retrieval: {len(raw)} raw + {len(expanded)} expanded "
+        f"({len(delta_terms)} new terms) -> {len(retrieved)} memories"
+    )
+    return analysis, retrieved
+
+
 # Convenience function for direct usage
 async def query_memories(query: str, conversation_history: Optional[list] = None) -> dict:
     """
@@ -11,9 +11,11 @@ Phase 4 Enhancement: Added Context logging and progress reporting.
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from pocketflow import AsyncNode, AsyncFlow
 
+from src.utils.context_packing import PackedContext, pack_memories, prompt_budget
 from src.utils.llm import get_openrouter_client, get_openrouter_model
 
 logger = logging.getLogger(__name__)
@@ -39,6 +41,9 @@ class SummarizeProjectConfig:
     system_prompt: str = "You are a helpful assistant that summarizes project information clearly and concisely."
     """System prompt to set context"""
 
+    context_budget_tokens: Optional[int] = None
+    """Token budget for memories in the prompt (None = per-model default)"""
+
 
 class GenerateSummaryNode(AsyncNode):
     """
@@ -131,6 +136,38 @@ Format your response in Markdown."""
         return "default"
 
 
+def format_project_memories(project_name: str, memories: list) -> PackedContext:
+    """
+    Select and format project memories for the summary prompt.
+
+    Memories are ranked by relevance to the project and salience, near
+    duplicates are dropped, and the rest are packed into the summary
+    model's token budget.
+
+    Args:
+        project_name: Name of the project
+        memories: BubbleResponse objects (content, sector, salience, created_at)
+
+    Returns:
+        PackedContext; use .text("\n\n") as the 'memories' input of the flow
+    """
+    config = GenerateSummaryNode.config
+    model = get_openrouter_model(config.model_task)
+
+    def render(index, m, content):
+        return (
+            f"- [{m.sector}] {content}\n"
+            f"  (Created: {m.created_at.strftime('%Y-%m-%d')}, Salience: {m.salience:.2f})"
+        )
+
+    return pack_memories(
+        memories,
+        budget_tokens=config.context_budget_tokens or prompt_budget(model),
+        render=render,
+        query=project_name
+    )
+
+
 # Create the flow (can be chained with other nodes in the future)
 summarize_project_flow = AsyncFlow(start=GenerateSummaryNode())
 
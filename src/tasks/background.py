@@ -6,59 +6,48 @@ Phase 4: Circadian rhythm - automated maintenance cycles.
 
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 
-from src.database.connection import get_driver
-from src.database.queries.memory import search_bubbles
+from src.database.connection import get_driver, session_defaults
+from src.database.queries.memory import decay_stale_bubbles
 
 logger = logging.getLogger(__name__)
 
+# Cloud synthesis: clusters of CLOUD_MIN_CLUSTER_SIZE+ memories at or above
+# CLOUD_MIN_SALIENCE get a cloud; at most CLOUD_MAX_MEMBERS go into the prompt
+CLOUD_MIN_SALIENCE = 0.7
+CLOUD_MIN_CLUSTER_SIZE = 5
+CLOUD_MAX_MEMBERS = 25
+# Watermark for the first pass, which considers every memory
+CLOUD_SYNTHESIS_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 async def synaptic_pruning_task():
     """
     Daily salience decay for unused memories.
 
-    Finds memories not accessed in 30+ days and reduces their salience by 10%.
-    This mimics the brain's natural forgetting process.
+    Finds memories not accessed in 30+ days and reduces their salience
+    (per memory type, see DECAY_RATES). This mimics the brain's natural
+    forgetting process. The decay is a batched server-side write, so it
+    scales to any number of memories.
 
     Schedule: Every 24 hours
     """
     logger.info("Starting synaptic pruning cycle")
 
-    driver = await get_driver()
-
     try:
-        # Find memories not accessed in 30+ days
-        # For now, we'll use a simpler approach: reduce salience of old memories
-        from datetime import timedelta
-        cutoff_date = datetime.utcnow() - timedelta(days=30)
-
-        # Get all memories and check their created_at (simplified approach)
-        # In a real implementation, we'd track last_accessed time
-        memories = await search_bubbles("", limit=1000)
-
-        decayed_count = 0
-        decayed_memories = []
-        for memory in memories:
-            # Only decay memories with salience > 0.3 (don't decay very old/weak memories)
-            if memory.salience > 0.3:
-                # Check if memory is old (using created_at as proxy for last accessed)
-                if memory.created_at < cutoff_date:
-                    # Calculate what new salience would be (not actually updating DB in this version)
-                    new_salience = max(0.1, memory.salience * 0.9)
-                    decayed_memories.append({
-                        "id": str(memory.id),
-                        "old_salience": float(memory.salience),
-                        "new_salience": float(new_salience),
-                        "sector": memory.sector
-                    })
-                    decayed_count += 1
-
-        logger.info(f"Synaptic pruning complete: {decayed_count} memories identified for decay")
+        stats = await decay_stale_bubbles(stale_days=30, min_salience=0.1)
+
+        logger.info(
+            f"Synaptic pruning complete: {stats['decayed']} memories decayed "
+            f"({stats['rows_per_second']} rows/s)"
+        )
         return {
             "task": "synaptic_pruning",
-            "decayed_count": decayed_count,
-            "decayed_memories": decayed_memories[:5],  # First 5 for reporting
+            "decayed_count": stats["decayed"],
+            "by_memory_type": stats["by_memory_type"],
+            "duration_seconds": stats["duration_seconds"],
+            "rows_per_second": stats["rows_per_second"],
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
@@ -74,29 +63,80 @@ async def cloud_synthesis_task():
     """
     Weekly generation of Reflective insights.
 
-    Finds memory clusters with 5+ high-salience memories and generates
-    Reflective cloud memories using OpenRouter.
+    Clusters high-salience memories by shared entity (merging entities that
+    co-occur in mostly the same memories), and for each cluster of 5+
+    memories generates one Reflective cloud memory using OpenRouter. The
+    cloud is LINKED to its sources and replaces every earlier cloud covering
+    one of its entities.
+
+    Incremental: only clusters that gained memories since the last pass
+    (the task watermark) are reconsidered, so cost scales with new data.
+    Every such cluster is processed in the run, and the watermark only
+    advances when all of them were synthesized.
 
     Schedule: Every 7 days (168 hours)
     """
     logger.info("Starting cloud synthesis cycle")
 
+    from src.database.queries.clouds import (
+        CLOUD_SECTOR, CLOUD_SOURCE, find_entity_clusters, link_cloud, merge_cooccurring_clusters
+    )
+    from src.database.queries.memory import upsert_bubble
+    from src.database.queries.tasks import get_task_watermark, set_task_watermark
+    from src.flows.cloud_synthesis import synthesize_cloud
+    from src.utils.schemas import BubbleCreate
+
     try:
-        # For now, this is a placeholder implementation
-        # In a full implementation, this would:
-        # 1. Find memory clusters (by entity, topic, etc.)
-        # 2. Check if clusters have 5+ high-salience (>0.7) memories
-        # 3. Call OpenRouter to generate Reflective insights
-        # 4. Store insights as Reflective memories
+        run_started = datetime.now(timezone.utc)
+        watermark = await get_task_watermark("cloud_synthesis") or CLOUD_SYNTHESIS_EPOCH
 
-        clouds_generated = 0
+        clusters = merge_cooccurring_clusters(
+            await find_entity_clusters(
+                since=watermark,
+                min_salience=CLOUD_MIN_SALIENCE,
+                min_cluster_size=CLOUD_MIN_CLUSTER_SIZE
+            )
+        )
 
-        logger.info(f"Cloud synthesis complete: {clouds_generated} insights generated")
-        return {
+        clouds_generated = 0
+        failures = 0
+        for cluster in clusters:
+            members = cluster["members"][:CLOUD_MAX_MEMBERS]
+            topic = ", ".join(cluster["entities"])
+            try:
+                insight = await synthesize_cloud(topic, members)
+                if not insight:
+                    raise ValueError("empty synthesis")
+                cloud = await upsert_bubble(BubbleCreate(
+                    content=insight,
+                    sector=CLOUD_SECTOR,
+                    source=CLOUD_SOURCE,
+                    salience=max(m.get("salience") or 0 for m in members),
+                    entities=cluster["entities"],
+                ))
+                await link_cloud(cloud.id, cluster["key"], cluster["entities"], [m["uid"] for m in members])
+                clouds_generated += 1
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Cloud synthesis failed for cluster '{topic}': {e}")
+
+        if not failures:
+            await set_task_watermark("cloud_synthesis", run_started)
+
+        logger.info(
+            f"Cloud synthesis complete: {clouds_generated} insights generated "
+            f"from {len(clusters)} clusters ({failures} failed)"
+        )
+        result = {
             "task": "cloud_synthesis",
+            "clusters": len(clusters),
             "clouds_generated": clouds_generated,
+            "since": watermark.isoformat(),
             "timestamp": datetime.utcnow().isoformat()
         }
+        if failures:
+            result["error"] = f"{failures} of {len(clusters)} clusters failed; watermark not advanced"
+        return result
     except Exception as e:
         logger.error(f"Cloud synthesis failed: {e}")
         return {
@@ -132,7 +172,7 @@ async def check_neo4j_connection() -> dict:
     """Check Neo4j connectivity."""
     try:
         driver = await get_driver()
-        async with driver.session() as session:
+        async with driver.session(**session_defaults()) as session:
             result = await session.run("RETURN 1 as test")
             await result.single()
 
@@ -199,19 +239,23 @@ TASK_REGISTRY = {
 }
 
 
+def _task_status(task_info: dict) -> dict:
+    """Status view of a registry entry; the scheduler keeps entries live."""
+    return {
+        "name": task_info["display_name"],
+        "status": task_info["status"],
+        "interval": f"{task_info['interval_hours']} hours",
+        "last_run": task_info.get("last_run") or "Never",
+        "next_run": task_info.get("next_run") or "Scheduled",
+        "last_duration": task_info.get("last_duration"),
+        "last_error": task_info.get("last_error"),
+        "description": task_info["description"]
+    }
+
+
 async def get_all_task_status() -> list:
     """Get status of all background tasks."""
-    tasks = []
-    for task_name, task_info in TASK_REGISTRY.items():
-        tasks.append({
-            "name": task_info["display_name"],
-            "status": task_info["status"],
-            "interval": f"{task_info['interval_hours']} hours",
-            "last_run": task_info.get("last_run") or "Never",
-            "next_run": task_info.get("next_run") or "Scheduled",
-            "description": task_info["description"]
-        })
-    return tasks
+    return [_task_status(task_info) for task_info in TASK_REGISTRY.values()]
 
 
 async def get_task_status_by_name(task_name: str) -> dict:
@@ -223,12 +267,4 @@ async def get_task_status_by_name(task_name: str) -> dict:
             "error": "Task not found"
         }
 
-    task_info = TASK_REGISTRY[task_name]
-    return {
-        "name": task_info["display_name"],
-        "status": task_info["status"],
-        "interval": f"{task_info['interval_hours']} hours",
-        "last_run": task_info.get("last_run") or "Never",
-        "next_run": task_info.get("next_run") or "Scheduled",
-        "description": task_info["description"]
-    }
+    return _task_status(TASK_REGISTRY[task_name])
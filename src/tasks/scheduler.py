@@ -0,0 +1,252 @@
+"""
+In-process scheduler for Brain OS background tasks.
+
+Phase 4: Circadian rhythm - runs every TASK_REGISTRY task on its interval.
+
+Each task runs on its own interval plus random jitter. A semaphore bounds
+how many tasks run at once, and a task that is still running when it next
+falls due is skipped rather than started twice. last_run/next_run/duration
+are persisted on :TaskRun nodes, so a restart picks up the existing
+schedule instead of re-running everything.
+
+With several server replicas, each run first takes the task's :TaskLease
+in Neo4j. Only the replica holding the lease runs the task; the others
+adopt the next due time it records on release.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from src.tasks.background import TASK_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TaskScheduler:
+    """Runs registered background tasks on their intervals."""
+
+    def __init__(
+        self,
+        registry: Optional[dict] = None,
+        max_concurrency: int = 2,
+        jitter_fraction: float = 0.05,
+        tick_seconds: float = 30.0,
+        clock: Callable[[], datetime] = _utcnow,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: Optional[random.Random] = None,
+        persist: bool = True,
+        lease_seconds: float = 300.0,
+        owner: Optional[str] = None
+    ):
+        """
+        Args:
+            registry: Task registry (defaults to TASK_REGISTRY); entries are
+                updated in place with live status
+            max_concurrency: Maximum tasks running at once
+            jitter_fraction: Random delay added to each interval, as a
+                fraction of it, so replicas and tasks don't fire in lockstep
+            tick_seconds: How often due tasks are checked
+            clock: Returns the current aware datetime (injectable for tests)
+            sleep: Awaitable sleep (injectable for tests)
+            rng: Random source for jitter
+            persist: Load and save run state in Neo4j, and coordinate
+                replicas through task leases
+            lease_seconds: Lease duration; renewed every third of it while
+                the task runs
+            owner: Identifier of this replica (defaults to host:pid:random)
+        """
+        self.registry = TASK_REGISTRY if registry is None else registry
+        self.jitter_fraction = jitter_fraction
+        self.tick_seconds = tick_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self.persist = persist
+        self.lease_seconds = lease_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._next_run: dict[str, datetime] = {}
+        self._running: dict[str, asyncio.Task] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def _interval(self, name: str) -> timedelta:
+        return timedelta(hours=self.registry[name]["interval_hours"])
+
+    def _jitter(self, name: str) -> timedelta:
+        return self._interval(name) * self.rng.uniform(0, self.jitter_fraction)
+
+    async def start(self) -> None:
+        """Restore persisted schedule state and start the scheduling loop."""
+        persisted = {}
+        if self.persist:
+            try:
+                from src.database.queries.tasks import get_task_runs
+                persisted = await get_task_runs()
+            except Exception as e:
+                logger.warning(f"Could not load persisted task runs, starting fresh: {e}")
+
+        now = self.clock()
+        for name, info in self.registry.items():
+            state = persisted.get(name, {})
+            if state.get("last_run"):
+                info["last_run"] = state["last_run"].isoformat()
+                info["last_duration"] = state.get("duration_seconds")
+                info["last_error"] = state.get("error")
+            # Never-run tasks start within the first jitter window
+            next_run = state.get("next_run") or now + self._jitter(name)
+            self._next_run[name] = next_run
+            info["next_run"] = next_run.isoformat()
+            info["status"] = "scheduled"
+
+        self._loop_task = asyncio.create_task(self._run_loop())
+        logger.info(f"Task scheduler started with {len(self.registry)} tasks")
+
+    async def stop(self) -> None:
+        """Stop scheduling and cancel any running tasks."""
+        tasks = [t for t in (self._loop_task, *self._running.values()) if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop_task = None
+        self._running.clear()
+        logger.info("Task scheduler stopped")
+
+    async def _run_loop(self) -> None:
+        while True:
+            self.run_due()
+            await self.sleep(self.tick_seconds)
+
+    def run_due(self) -> list[str]:
+        """
+        Start every task that is due and not already running.
+
+        Returns:
+            Names of the tasks started
+        """
+        now = self.clock()
+        started = []
+        for name, next_run in self._next_run.items():
+            if next_run > now:
+                continue
+            if name in self._running:
+                logger.debug(f"Skipping {name}: previous run still in progress")
+                continue
+            self._running[name] = asyncio.create_task(self._run_task(name))
+            started.append(name)
+        return started
+
+    async def _acquire_lease(self, name: str, now: datetime) -> Optional[int]:
+        """Take the task's lease, or adopt the schedule of the replica that ran it."""
+        from src.database.queries.tasks import acquire_task_lease
+
+        try:
+            token, next_due = await acquire_task_lease(name, self.owner, now, self.lease_seconds)
+        except Exception as e:
+            logger.warning(f"Could not acquire lease for {name}, skipping this run: {e}")
+            return None
+        if token is None:
+            if next_due and next_due > now:
+                # Another replica already ran it this interval
+                self._next_run[name] = next_due
+                self.registry[name]["next_run"] = next_due.isoformat()
+            logger.debug(f"Skipping {name}: lease held elsewhere or not due")
+        return token
+
+    async def _renew_lease(self, name: str, token: int) -> None:
+        """Keep the lease alive while a long task runs."""
+        from src.database.queries.tasks import renew_task_lease
+
+        while True:
+            await self.sleep(self.lease_seconds / 3)
+            try:
+                if not await renew_task_lease(name, token, self.clock(), self.lease_seconds):
+                    logger.warning(f"Lease on {name} lost while running")
+                    return
+            except Exception as e:
+                logger.warning(f"Could not renew lease on {name}: {e}")
+
+    async def _run_task(self, name: str) -> None:
+        info = self.registry[name]
+        try:
+            async with self._semaphore:
+                started_at = self.clock()
+                token = None
+                renewal = None
+                if self.persist:
+                    token = await self._acquire_lease(name, started_at)
+                    if token is None:
+                        return
+                    renewal = asyncio.create_task(self._renew_lease(name, token))
+
+                info["status"] = "running"
+                start = time.perf_counter()
+                error = None
+                try:
+                    result = await info["function"]()
+                    if isinstance(result, dict) and result.get("error"):
+                        error = str(result["error"])
+                except Exception as e:
+                    logger.error(f"Background task {name} failed: {e}", exc_info=True)
+                    error = str(e)
+                finally:
+                    if renewal:
+                        renewal.cancel()
+                duration = time.perf_counter() - start
+
+                next_run = started_at + self._interval(name) + self._jitter(name)
+                status = "failed" if error else "completed"
+                self._next_run[name] = next_run
+                info.update({
+                    "status": status,
+                    "last_run": started_at.isoformat(),
+                    "next_run": next_run.isoformat(),
+                    "last_duration": round(duration, 3),
+                    "last_error": error,
+                })
+                logger.info(f"Background task {name} {status} in {duration:.2f}s; next run {next_run.isoformat()}")
+
+                if self.persist:
+                    try:
+                        from src.database.queries.tasks import release_task_lease, save_task_run
+                        if not await save_task_run(
+                            name, started_at, next_run, duration, status, error, fencing_token=token
+                        ):
+                            logger.warning(f"Run of {name} not recorded: lease was taken over")
+                        await release_task_lease(name, token, next_run)
+                    except Exception as e:
+                        logger.warning(f"Could not persist run of {name}: {e}")
+        finally:
+            self._running.pop(name, None)
+
+
+# Global scheduler instance
+_scheduler: Optional[TaskScheduler] = None
+
+
+async def start_scheduler(**options) -> TaskScheduler:
+    """Create and start the global scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TaskScheduler(**options)
+        await _scheduler.start()
+    return _scheduler
+
+
+async def stop_scheduler() -> None:
+    """Stop the global scheduler."""
+    global _scheduler
+    if _scheduler:
+        await _scheduler.stop()
+        _scheduler = None
@@ -11,7 +11,7 @@ from pydantic import Field
 
 from src.database.connection import get_driver
 from src.database.queries.memory import search_bubbles
-from src.flows.summarize_project import summarize_project_flow
+from src.flows.summarize_project import format_project_memories, summarize_project_flow
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +79,9 @@ def register_summarize_project(mcp) -> None:
 
             # Step 1: Retrieve memories related to the project
             logger.debug(f"summarize_project: Retrieving memories (limit={limit})")
-            memories = await search_bubbles(project, limit)
+            memories = await search_bubbles(
+                project, limit, fields=("content", "sector", "salience", "created_at")
+            )
 
             if not memories:
                 logger.warning(f"No memories found for project '{project}'")
@@ -90,12 +92,8 @@ def register_summarize_project(mcp) -> None:
 
             # Step 2: Format memories for the flow
             logger.debug("summarize_project: Formatting memories for PocketFlow")
-            memories_text = "\n\n".join(
-                [
-                    f"- [{m.sector}] {m.content}\n  (Created: {m.created_at.strftime('%Y-%m-%d')}, Salience: {m.salience:.2f})"
-                    for m in memories
-                ]
-            )
+            packed = format_project_memories(project, memories)
+            memories_text = packed.text("\n\n")
 
             # Step 3: Run the PocketFlow
             logger.debug("summarize_project: Calling PocketFlow for LLM synthesis")
@@ -116,7 +114,7 @@ def register_summarize_project(mcp) -> None:
             # Step 4: Format and return the result
             output = [
                 f"# Project Summary: {project}\n",
-                f"**Source:** {len(memories)} memories analyzed\n",
+                f"**Source:** {len(packed.memories)} of {len(memories)} memories analyzed\n",
                 f"**Flow:** summarize_project_flow (PocketFlow)\n\n",
                 "---\n\n",
                 summary,
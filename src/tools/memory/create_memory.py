@@ -6,9 +6,9 @@ Phase 4 Enhancement: Added enhanced logging.
 """
 
 import logging
-from pydantic import Field
+from pydantic import Field, ValidationError
 
-from src.database.queries.memory import upsert_bubble
+from src.database.queries.memory import upsert_bubble, upsert_bubbles_batch
 from src.utils.schemas import BubbleCreate
 from src.utils.observability import instrument_mcp_tool
 
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 def register_create_memory(mcp) -> None:
-    """Register the create_memory tool with FastMCP."""
+    """Register the create_memory and create_memories tools with FastMCP."""
 
     @mcp.tool
     @instrument_mcp_tool("create_memory")
@@ -108,7 +108,7 @@ def register_create_memory(mcp) -> None:
 
             return (
                 f"Memory stored successfully!\n"
-                f"- Neo4j ID: {result.id}\n"
+                f"- ID: {result.id}\n"
                 f"- Sector: {result.sector}\n"
                 f"- Created: {result.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
                 f"- Salience: {result.salience}\n"
@@ -117,3 +117,66 @@ def register_create_memory(mcp) -> None:
         except Exception as e:
             logger.error(f"Failed to create memory: {e}")
             return f"Error storing memory: {str(e)}"
+
+    @mcp.tool
+    @instrument_mcp_tool("create_memories")
+    async def create_memories(
+        memories: list[dict] = Field(
+            description="Memories to store. Each item takes the same fields as create_memory: content and sector (required), plus optional source, salience, memory_type, activation_threshold, entities, observations"
+        ),
+        batch_size: int = Field(
+            default=100,
+            ge=1,
+            le=1000,
+            description="Memories written per database transaction (1-1000). Larger batches are faster for big imports"
+        ),
+    ) -> str:
+        """
+        Store many memories in one call.
+
+        **Use this for bulk imports** (e.g., a day's worth of meeting notes)
+        instead of calling create_memory repeatedly.
+
+        Each item is validated on its own: invalid items are reported and
+        skipped, valid items are stored. Items whose content matches an
+        existing memory (ignoring whitespace and case) update that memory
+        instead of creating a duplicate.
+
+        Example:
+        - memories: [
+            {"content": "Kickoff with FastTrack: scope agreed", "sector": "Episodic", "entities": ["FastTrack"]},
+            {"content": "FastTrack rate is €60/hour", "sector": "Semantic", "salience": 0.8, "memory_type": "instinctive"}
+          ]
+        """
+        try:
+            logger.info(f"Creating {len(memories)} memories (batch_size={batch_size})")
+
+            # Validate each item independently so one bad row doesn't fail the import
+            valid = []
+            errors = {}
+            for i, item in enumerate(memories):
+                try:
+                    valid.append((i, BubbleCreate(**item)))
+                except (ValidationError, TypeError) as e:
+                    errors[i] = str(e).splitlines()[0]
+
+            stored = await upsert_bubbles_batch([b for _, b in valid], batch_size=batch_size)
+            results = {i: bubble for (i, _), bubble in zip(valid, stored)}
+
+            logger.info(f"Bulk import complete: {len(results)} stored, {len(errors)} failed")
+
+            output = [f"Stored {len(results)} of {len(memories)} memories.\n"]
+            for i in range(len(memories)):
+                if i in results:
+                    result = results[i]
+                    output.append(
+                        f"{i + 1}. ID: {result.id} | Sector: {result.sector} | "
+                        f"{result.content[:60]}{'...' if len(result.content) > 60 else ''}"
+                    )
+                else:
+                    output.append(f"{i + 1}. Error: {errors[i]}")
+
+            return "\n".join(output)
+        except Exception as e:
+            logger.error(f"Failed to create memories: {e}")
+            return f"Error storing memories: {str(e)}"
@@ -7,7 +7,12 @@ import logging
 
 from pydantic import Field
 
-from src.database.queries.memory import delete_bubble, delete_all_bubbles, get_bubble_by_id
+from src.database.queries.memory import (
+    bubble_id_predicate,
+    delete_all_bubbles,
+    delete_bubble,
+    get_bubble_by_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +23,7 @@ def register_delete_memory(mcp) -> None:
     @mcp.tool
     async def delete_memory(
         bubble_id: str = Field(
-            description="Simple numeric Bubble ID (e.g., '4'). Get this from get_memory or get_all_memories results."
+            description="Bubble ID (e.g., '01927c3e-8f1a-7b2c-9d4e-5f6a7b8c9d0e'). Get this from get_memory or get_all_memories results."
         ),
         confirm: bool = Field(
             default=False,
@@ -31,9 +36,9 @@ def register_delete_memory(mcp) -> None:
         **DANGER**: This is a destructive operation. Use with caution.
 
         Finding Bubble IDs:
-        - Run get_all_memories() - IDs are simple numbers like "4"
+        - Run get_all_memories() - IDs are shown for every memory
         - Run get_memory(query="your search") - IDs shown in results
-        - Just use the numeric ID shown in the output
+        - Copy the ID exactly as shown (legacy numeric IDs still work)
 
         Soft Deletion:
         This uses soft deletion (sets valid_to timestamp) which:
@@ -53,8 +58,8 @@ def register_delete_memory(mcp) -> None:
         ✗ Bulk cleanup (use delete_all_memories with confirmation)
 
         Example Usage:
-        1. get_all_memories(limit=10) → Find ID: "4"
-        2. delete_memory(bubble_id="4", confirm=True) → Delete memory 4
+        1. get_all_memories(limit=10) → Find ID: "01927c3e-..."
+        2. delete_memory(bubble_id="01927c3e-...", confirm=True) → Delete that memory
 
         Returns:
         - Success: Confirmation with deleted memory content
@@ -67,7 +72,7 @@ def register_delete_memory(mcp) -> None:
 To prevent accidental deletion, you must set confirm=True:
 
 ```python
-delete_memory(bubble_id="4", confirm=True)
+delete_memory(bubble_id="<memory id>", confirm=True)
 ```
 
 This extra step ensures you really want to delete this memory.
@@ -75,40 +80,39 @@ This extra step ensures you really want to delete this memory.
 **To find bubble IDs**:
 - Use get_all_memories() to see all memories
 - Use get_memory(query="...") to search
-- Look for the simple numeric ID shown in results
+- Copy the ID shown in results
 """
 
         try:
-            # Extract numeric ID from various bubble_id formats
-            bubble_id_numeric = str(bubble_id).split(":")[0]
             try:
-                bubble_id_numeric = int(bubble_id_numeric)
+                bubble_id_predicate(bubble_id)
             except ValueError:
                 return f"""## Error
 
 Invalid bubble ID format: '{bubble_id}'
 
 **Expected format:**
-- Simple numeric ID like "4" or "123"
+- Memory ID like "01927c3e-8f1a-7b2c-9d4e-5f6a7b8c9d0e"
+- Legacy numeric IDs like "4" are still accepted
 
 **To find bubble IDs**:
 - Use get_memory to search for memories
 - Use get_all_memories to see all memories
-- Look for the simple numeric ID shown in the results
+- Copy the ID shown in the results
 """
 
             # First, retrieve the bubble to show what will be deleted
-            bubble = await get_bubble_by_id(bubble_id_numeric)
+            bubble = await get_bubble_by_id(bubble_id)
 
             if not bubble:
                 return f"""## Error
 
-No memory found with ID: {bubble_id_numeric}
+No memory found with ID: {bubble_id}
 
 **To find valid bubble IDs**:
 - Use get_memory to search for memories
 - Use get_all_memories to see all memories
-- Look for the numeric ID at the start of the element_id
+- Copy the ID shown in the results
 """
 
             # Store content for confirmation message
@@ -116,12 +120,12 @@ No memory found with ID: {bubble_id_numeric}
             sector = bubble.sector
 
             # Perform the deletion
-            deleted = await delete_bubble(bubble_id_numeric)
+            deleted = await delete_bubble(bubble.id)
 
             if deleted:
                 return f"""## Memory Deleted Successfully
 
-**ID**: {bubble_id_numeric}
+**ID**: {bubble.id}
 **Sector**: {sector}
 **Content**: {content_preview}{'...' if len(bubble.content) > 100 else ''}
 
@@ -129,7 +133,7 @@ The memory has been soft-deleted (valid_to timestamp set).
 Audit trail is preserved in the database.
 """
             else:
-                return f"## Error: Failed to delete memory with ID {bubble_id_numeric}"
+                return f"## Error: Failed to delete memory with ID {bubble.id}"
 
         except Exception as e:
             logger.error(f"Failed to delete memory: {e}", exc_info=True)
@@ -154,9 +158,8 @@ Audit trail is preserved in the database.
         """
         try:
             # First, get count of memories to be deleted
-            from src.database.queries.memory import get_all_bubbles
-            existing_memories = await get_all_bubbles(limit=1000)
-            count = len(existing_memories)
+            from src.database.queries.memory import get_bubble_count
+            count = await get_bubble_count()
 
             if count == 0:
                 return """## No Memories to Delete
@@ -6,12 +6,18 @@ Phase 4 Enhancement: Added enhanced logging.
 """
 
 import logging
+from typing import Optional
+
 from pydantic import Field
 
-from src.database.queries.memory import search_bubbles, get_all_bubbles
+from src.database.queries.memory import get_bubbles_page, get_memory_stats, search_bubbles_page
 
 logger = logging.getLogger(__name__)
 
+# Bubble properties rendered by each tool (skips entities/observations on the wire)
+LISTING_FIELDS = ("content", "sector", "source", "salience", "created_at")
+OVERVIEW_FIELDS = ("content", "sector", "salience", "created_at")
+
 
 def register_get_memory(mcp) -> None:
     """Register the memory retrieval tools with FastMCP."""
@@ -27,6 +33,10 @@ def register_get_memory(mcp) -> None:
             le=200,
             description="Maximum results (1-200). Use 5-10 for specific lookups, 20-50 for broader searches"
         ),
+        cursor: Optional[str] = Field(
+            default=None,
+            description="Cursor from a previous get_memory call (shown as 'Next cursor') to fetch the next page of results"
+        ),
     ) -> str:
         """
         Quick keyword search for memories.
@@ -48,14 +58,20 @@ def register_get_memory(mcp) -> None:
 
         Output:
         - Returns memories matching your query
-        - Ordered by recency (newest first)
+        - Ordered by relevance (best match first)
         - Shows sector, salience, created date, source
+        - Ends with a "Next cursor" when more results exist; pass it as
+          cursor with the same query to get the next page
         """
         try:
             # Phase 4: Enhanced logging
-            logger.debug(f"get_memory: Searching for '{query}' (limit={limit})")
+            logger.debug(f"get_memory: Searching for '{query}' (limit={limit}, cursor={cursor})")
 
-            results = await search_bubbles(query, limit)
+            try:
+                page = await search_bubbles_page(query, limit, cursor=cursor, fields=LISTING_FIELDS)
+            except ValueError as e:
+                return f"Error: {e}. Omit cursor to start from the first page."
+            results = page.bubbles
 
             if not results:
                 logger.warning(f"No memories found matching query: '{query}'")
@@ -73,6 +89,9 @@ def register_get_memory(mcp) -> None:
                     f"   Content: {bubble.content}"
                 )
 
+            if page.next_cursor:
+                output.append(f"\nNext cursor: {page.next_cursor}")
+
             return "\n".join(output)
         except Exception as e:
             logger.error(f"Failed to retrieve memory: {e}")
@@ -86,6 +105,10 @@ def register_get_memory(mcp) -> None:
             le=200,
             description="Maximum memories to return (1-200). Use 20-50 for recent overview, 100+ for comprehensive review"
         ),
+        cursor: Optional[str] = Field(
+            default=None,
+            description="Cursor from a previous get_all_memories call (shown as 'Next cursor') to list older memories"
+        ),
     ) -> str:
         """
         Complete overview with statistics and sector distribution.
@@ -96,7 +119,8 @@ def register_get_memory(mcp) -> None:
         - Total memory count
         - Sector distribution with percentages
         - Visual ASCII bar chart
-        - Recent memories list
+        - Recent memories list (pass the returned "Next cursor" as cursor
+          to page through older memories)
 
         When to Use This:
         ✓ Starting work on a project (get context)
@@ -118,32 +142,35 @@ def register_get_memory(mcp) -> None:
         """
         try:
             # Phase 4: Enhanced logging
-            logger.debug(f"get_all_memories: Retrieving all memories (limit={limit})")
+            logger.debug(f"get_all_memories: Retrieving all memories (limit={limit}, cursor={cursor})")
 
-            results = await get_all_bubbles(limit)
+            # Statistics cover the whole graph; only the listing is limited
+            stats = await get_memory_stats()
 
-            if not results:
+            if stats.total == 0:
                 logger.warning("No memories stored yet")
                 return "No memories stored yet. Use create_memory to store your first memory."
 
-            logger.info(f"Retrieved {len(results)} memories")
+            try:
+                page = await get_bubbles_page(limit, cursor=cursor, fields=OVERVIEW_FIELDS)
+            except ValueError as e:
+                return f"Error: {e}. Omit cursor to start from the first page."
+            results = page.bubbles
 
-            # Group by sector for summary
-            sector_counts = {}
-            for bubble in results:
-                sector_counts[bubble.sector] = sector_counts.get(bubble.sector, 0) + 1
+            logger.info(f"Retrieved {len(results)} of {stats.total} memories")
 
             output = [
-                f"[STATS] Total Memories: {len(results)}\n",
+                f"[STATS] Total Memories: {stats.total}\n",
                 f"[SECTORS] Sector Distribution:\n",
             ]
-            for sector, count in sorted(sector_counts.items()):
-                percentage = (count / len(results)) * 100
+            for sector, sector_stats in sorted(stats.sectors.items()):
+                count = sector_stats.count
+                percentage = (count / stats.total) * 100
                 bar = "#" * int(percentage / 5)
                 output.append(f"  {sector:12} | {bar} {count} ({percentage:.1f}%)\n")
 
             output.append(f"\n{'-' * 60}\n")
-            output.append("Recent Memories:\n\n")
+            output.append(f"Recent Memories ({len(results)} of {stats.total}):\n\n")
 
             for i, bubble in enumerate(results, 1):
                 output.append(
@@ -152,6 +179,9 @@ def register_get_memory(mcp) -> None:
                     f"   Content: {bubble.content[:100]}{'...' if len(bubble.content) > 100 else ''}\n"
                 )
 
+            if page.next_cursor:
+                output.append(f"Next cursor: {page.next_cursor}\n")
+
             return "\n".join(output)
         except Exception as e:
             logger.error(f"Failed to retrieve all memories: {e}")
@@ -9,12 +9,12 @@ Provides natural language Q&A interface to your memories.
 import logging
 from typing import Optional
 
+from fastmcp import Context
 from pydantic import Field
 
 from src.database.connection import get_driver
 from src.flows.query_memories import (
-    query_analysis_node,
-    hybrid_retrieval_node,
+    analyze_and_retrieve,
     reflection_node,
     answer_synthesis_node
 )
@@ -34,6 +34,7 @@ def register_query_memories(mcp) -> None:
             default=[],
             description="Recent messages for context (helps with pronouns like 'it', 'they', 'we'). Up to last 5 messages."
         ),
+        ctx: Context = None,
     ) -> str:
         """
         AI-powered Q&A with reasoning and confidence scores.
@@ -61,7 +62,8 @@ def register_query_memories(mcp) -> None:
         - Confidence: Score from 0.0-1.0 with label (Very Confident → Uncertain)
         - Sources: Number of memories used
 
-        Speed: ~2-6 seconds (uses LLM for synthesis)
+        Speed: ~2-6 seconds (uses LLM for synthesis). The answer streams as
+        progress notifications while it is generated.
         """
         try:
             # Phase 4: Enhanced logging
@@ -74,19 +76,11 @@ def register_query_memories(mcp) -> None:
                 "neo4j_driver": get_driver()
             }
 
-            # Step 1: Query Analysis
-            logger.info("Step 1: Analyzing query...")
-            analysis_result = await query_analysis_node.exec_async((query, conversation_history))
+            # Steps 1-2: Query Analysis and Hybrid Retrieval (speculatively in parallel)
+            logger.info("Steps 1-2: Analyzing query and retrieving memories...")
+            analysis_result, retrieved = await analyze_and_retrieve(query, conversation_history)
             shared["query_analysis"] = analysis_result
             shared["original_query"] = query
-
-            # Step 2: Hybrid Retrieval
-            logger.info("Step 2: Retrieving memories...")
-            concepts = analysis_result.get("key_concepts", [])
-            entities = analysis_result.get("extracted_entities", [])
-            search_terms = " ".join([query] + concepts + entities)
-
-            retrieved = await hybrid_retrieval_node.exec_async(search_terms)
             shared["retrieved_memories"] = retrieved
             shared["initial_result_count"] = len(retrieved)
 
@@ -98,15 +92,12 @@ def register_query_memories(mcp) -> None:
 
                 if reflection_result:
                     # Retrieve additional memories
-                    from src.database.queries.memory import search_bubbles
-                    all_additional = []
-                    for concept in reflection_result[:3]:
-                        results = await search_bubbles(query=concept, limit=5)
-                        all_additional.extend(results)
+                    from src.database.queries.memory import search_bubbles_multi
+                    matches = await search_bubbles_multi(reflection_result[:3], limit_per_term=5)
 
                     # Remove duplicates
                     existing_ids = {m.id for m in retrieved}
-                    additional = [m for m in all_additional if m.id not in existing_ids]
+                    additional = [m for m, _ in matches if m.id not in existing_ids]
                     shared["reflection_memories"] = additional
                     retrieved.extend(additional)
                     logger.info(f"Reflection added {len(additional)} memories")
@@ -114,13 +105,21 @@ def register_query_memories(mcp) -> None:
                 logger.info("Step 3: Skipped (sufficient results)")
                 shared["reflection_memories"] = []
 
-            # Step 4: Answer Synthesis
+            # Step 4: Answer Synthesis (streamed as progress notifications)
             logger.info("Step 4: Synthesizing answer...")
-            result = await answer_synthesis_node.exec_async((
+            updates = 0
+
+            async def report_partial_answer(answer: str) -> None:
+                nonlocal updates
+                updates += 1
+                await ctx.report_progress(progress=updates, message=answer)
+
+            result = await answer_synthesis_node.synthesize(
                 query,
                 analysis_result,
-                retrieved
-            ))
+                retrieved,
+                on_partial=report_partial_answer if ctx is not None else None
+            )
 
             # Format the output
             output = format_query_result(result, query)
@@ -19,7 +19,7 @@ def register_update_memory_observations(mcp) -> None:
     @instrument_mcp_tool("update_memory_observations")
     async def update_memory_observations(
         memory_id: str = Field(
-            description="The numeric Neo4j ID of the memory to update"
+            description="Memory ID (uid) of the memory to update, as shown by get_memory or get_all_memories"
         ),
         observations: list[str] = Field(
             description="Updated observations list"
@@ -52,17 +52,20 @@ def register_update_memory_observations(mcp) -> None:
         try:
             logger.debug(f"update_memory_observations: Updating memory {memory_id}")
 
-            result = await update_bubble_observations(
-                bubble_id=memory_id,
-                observations=observations,
-                append=append
-            )
+            try:
+                result = await update_bubble_observations(
+                    bubble_id=memory_id,
+                    observations=observations,
+                    append=append
+                )
+            except ValueError as e:
+                return f"Error: {e}"
 
             if result:
                 mode = "appended to" if append else "updated"
                 return (
                     f"Memory observations {mode} successfully!\n"
-                    f"- Neo4j ID: {result.id}\n"
+                    f"- ID: {result.id}\n"
                     f"- Content: {result.content[:50]}{'...' if len(result.content) > 50 else ''}\n"
                     f"- Total observations: {len(result.observations)}"
                 )
@@ -3,11 +3,13 @@ Visualize Relations Tool.
 MCP tool for visualizing relationships between bubbles as Mermaid diagrams.
 """
 
+import json
 import logging
 
 from pydantic import Field
 
-from src.database.connection import get_driver
+from src.database.connection import get_driver, session_defaults
+from src.database.queries.memory import bubble_id_predicate
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +20,7 @@ def register_visualize_relations(mcp) -> None:
     @mcp.tool
     async def visualize_relations(
         bubble_id: str = Field(
-            description="Simple numeric Bubble ID (e.g., '4'). Get this from get_memory or get_all_memories results."
+            description="Bubble ID (e.g., '01927c3e-8f1a-7b2c-9d4e-5f6a7b8c9d0e'). Get this from get_memory or get_all_memories results."
         ),
         depth: int = Field(
             default=2,
@@ -37,9 +39,9 @@ def register_visualize_relations(mcp) -> None:
         **Use this to understand knowledge clusters and explore relationships.**
 
         Finding Bubble IDs:
-        - Run get_all_memories() - IDs are simple numbers like "4"
+        - Run get_all_memories() - IDs are shown for every memory
         - Run get_memory(query="your search") - IDs shown in results
-        - Just use the numeric ID shown in the output
+        - Copy the ID exactly as shown (legacy numeric IDs still work)
 
         Relationship Types:
         - **explains**: Rationale or justification
@@ -63,29 +65,30 @@ def register_visualize_relations(mcp) -> None:
         - **neo4j**: Cypher query for Neo4j Browser at http://localhost:7474
 
         Example Usage:
-        1. get_all_memories(limit=10) → Find ID: "4"
-        2. visualize_relations(bubble_id="4", depth=2) → See connections
-        3. visualize_relations(bubble_id="4", format="neo4j") → Explore interactively
+        1. get_all_memories(limit=10) → Find ID: "01927c3e-..."
+        2. visualize_relations(bubble_id="01927c3e-...", depth=2) → See connections
+        3. visualize_relations(bubble_id="01927c3e-...", format="neo4j") → Explore interactively
         """
         try:
-            # Extract numeric ID from various bubble_id formats
-            # Handles: "4", "4:abc123:14", "4:abc123-def456:14", etc.
-            bubble_id_numeric = str(bubble_id).split(":")[0]
+            # Accepts uids plus legacy numeric ("4") and element ("4:abc123:14") IDs
             try:
-                bubble_id_numeric = int(bubble_id_numeric)
+                predicate, bubble_ref = bubble_id_predicate(bubble_id)
             except ValueError:
                 return f"""## Error
 
 Invalid bubble ID format: '{bubble_id}'
 
 **Expected format:**
-- Simple numeric ID like "4" or "123"
+- Memory ID like "01927c3e-8f1a-7b2c-9d4e-5f6a7b8c9d0e"
+- Legacy numeric IDs like "4" are still accepted
 
 **To find bubble IDs**:
 - Use get_memory to search for memories
 - Use get_all_memories to see all memories
-- Look for the simple numeric ID shown in the results
+- Copy the ID shown in the results
 """
+            # Same lookup with the ID inlined, for pasting into Neo4j Browser
+            browser_predicate = predicate.replace("$bubble_ref", json.dumps(bubble_ref))
 
             driver = await get_driver()
 
@@ -93,7 +96,7 @@ Invalid bubble ID format: '{bubble_id}'
                 # Return Neo4j Browser query format
                 return f"""## Neo4j Browser Visualization
 
-**Bubble ID**: {bubble_id_numeric}
+**Bubble ID**: {bubble_id}
 **Depth**: {depth} hops
 
 ### Neo4j Browser Query
@@ -102,7 +105,7 @@ Copy this into Neo4j Browser (http://localhost:7474):
 
 ```cypher
 MATCH path = (b:Bubble) -[*1..{depth}] - (related:Bubble)
-WHERE id(b) = {bubble_id_numeric}
+WHERE {browser_predicate}
 AND b.valid_to IS NULL
 AND related.valid_to IS NULL
 RETURN path
@@ -113,32 +116,33 @@ This will show an interactive graph with all connected memories.
             else:
                 # Mermaid format - query Neo4j for relationships
                 # Simplified query: only direct relationships (depth 1)
-                query = """
+                center_predicate, _ = bubble_id_predicate(bubble_id, alias="center")
+                query = f"""
                     MATCH (center:Bubble)
-                    WHERE id(center) = $bubble_id
+                    WHERE {center_predicate}
                     AND center.valid_to IS NULL
                     OPTIONAL MATCH (center)-[r:LINKED]->(related:Bubble)
                     WHERE related.valid_to IS NULL
-                    RETURN center,
-                           collect(DISTINCT {
-                               bubble: related,
+                    RETURN center {{.uid, .content}} as center,
+                           collect(DISTINCT {{
+                               bubble: related {{.uid, .content}},
                                relation_type: r.type
-                           }) as connections
+                           }}) as connections
                 """
 
-                async with driver.session() as session:
-                    result = await session.run(query, bubble_id=bubble_id_numeric)
+                async with driver.session(**session_defaults()) as session:
+                    result = await session.run(query, bubble_ref=bubble_ref)
                     record = await result.single()
 
                     if not record:
                         return f"""## Error
 
-No bubble found with ID: {bubble_id_numeric}
+No bubble found with ID: {bubble_id}
 
 **To find bubble IDs**:
 - Use get_memory to search for memories
 - Use get_all_memories to see all memories
-- Look for the simple numeric ID shown in the results
+- Copy the ID shown in the results
 """
                     center = dict(record["center"])
                     connections = record["connections"]
@@ -176,14 +180,15 @@ To manually explore in Neo4j Browser (http://localhost:7474):
 
 ```cypher
 MATCH (b:Bubble)
-WHERE id(b) = {bubble_id}
+WHERE {browser_predicate}
 RETURN b
 ```
 """
 
                     # Center node
+                    mermaid = "graph LR\n"
                     center_content = center.get("content", "")[:30]
-                    center_label = f"{bubble_id_numeric}: {center_content}..."
+                    center_label = f"{str(center.get('uid', bubble_id))[:8]}: {center_content}..."
                     mermaid += f'    B1["{center_label}"]\n'
 
                     # Connection nodes
@@ -193,7 +198,7 @@ RETURN b
 
                         node_id = f"B{i}"
                         content = bubble.get("content", "")[:30]
-                        label = f"{str(bubble.element_id)[:8]}: {content}..."
+                        label = f"{str(bubble.get('uid', ''))[:8]}: {content}..."
                         mermaid += f'    {node_id}["{label}"]\n'
                         mermaid += f'    B1 -->|{relation or "relates"}| {node_id}\n'
 
@@ -216,25 +221,13 @@ For interactive exploration, copy this into Neo4j Browser:
 
 ```cypher
 MATCH path = (b:Bubble) -[*1..{depth}] - (related:Bubble)
-WHERE id(b) = {bubble_id}
+WHERE {browser_predicate}
 AND b.valid_to IS NULL
 AND related.valid_to IS NULL
 RETURN path
 ```
 """
 
-        except ValueError as e:
-            # Handle invalid bubble_id format
-            return f"""## Error
-
-Invalid bubble ID format: {bubble_id}
-
-**Bubble IDs must be numeric** (e.g., "4", "123").
-
-**To find valid bubble IDs**:
-- Use get_memory to search for memories
-- The ID is shown in the results
-"""
         except Exception as e:
             logger.error(f"Failed to visualize relations: {e}", exc_info=True)
             return f"Error visualizing relations: {str(e)}"
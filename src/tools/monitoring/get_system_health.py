@@ -10,8 +10,9 @@ from datetime import datetime
 
 from pydantic import Field
 
-from src.database.connection import get_driver
-from src.database.queries.memory import get_all_bubbles
+from src.core.config import neo4j as neo4j_config
+from src.database.connection import get_connection
+from src.database.queries.memory import get_memory_stats
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,7 @@ def register_get_system_health(mcp) -> None:
 
         This tool provides:
         - Neo4j database status and response time
+        - Connection pool utilization (in use, idle, acquisition time)
         - Total memory count
         - LLM provider health (Groq, OpenRouter)
         - System uptime
@@ -58,6 +60,10 @@ def register_get_system_health(mcp) -> None:
             "openrouter": {"status": "configured", "note": "API key configured"}
         }
 
+        # LLM response cache effectiveness
+        from src.utils.llm_cache import llm_cache_stats
+        health["llm_cache"] = llm_cache_stats()
+
         # Get memory statistics
         health["memory_stats"] = await get_memory_statistics()
 
@@ -68,26 +74,34 @@ def register_get_system_health(mcp) -> None:
 
 
 async def check_neo4j_health() -> dict:
-    """Check Neo4j connectivity and response time."""
+    """Check Neo4j connectivity, response time and pool utilization."""
     try:
-        driver = await get_driver()
+        conn = await get_connection()
+
+        # Time to get a live pooled connection; rises when callers queue for the pool
+        acquisition = await conn.measure_acquisition()
+
         start = time.time()
 
-        async with driver.session() as session:
+        async with conn.session() as session:
             result = await session.run("RETURN 1 as test")
             await result.single()
 
         latency = (time.time() - start) * 1000
 
         # Get total memory count
-        count = await get_total_memory_count(driver)
+        count = await get_total_memory_count(conn)
 
         logger.info(f"Neo4j health check: {latency:.1f}ms latency, {count} memories")
 
         return {
             "status": "healthy",
             "latency_ms": round(latency, 1),
-            "total_memories": count
+            "total_memories": count,
+            "pool": {
+                **conn.pool_metrics(),
+                "acquisition_ms": round(acquisition, 1)
+            }
         }
     except Exception as e:
         logger.error(f"Neo4j health check failed: {e}")
@@ -97,10 +111,10 @@ async def check_neo4j_health() -> dict:
         }
 
 
-async def get_total_memory_count(driver) -> int:
+async def get_total_memory_count(conn) -> int:
     """Get total memory count from Neo4j."""
     try:
-        async with driver.session() as session:
+        async with conn.session() as session:
             result = await session.run("""
                 MATCH (b:Bubble)
                 WHERE b.valid_to IS NULL
@@ -116,16 +130,11 @@ async def get_total_memory_count(driver) -> int:
 async def get_memory_statistics() -> dict:
     """Get memory statistics by sector."""
     try:
-        memories = await get_all_bubbles(1000)
-
-        sector_counts = {}
-        for memory in memories:
-            sector = memory.sector
-            sector_counts[sector] = sector_counts.get(sector, 0) + 1
+        stats = await get_memory_stats()
 
         return {
-            "total": len(memories),
-            "by_sector": sector_counts
+            "total": stats.total,
+            "by_sector": {sector: s.count for sector, s in stats.sectors.items()}
         }
     except Exception as e:
         logger.error(f"Failed to get memory statistics: {e}")
@@ -154,9 +163,17 @@ def format_health_report(health: dict) -> str:
     if neo4j.get("status") == "healthy":
         lines.append("### Neo4j Database")
         lines.append(f"  Status: ✓ Healthy")
-        lines.append(f"  Connection: bolt://localhost:7687")
+        lines.append(f"  Connection: {neo4j_config.uri}")
         lines.append(f"  Total Memories: {neo4j.get('total_memories', 0)}")
         lines.append(f"  Response Time: {neo4j.get('latency_ms', 0)}ms")
+        pool = neo4j.get("pool", {})
+        if pool:
+            def _count(value):
+                return "n/a" if value is None else value
+            lines.append("  Connection Pool:")
+            lines.append(f"    In Use: {_count(pool.get('in_use'))} / {_count(pool.get('max_size'))}")
+            lines.append(f"    Idle: {_count(pool.get('idle'))}")
+            lines.append(f"    Acquisition Time: {pool.get('acquisition_ms', 0)}ms")
     else:
         lines.append("### Neo4j Database")
         lines.append(f"  Status: ✗ Unhealthy")
@@ -170,6 +187,13 @@ def format_health_report(health: dict) -> str:
     for provider, status in llm.items():
         icon = "✓" if status.get("status") == "configured" else "✗"
         lines.append(f"  {icon} {provider.title()}: {status.get('note', 'Unknown')}")
+    cache = health.get("llm_cache")
+    if cache:
+        lines.append(
+            f"  Response Cache ({cache['backend']}): {cache['hits']} hits, "
+            f"{cache['misses']} misses, {cache['bypassed']} bypassed "
+            f"(hit rate {cache['hit_rate']:.0%})"
+        )
 
     lines.append("")
 
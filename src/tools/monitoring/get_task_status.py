@@ -66,11 +66,15 @@ def format_all_tasks_report(tasks: list) -> str:
         lines.append(f"**Schedule**: Every {task['interval']}")
         lines.append(f"**Last Run**: {task['last_run']}")
         lines.append(f"**Next Run**: {task['next_run']}")
+        if task.get("last_duration") is not None:
+            lines.append(f"**Last Duration**: {task['last_duration']}s")
+        if task.get("last_error"):
+            lines.append(f"**Last Error**: {task['last_error']}")
         lines.append(f"**Description**: {task['description']}")
         lines.append("")
 
     lines.append("**Notes:**")
-    lines.append("- Tasks run automatically in the background")
+    lines.append("- Tasks run automatically in the background (times are UTC)")
     lines.append("- Synaptic pruning reduces salience of memories not accessed in 30+ days")
     lines.append("- Cloud synthesis generates Reflective insights from memory clusters")
     lines.append("- Health check monitors Neo4j and LLM API availability")
@@ -96,6 +100,11 @@ def format_single_task_report(task: dict) -> str:
     if task.get("last_run") and task["last_run"] != "Never":
         lines.append("")
         lines.append("**Recent History:**")
-        lines.append(f"  Last run completed successfully")
+        if task.get("last_error"):
+            lines.append(f"  Last run failed: {task['last_error']}")
+        else:
+            lines.append(f"  Last run completed successfully")
+        if task.get("last_duration") is not None:
+            lines.append(f"  Duration: {task['last_duration']}s")
 
     return "\n".join(lines)
@@ -0,0 +1,250 @@
+"""
+Token-budgeted context packing for LLM prompts.
+
+Synthesis prompts are built from retrieved memories. Instead of taking the
+first N memories verbatim, pack_memories ranks them by relevance x salience,
+drops near-identical ones, and fits as many as possible into a token budget,
+truncating the last one that only partly fits.
+
+Token counts come from tiktoken when it is installed, otherwise from a
+characters-per-token heuristic.
+
+Usage:
+    from src.utils.context_packing import pack_memories, prompt_budget
+
+    packed = pack_memories(
+        memories,
+        budget_tokens=prompt_budget(model),
+        render=lambda i, m, content: f"[{i}] {m.sector}: {content}",
+        query=query,
+    )
+    prompt_context = packed.text()
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # ImportError, or the encoding could not be loaded
+    _ENCODING = None
+
+logger = logging.getLogger(__name__)
+
+# Average characters per token for English text (heuristic fallback)
+CHARS_PER_TOKEN = 4
+
+# Memory-context token budget per model family, matched by substring
+MODEL_CONTEXT_BUDGETS = {
+    "claude": 6000,
+    "gpt-4": 6000,
+    "gpt-oss": 4000,
+    "llama": 3000,
+}
+
+# Budget for models not listed above (override with BRAINOS_CONTEXT_BUDGET)
+DEFAULT_CONTEXT_BUDGET = 4000
+
+# Marker appended to truncated memory content
+TRUNCATION_MARKER = "..."
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text.
+
+    Uses the cl100k_base tokenizer when tiktoken is available, otherwise
+    CHARS_PER_TOKEN characters per token (rounded up).
+    """
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def prompt_budget(model: Optional[str] = None) -> int:
+    """
+    Get the memory-context token budget for a model.
+
+    Args:
+        model: Model name, e.g. "anthropic/claude-sonnet-4"
+
+    Returns:
+        BRAINOS_CONTEXT_BUDGET if set, else the budget of the model's family
+        in MODEL_CONTEXT_BUDGETS, else DEFAULT_CONTEXT_BUDGET
+    """
+    override = os.getenv("BRAINOS_CONTEXT_BUDGET")
+    if override:
+        return int(override)
+    name = (model or "").lower()
+    for family, budget in MODEL_CONTEXT_BUDGETS.items():
+        if family in name:
+            return budget
+    return DEFAULT_CONTEXT_BUDGET
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to about max_tokens, cutting at a word boundary.
+
+    Returns:
+        The text unchanged if it fits, else a prefix ending in TRUNCATION_MARKER
+        (empty if max_tokens leaves no room)
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    room = max_tokens - estimate_tokens(TRUNCATION_MARKER)
+    if room <= 0:
+        return ""
+    # Start from the heuristic length, then shrink until the estimate fits
+    cut = text[:room * CHARS_PER_TOKEN]
+    while cut and estimate_tokens(cut) > room:
+        cut = cut[:int(len(cut) * 0.9)]
+    if " " in cut:
+        cut = cut[:cut.rindex(" ")]
+    return cut.rstrip() + TRUNCATION_MARKER if cut else ""
+
+
+def _field(memory: Any, name: str, default=None):
+    """Read a field from a BubbleResponse-like object or a dict."""
+    if isinstance(memory, dict):
+        return memory.get(name, default)
+    return getattr(memory, name, default)
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def _similarity(a: set[str], b: set[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class PackedContext:
+    """Memories selected for a prompt, in prompt order."""
+
+    memories: list = field(default_factory=list)
+    """Selected memories, highest score first"""
+
+    texts: list[str] = field(default_factory=list)
+    """Rendered text of each selected memory"""
+
+    tokens: int = 0
+    """Estimated tokens of the rendered texts"""
+
+    duplicates: int = 0
+    """Memories dropped as near-identical to a higher-ranked one"""
+
+    dropped: int = 0
+    """Memories dropped for lack of budget"""
+
+    truncated: int = 0
+    """Selected memories whose content was truncated"""
+
+    def text(self, separator: str = "\n") -> str:
+        """Join the rendered memories into prompt text."""
+        return separator.join(self.texts)
+
+
+def pack_memories(
+    memories: Sequence[Any],
+    budget_tokens: int,
+    render: Callable[[int, Any, str], str],
+    query: Optional[str] = None,
+    max_items: Optional[int] = None,
+    dedupe_threshold: float = 0.85,
+    min_truncated_tokens: int = 32
+) -> PackedContext:
+    """
+    Select and render memories to fit a token budget.
+
+    Memories are ranked by relevance x salience. Relevance blends retrieval
+    rank (input order) with the share of query words the memory contains,
+    when a query is given. A memory whose words overlap a higher-ranked one
+    by dedupe_threshold or more (Jaccard) is dropped. Memories are then
+    added in rank order while they fit; the first one that does not fit is
+    truncated if at least min_truncated_tokens of content still fit, and
+    smaller lower-ranked memories may still fill the remaining budget.
+
+    Args:
+        memories: BubbleResponse objects or dicts with content and salience
+        budget_tokens: Token budget for all rendered memories together
+        render: Builds the prompt text of a memory from (original index,
+            memory, content); content may be truncated
+        query: Optional query used to score relevance
+        max_items: Optional maximum number of memories
+        dedupe_threshold: Word-set similarity at which memories count as duplicates
+        min_truncated_tokens: Smallest content worth including in truncated form
+
+    Returns:
+        PackedContext with the selected memories in rank order
+    """
+    packed = PackedContext()
+    if not memories or budget_tokens <= 0:
+        packed.dropped = len(memories)
+        return packed
+
+    query_words = _words(query) if query else set()
+    total = len(memories)
+
+    scored = []
+    for index, memory in enumerate(memories):
+        content = _field(memory, "content") or ""
+        words = _words(content)
+        relevance = 1.0 - index / total
+        if query_words:
+            relevance = 0.5 * relevance + 0.5 * len(query_words & words) / len(query_words)
+        salience = _field(memory, "salience")
+        score = max(relevance, 0.05) * (salience if salience is not None else 0.5)
+        scored.append((score, index, memory, content, words))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+
+    kept_words: list[set[str]] = []
+    remaining = budget_tokens
+    for score, index, memory, content, words in scored:
+        if max_items is not None and len(packed.memories) >= max_items:
+            packed.dropped += 1
+            continue
+        if any(_similarity(words, other) >= dedupe_threshold for other in kept_words):
+            packed.duplicates += 1
+            continue
+
+        text = render(index, memory, content)
+        tokens = estimate_tokens(text)
+        if tokens > remaining:
+            overhead = tokens - estimate_tokens(content)
+            room = remaining - overhead
+            shortened = truncate_to_tokens(content, room) if room >= min_truncated_tokens else ""
+            if not shortened:
+                packed.dropped += 1
+                continue
+            text = render(index, memory, shortened)
+            tokens = estimate_tokens(text)
+            if tokens > remaining:
+                packed.dropped += 1
+                continue
+            packed.truncated += 1
+
+        packed.memories.append(memory)
+        packed.texts.append(text)
+        packed.tokens += tokens
+        kept_words.append(words)
+        remaining -= tokens
+
+    logger.debug(
+        f"Packed {len(packed.memories)}/{total} memories into {packed.tokens}/{budget_tokens} tokens "
+        f"({packed.duplicates} duplicates, {packed.dropped} dropped, {packed.truncated} truncated)"
+    )
+    return packed
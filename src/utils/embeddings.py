@@ -0,0 +1,165 @@
+"""
+Text embeddings for semantic memory retrieval.
+
+Embedders run locally on the CPU, so storing and searching memories needs
+no embedding API. The backend is pluggable:
+
+    hashing: Feature-hashed word and character-trigram vectors (default).
+        Dependency-free and deterministic; captures lexical and
+        morphological similarity (plural/singular, typos, word order).
+    sentence-transformers: Any sentence-transformers model, e.g.
+        all-MiniLM-L6-v2 (384 dimensions). Captures real semantic
+        similarity; requires `uv add sentence-transformers`.
+    off: No embeddings; retrieval is keyword-only.
+
+BRAINOS_EMBEDDING_DIMENSIONS must match the model's output size, since the
+Neo4j vector index is created with it.
+
+Usage:
+    from src.utils.embeddings import embed_texts
+
+    vectors = await embed_texts(["Alice chose PostgreSQL"])  # None when off
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class EmbeddingConfig:
+    """Embedding model configuration."""
+
+    backend: str
+    model: str
+    dimensions: int
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingConfig":
+        """Load configuration from environment variables."""
+        return cls(
+            backend=os.getenv("BRAINOS_EMBEDDING_BACKEND", "hashing").lower(),
+            model=os.getenv("BRAINOS_EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+            dimensions=int(os.getenv("BRAINOS_EMBEDDING_DIMENSIONS", "256")),
+        )
+
+
+class HashingEmbedder:
+    """
+    Embeds text by feature hashing words and character trigrams.
+
+    Each feature is hashed to a signed bucket of a fixed-size vector; the
+    vector is L2-normalized so cosine similarity measures feature overlap.
+    """
+
+    def __init__(self, dimensions: int = 256, trigram_weight: float = 0.5):
+        self.dimensions = dimensions
+        self.trigram_weight = trigram_weight
+
+    def _add(self, vector: list[float], feature: str, weight: float) -> None:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        sign = 1.0 if value >> 63 else -1.0
+        vector[value % self.dimensions] += sign * weight
+
+    def embed_one(self, text: str) -> list[float]:
+        vector = [0.0] * self.dimensions
+        for word in _WORD_RE.findall(text.lower()):
+            self._add(vector, word, 1.0)
+            padded = f" {word} "
+            for i in range(len(padded) - 2):
+                self._add(vector, "#" + padded[i:i + 3], self.trigram_weight)
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else vector
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        return [self.embed_one(text) for text in texts]
+
+
+class SentenceTransformerEmbedder:
+    """Embeds text with a local sentence-transformers model."""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name, device="cpu")
+        self.dimensions = self._model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        vectors = self._model.encode(list(texts), normalize_embeddings=True)
+        return [vector.tolist() for vector in vectors]
+
+
+# Serializes the first load, so concurrent callers load the model once
+_load_lock = asyncio.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """
+    Get the configured embedder.
+
+    The first call loads the model, which can take seconds; async code
+    should use load_embedder() instead.
+
+    Returns:
+        Embedder with .dimensions and .embed(texts), or None if embeddings
+        are disabled or the configured model cannot be loaded
+    """
+    config = EmbeddingConfig.from_env()
+    if config.backend == "off":
+        return None
+    if config.backend == "sentence-transformers":
+        try:
+            embedder = SentenceTransformerEmbedder(config.model)
+        except Exception as e:
+            logger.warning(f"Could not load embedding model {config.model}, embeddings disabled: {e}")
+            return None
+        if embedder.dimensions != config.dimensions:
+            logger.warning(
+                f"Embedding model {config.model} has {embedder.dimensions} dimensions but "
+                f"BRAINOS_EMBEDDING_DIMENSIONS is {config.dimensions}; embeddings disabled"
+            )
+            return None
+        return embedder
+    return HashingEmbedder(config.dimensions)
+
+
+async def load_embedder():
+    """
+    Get the configured embedder, loading it in a worker thread on first use.
+
+    Returns:
+        Embedder, or None if embeddings are disabled (see get_embedder)
+    """
+    if get_embedder.cache_info().currsize:
+        return get_embedder()
+    async with _load_lock:
+        return await asyncio.to_thread(get_embedder)
+
+
+async def embed_texts(texts: Sequence[str]) -> Optional[list[list[float]]]:
+    """
+    Embed texts off the event loop.
+
+    Returns:
+        One vector per text, or None if embeddings are disabled or failed
+    """
+    embedder = await load_embedder()
+    if embedder is None or not texts:
+        return None
+    try:
+        return await asyncio.to_thread(embedder.embed, list(texts))
+    except Exception as e:
+        logger.warning(f"Embedding failed: {e}")
+        return None
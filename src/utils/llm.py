@@ -7,16 +7,18 @@ Usage:
 
     # Fast classification (~100ms)
     groq = get_groq_client()
-    response = groq.chat.completions.create(...)
+    response = await groq.chat.completions.create(...)
 
     # Deep thinking (~3-10s)
     openrouter = get_openrouter_client()
     response = await openrouter.chat.completions.create(...)
 """
 
+import asyncio
 import os
 from dataclasses import dataclass
 from functools import lru_cache
+from types import SimpleNamespace
 
 import groq
 from openai import AsyncOpenAI
@@ -28,6 +30,7 @@ class GroqConfig:
 
     api_key: str
     quick_model: str
+    max_concurrency: int
 
     @classmethod
     def from_env(cls) -> "GroqConfig":
@@ -35,6 +38,7 @@ class GroqConfig:
         return cls(
             api_key=os.getenv("GROQ_API_KEY", ""),
             quick_model=os.getenv("GROG_QUICK_MODEL", "openai/gpt-oss-120b"),
+            max_concurrency=int(os.getenv("GROQ_MAX_CONCURRENCY", "8")),
         )
 
 
@@ -58,22 +62,49 @@ class OpenRouterConfig:
         )
 
 
+class ConcurrencyLimitedClient:
+    """
+    Async OpenAI-compatible client that bounds concurrent chat completions.
+
+    Requests beyond max_concurrency wait for a free slot instead of all
+    hitting the API at once (and its rate limits). Other attributes are
+    passed through to the wrapped client.
+    """
+
+    def __init__(self, client, max_concurrency: int):
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create_completion))
+
+    async def _create_completion(self, **params):
+        async with self._semaphore:
+            return await self._client.chat.completions.create(**params)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
 @lru_cache(maxsize=1)
-def get_groq_client() -> groq.Groq:
+def get_groq_client() -> ConcurrencyLimitedClient:
     """
-    Get a cached Groq client for fast LLM operations.
+    Get a cached async Groq client for fast LLM operations.
+
+    Async so a request in flight never blocks the event loop (and with it
+    every other concurrent MCP request). At most GROQ_MAX_CONCURRENCY
+    completions run at once; further calls wait their turn.
 
     Use for: Classification, extraction, routing, sentiment analysis.
     Speed: ~100-200ms per request.
     Cost: ~$0.10 per 1M tokens.
 
     Returns:
-        Groq client instance.
+        AsyncGroq client wrapped in a ConcurrencyLimitedClient.
     """
     config = GroqConfig.from_env()
     if not config.api_key:
         raise ValueError("GROQ_API_KEY environment variable is not set")
-    return groq.Groq(api_key=config.api_key)
+    return ConcurrencyLimitedClient(groq.AsyncGroq(api_key=config.api_key), config.max_concurrency)
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,271 @@
+"""
+LLM response cache for Brain OS.
+
+Deterministic (temperature 0) calls such as concept extraction and query
+classification see the same inputs over and over; caching their responses
+skips the LLM round trip and its cost. Calls with temperature > 0 are never
+cached.
+
+Backends:
+    memory: In-process LRU with TTL (default)
+    sqlite: On-disk, survives restarts and is shared between local processes
+    off: No caching
+
+Usage:
+    from src.utils.llm_cache import cached_completion
+
+    content = await cached_completion(
+        groq, model=model, messages=messages, temperature=0, max_tokens=200
+    )
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LLMCacheConfig:
+    """LLM response cache configuration."""
+
+    backend: str
+    ttl_seconds: float
+    max_entries: int
+    sqlite_path: str
+
+    @classmethod
+    def from_env(cls) -> "LLMCacheConfig":
+        """Load configuration from environment variables."""
+        return cls(
+            backend=os.getenv("BRAINOS_LLM_CACHE_BACKEND", "memory").lower(),
+            ttl_seconds=float(os.getenv("BRAINOS_LLM_CACHE_TTL", "86400")),
+            max_entries=int(os.getenv("BRAINOS_LLM_CACHE_MAX_ENTRIES", "2048")),
+            sqlite_path=os.getenv("BRAINOS_LLM_CACHE_PATH", ".brainos_llm_cache.sqlite3"),
+        )
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 86400):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """
+    On-disk cache in a SQLite file.
+
+    Queries run in a worker thread so disk I/O never blocks the event loop.
+    Expired entries are dropped on read; the least recently used entries are
+    evicted once the table exceeds max_entries.
+    """
+
+    def __init__(self, path: str, max_entries: int = 2048, ttl_seconds: float = 86400):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS llm_cache_used_at ON llm_cache (used_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            db.execute("UPDATE llm_cache SET used_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now)
+            )
+            db.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+
+class LLMCache:
+    """Response cache in front of a backend, with hit/miss counters."""
+
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: MemoryCacheBackend, SQLiteCacheBackend, or None to disable
+        """
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @staticmethod
+    def make_key(model: str, messages: list[dict], temperature: float, **params) -> str:
+        """
+        Cache key for a completion request.
+
+        Keyed on model, temperature and a hash of the prompt (messages plus
+        any other request parameters that shape the response).
+        """
+        prompt = json.dumps({"messages": messages, "params": params}, sort_keys=True, default=str)
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return f"{model}:{temperature}:{prompt_hash}"
+
+    def cacheable(self, temperature: float) -> bool:
+        """Only deterministic requests are served from the cache."""
+        return self.backend is not None and temperature <= 0
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        try:
+            await self.backend.set(key, value)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend else "off",
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache:
+    """
+    Get the process-wide LLM response cache.
+
+    Returns:
+        LLMCache configured from BRAINOS_LLM_CACHE_* environment variables.
+    """
+    config = LLMCacheConfig.from_env()
+    if config.backend == "off":
+        return LLMCache(None)
+    if config.backend == "sqlite":
+        try:
+            return LLMCache(SQLiteCacheBackend(config.sqlite_path, config.max_entries, config.ttl_seconds))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open LLM cache at {config.sqlite_path}, using memory: {e}")
+    return LLMCache(MemoryCacheBackend(config.max_entries, config.ttl_seconds))
+
+
+async def cached_completion(
+    client,
+    *,
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    cache: Optional[LLMCache] = None,
+    **params
+) -> str:
+    """
+    Run a chat completion, serving repeated deterministic requests from the cache.
+
+    Args:
+        client: Async OpenAI-compatible client (AsyncGroq, AsyncOpenAI)
+        model: Model name
+        messages: Chat messages
+        temperature: Sampling temperature; requests above 0 bypass the cache
+        cache: Cache to use (defaults to get_llm_cache())
+        **params: Further chat.completions.create arguments
+
+    Returns:
+        Response message content.
+    """
+    cache = cache or get_llm_cache()
+
+    if not cache.cacheable(temperature):
+        cache.bypassed += 1
+        response = await client.chat.completions.create(
+            model=model, messages=messages, temperature=temperature, **params
+        )
+        return response.choices[0].message.content
+
+    key = cache.make_key(model, messages, temperature, **params)
+    content = await cache.get(key)
+    if content is not None:
+        logger.debug(f"LLM cache hit for {model}")
+        return content
+
+    response = await client.chat.completions.create(
+        model=model, messages=messages, temperature=temperature, **params
+    )
+    content = response.choices[0].message.content
+    if content:
+        await cache.set(key, content)
+    return content
+
+
+def llm_cache_stats() -> dict:
+    """Hit/miss counters of the process-wide LLM cache."""
+    return get_llm_cache().stats()
@@ -78,7 +78,8 @@ class BubbleResponse(BaseModel):
 
     Phase 3 Enhanced: Includes memory_type, activation_threshold, entities, observations.
 
-    Note: Neo4j element_id is returned as a string (e.g., '4:uuid:0').
+    Note: id is the bubble's stable uid (a UUIDv7 string), not the Neo4j
+    internal id, which is deprecated and reused after deletes.
     """
     id: str
     content: str
@@ -95,11 +96,41 @@ class BubbleResponse(BaseModel):
     entities: Optional[list[str]] = None
     observations: Optional[list[str]] = None
     accessed_count: Optional[int] = None
+    # Starts at created_at, so it is set even for never-accessed bubbles (accessed_count 0)
     last_accessed: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
 
+class BubblePage(BaseModel):
+    """One page of bubbles from a cursor-paginated query.
+
+    next_cursor is opaque; pass it back to fetch the following page.
+    It is None on the last page.
+    """
+    bubbles: list[BubbleResponse]
+    next_cursor: Optional[str] = None
+
+
+class SectorStats(BaseModel):
+    """Per-sector aggregate statistics."""
+    count: int
+    avg_salience: float
+
+
+class MemoryStats(BaseModel):
+    """Aggregate statistics over all active memory bubbles.
+
+    salience_bins maps "0.0-0.2" ... "0.8-1.0" to counts.
+    daily_counts maps "YYYY-MM-DD" to counts for the last 7 days.
+    """
+    total: int
+    avg_salience: float
+    sectors: dict[str, SectorStats]
+    salience_bins: dict[str, int]
+    daily_counts: dict[str, int]
+
+
 class MemorySearchParams(BaseModel):
     """Schema for memory search parameters."""
     query: str = Field(..., min_length=1, description="Search keyword")
@@ -0,0 +1,171 @@
+"""
+Shared helpers for Brain OS benchmarks.
+
+Benchmarks that need a real Neo4j server run only when
+BRAINOS_BENCHMARK_NEO4J_URI points at a disposable instance (credentials
+from BRAINOS_BENCHMARK_NEO4J_USER / _PASSWORD). They seed bubbles with
+source="benchmark" and delete them afterwards, and refuse to run against a
+database that holds any other bubbles. The rest run against the stub driver
+in tests/neo4j_stub.py.
+
+Run them with output shown:
+    pytest tests/benchmarks -s
+"""
+
+import os
+import random
+import statistics
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database.connection import Neo4jConnection
+from src.database.schema import BACKFILL_BATCH_SIZE, run_migrations
+
+BENCHMARK_URI_ENV = "BRAINOS_BENCHMARK_NEO4J_URI"
+
+# Source tag of seeded bubbles, used to clean them up
+BENCHMARK_SOURCE = "benchmark"
+
+# Vocabulary for synthetic bubble content
+WORDS = (
+    "alice bob carol dave erin frank postgres neo4j redis kafka fastapi "
+    "react deploy release budget roadmap meeting design review incident "
+    "latency cache index schema migration backup invoice client contract "
+    "hiring onboarding launch pricing churn feedback sprint retro demo "
+    "security audit compliance vendor outage rollback hotfix feature"
+).split()
+
+SECTORS = ("Episodic", "Semantic", "Procedural", "Emotional")
+
+
+def benchmark_size(env_var: str, default: int) -> int:
+    """Benchmark size from an environment variable."""
+    return int(os.getenv(env_var, str(default)))
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    """p50/p99/mean of latency samples in milliseconds."""
+    return {
+        "p50_ms": round(percentile(samples_ms, 0.50), 2),
+        "p99_ms": round(percentile(samples_ms, 0.99), 2),
+        "mean_ms": round(statistics.fmean(samples_ms), 2),
+    }
+
+
+def report(name: str, **metrics) -> None:
+    """Print one benchmark result line."""
+    values = ", ".join(f"{key}={value}" for key, value in metrics.items())
+    print(f"\n[benchmark] {name}: {values}")
+
+
+def synthetic_content(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed_rows(count: int, seed: int = 7, days: int = 365) -> list[dict]:
+    """Synthetic bubble rows spread over the last `days` days."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "content": f"{synthetic_content(rng)} #{i}",
+            "sector": rng.choice(SECTORS),
+            "salience": round(rng.random(), 3),
+            "memory_type": rng.choice(("thinking", "thinking", "instinctive", "dormant")),
+            "entities": rng.sample(WORDS[:6], 2),
+            "created_at": now - timedelta(seconds=rng.uniform(0, days * 86400)),
+        }
+        for i in range(count)
+    ]
+
+
+async def seed_bubbles(connection, rows: list[dict]) -> None:
+    """Write seeded bubbles in UNWIND batches and wait for indexes to catch up."""
+    cypher = """
+    UNWIND $rows AS row
+    CREATE (b:Bubble {
+        uid: randomUUID(),
+        content: row.content,
+        sector: row.sector,
+        source: $source,
+        salience: row.salience,
+        memory_type: row.memory_type,
+        activation_threshold: 0.65,
+        entities: row.entities,
+        observations: [],
+        created_at: row.created_at,
+        valid_from: row.created_at,
+        last_accessed: row.created_at,
+        access_count: 0
+    })
+    SET b.content_hash = b.uid
+    """
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        await connection.write(cypher, rows=rows[start:start + BACKFILL_BATCH_SIZE], source=BENCHMARK_SOURCE)
+    async with connection.session() as session:
+        result = await session.run("CALL db.awaitIndexes(300)")
+        await result.consume()
+
+
+def benchmark_connection() -> Neo4jConnection:
+    """Unconnected Neo4jConnection to the benchmark server; skips the test if none is set."""
+    uri = os.getenv(BENCHMARK_URI_ENV)
+    if not uri:
+        pytest.skip(f"set {BENCHMARK_URI_ENV} to run Neo4j benchmarks")
+    return Neo4jConnection(
+        uri,
+        os.getenv("BRAINOS_BENCHMARK_NEO4J_USER", "neo4j"),
+        os.getenv("BRAINOS_BENCHMARK_NEO4J_PASSWORD", "neo4j"),
+    )
+
+
+@asynccontextmanager
+async def benchmark_neo4j(monkeypatch, *modules):
+    """
+    Connect to the benchmark Neo4j server and route query helpers to it.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+        *modules: Modules whose get_connection should return this connection
+
+    Yields:
+        Connected, migrated Neo4jConnection
+    """
+    connection = benchmark_connection()
+    await connection.connect()
+    try:
+        # Checked before migrating: migrations rewrite and soft-delete bubbles
+        records = await connection.read(
+            "MATCH (b:Bubble) WHERE coalesce(b.source, '') <> $source RETURN count(b) AS other",
+            source=BENCHMARK_SOURCE
+        )
+        if records[0]["other"]:
+            pytest.skip("benchmark database holds non-benchmark bubbles")
+        await run_migrations(connection)
+
+        async def get_connection():
+            return connection
+
+        for module in modules:
+            monkeypatch.setattr(module, "get_connection", get_connection)
+        yield connection
+    finally:
+        async with connection.session() as session:
+            result = await session.run(
+                f"""
+                MATCH (b:Bubble {{source: $source}})
+                CALL {{ WITH b DETACH DELETE b }} IN TRANSACTIONS OF {BACKFILL_BATCH_SIZE} ROWS
+                """,
+                source=BENCHMARK_SOURCE
+            )
+            await result.consume()
+        await connection.close()
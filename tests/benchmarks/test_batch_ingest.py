@@ -0,0 +1,90 @@
+"""
+Benchmark: rows/sec of upsert_bubbles_batch at batch sizes 1, 100 and 1000.
+
+Runs against the stub driver with a simulated round trip per transaction
+(BRAINOS_BENCHMARK_RTT_MS, default 2ms) and per-row server cost, and against
+a real Neo4j when BRAINOS_BENCHMARK_NEO4J_URI is set. Embedding is skipped,
+since its cost does not depend on the batch size.
+"""
+
+import asyncio
+import os
+import random
+import time
+
+import pytest
+
+from src.database.queries import memory
+from src.database.queries.memory import upsert_bubbles_batch
+from src.utils.schemas import BubbleCreate
+from tests.benchmarks.harness import (
+    BENCHMARK_SOURCE, SECTORS, benchmark_neo4j, benchmark_size, report, synthetic_content
+)
+from tests.neo4j_stub import StubDriver, stub_connection
+
+BATCH_SIZES = (1, 100, 1000)
+
+# Simulated server time per written row
+ROW_COST_SECONDS = 0.00002
+
+
+def _items(count: int, tag: str) -> list[BubbleCreate]:
+    rng = random.Random(tag)
+    return [
+        BubbleCreate(
+            content=f"{synthetic_content(rng)} {tag}-{i}",
+            sector=rng.choice(SECTORS),
+            source=BENCHMARK_SOURCE,
+            salience=round(rng.random(), 3),
+        )
+        for i in range(count)
+    ]
+
+
+async def _stub_write(cypher, params):
+    rows = params["rows"]
+    await asyncio.sleep(ROW_COST_SECONDS * len(rows))
+    return [
+        {"idx": row["idx"], "bubble": {**row, "created_at": params["now"]}, "uid": row["uid"]}
+        for row in rows
+    ]
+
+
+async def _no_embeddings(texts):
+    return None
+
+
+async def _rows_per_second(rows: int, batch_size: int) -> float:
+    items = _items(rows, f"batch{batch_size}")
+    start = time.perf_counter()
+    results = await upsert_bubbles_batch(items, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    assert len(results) == rows
+    return rows / elapsed
+
+
+@pytest.mark.parametrize("backend", ["stub", "neo4j"])
+def test_batch_ingest_throughput(monkeypatch, backend):
+    rows = benchmark_size("BRAINOS_BENCHMARK_INGEST_ROWS", 500 if backend == "stub" else 5000)
+    monkeypatch.setattr(memory, "embed_texts", _no_embeddings)
+
+    async def run():
+        if backend == "stub":
+            rtt = float(os.getenv("BRAINOS_BENCHMARK_RTT_MS", "2")) / 1000
+            connection = stub_connection(StubDriver(handler=_stub_write, latency=rtt))
+
+            async def get_connection():
+                return connection
+
+            monkeypatch.setattr(memory, "get_connection", get_connection)
+            return {size: await _rows_per_second(rows, size) for size in BATCH_SIZES}
+
+        async with benchmark_neo4j(monkeypatch, memory):
+            return {size: await _rows_per_second(rows, size) for size in BATCH_SIZES}
+
+    throughput = asyncio.run(run())
+    report(
+        f"upsert_bubbles_batch, {rows} rows ({backend})",
+        **{f"batch_{size}_rows_per_s": round(rate) for size, rate in throughput.items()}
+    )
+    assert throughput[100] > throughput[1]
@@ -0,0 +1,69 @@
+"""
+Microbenchmark: mapping 10k Neo4j rows to BubbleResponse with node_to_bubble,
+with full Pydantic validation vs model_construct (the default for DB rows).
+
+model_construct is the default because map projections leave unrequested
+required fields empty, which validation would reject; this benchmark tracks
+what the unvalidated path costs relative to validation. Converting the three
+neo4j DateTime values per row is shared by both paths.
+"""
+
+import random
+import time
+from datetime import timedelta
+
+from neo4j.time import DateTime
+
+from src.database.queries.memory import node_to_bubble
+from tests.benchmarks.harness import benchmark_size, report, seed_rows
+
+
+def _records(count: int) -> list[dict]:
+    rng = random.Random(5)
+    records = []
+    for i, row in enumerate(seed_rows(count)):
+        created_at = DateTime.from_native(row["created_at"])
+        records.append({
+            "uid": f"uid-{i}",
+            "b": {
+                "content": row["content"],
+                "sector": row["sector"],
+                "source": "benchmark",
+                "salience": row["salience"],
+                "created_at": created_at,
+                "valid_from": created_at,
+                "valid_to": None,
+                "memory_type": row["memory_type"],
+                "activation_threshold": 0.65,
+                "entities": row["entities"],
+                "observations": ["observed"] * rng.randint(0, 3),
+                "access_count": rng.randint(0, 20),
+                "last_accessed": DateTime.from_native(
+                    row["created_at"] + timedelta(days=rng.randint(0, 30))
+                ),
+            },
+        })
+    return records
+
+
+def _map(records: list[dict], validate: bool) -> tuple[float, list]:
+    start = time.perf_counter()
+    bubbles = [node_to_bubble(record["b"], record["uid"], validate=validate) for record in records]
+    return (time.perf_counter() - start) * 1000, bubbles
+
+
+def test_node_to_bubble_validate_vs_construct():
+    count = benchmark_size("BRAINOS_BENCHMARK_RECORDS", 10_000)
+    records = _records(count)
+
+    validated_ms, validated = _map(records, validate=True)
+    constructed_ms, constructed = _map(records, validate=False)
+
+    report(
+        f"node_to_bubble, {count} records",
+        validate_ms=round(validated_ms, 1),
+        construct_ms=round(constructed_ms, 1),
+        construct_vs_validate=round(constructed_ms / validated_ms, 2),
+    )
+    assert [b.model_dump() for b in constructed] == [b.model_dump() for b in validated]
+    assert constructed[0].created_at.tzinfo is not None
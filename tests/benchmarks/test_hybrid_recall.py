@@ -0,0 +1,178 @@
+"""
+Benchmark: recall@k of keyword, semantic and hybrid (RRF) retrieval.
+
+Builds a synthetic corpus in which every bubble mentions two made-up topic
+words among filler words. Each query targets one bubble, either with its
+topic words verbatim ("exact") or with plural, suffix and typo variants of
+them ("variant"). recall@k is the share of queries whose target bubble is
+among the top k results.
+
+The in-process benchmark ranks BRAINOS_BENCHMARK_RECALL_BUBBLES bubbles
+(default 2000) with exact-token keyword matching (as the full-text index
+does), brute-force cosine over HashingEmbedder vectors, and
+reciprocal_rank_fusion of both. The Neo4j benchmark runs the same corpus
+through search_bubbles, vector_search_bubbles and HybridRetrievalNode and
+requires BRAINOS_BENCHMARK_NEO4J_URI.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.database.queries import memory
+from src.database.queries.memory import search_bubbles, vector_search_bubbles
+from src.database.schema import backfill_embeddings
+from src.flows.query_memories import HybridRetrievalNode, reciprocal_rank_fusion
+from src.utils.embeddings import HashingEmbedder
+from tests.benchmarks.harness import (
+    SECTORS, benchmark_neo4j, benchmark_size, report, seed_bubbles, summarize, synthetic_content
+)
+
+K = 10
+QUERIES = 100
+
+# Neo4j reports cosine similarity as (1 + cos) / 2; HybridRetrievalConfig.semantic_min_score
+MIN_VECTOR_SCORE = 0.6
+
+_ONSETS = "b d f g k l m n p r s t v z".split()
+_VOWELS = "a e i o u".split()
+
+
+def topic_word(rng: random.Random) -> str:
+    return "".join(rng.choice(_ONSETS) + rng.choice(_VOWELS) for _ in range(4)) + rng.choice("lnrt")
+
+
+def variant(rng: random.Random, word: str) -> str:
+    """Plural, suffixed or one-typo form of a word."""
+    kind = rng.choice(("plural", "suffix", "typo"))
+    if kind == "plural":
+        return word + "s"
+    if kind == "suffix":
+        return word + "ing"
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1:]
+
+
+def build_corpus(size: int, seed: int = 11) -> tuple[list[str], list[tuple[str, str, int]]]:
+    """Bubble contents and (kind, query, target index) triples."""
+    rng = random.Random(seed)
+    vocabulary = set()
+    while len(vocabulary) < size * 2:
+        vocabulary.add(topic_word(rng))
+    vocabulary = sorted(vocabulary)
+    rng.shuffle(vocabulary)
+
+    topics = [(vocabulary[2 * i], vocabulary[2 * i + 1]) for i in range(size)]
+    contents = [f"{synthetic_content(rng, 6)} {a} {synthetic_content(rng, 4)} {b}" for a, b in topics]
+
+    queries = []
+    for i, target in enumerate(rng.sample(range(size), QUERIES)):
+        a, b = topics[target]
+        if i % 2:
+            queries.append(("variant", f"{variant(rng, a)} {variant(rng, b)}", target))
+        else:
+            queries.append(("exact", f"{a} {b}", target))
+    return contents, queries
+
+
+def recall_at_k(hits: dict[str, list[bool]]) -> dict[str, float]:
+    return {kind: round(sum(found) / len(found), 3) for kind, found in hits.items()}
+
+
+def test_recall_in_process():
+    size = benchmark_size("BRAINOS_BENCHMARK_RECALL_BUBBLES", 2000)
+    contents, queries = build_corpus(size)
+    embedder = HashingEmbedder()
+    vectors = embedder.embed(contents)
+    tokens = [set(content.split()) for content in contents]
+
+    def keyword(query: str) -> list[int]:
+        terms = set(query.split())
+        scored = [(len(terms & words), i) for i, words in enumerate(tokens) if terms & words]
+        return [i for _, i in sorted(scored, key=lambda item: (-item[0], item[1]))[:K]]
+
+    def semantic(query: str) -> list[int]:
+        q = embedder.embed_one(query)
+        scored = [((1 + sum(x * y for x, y in zip(q, v))) / 2, i) for i, v in enumerate(vectors)]
+        return [i for score, i in sorted(scored, reverse=True)[:K] if score >= MIN_VECTOR_SCORE]
+
+    hits = {name: {"exact": [], "variant": []} for name in ("keyword", "semantic", "hybrid")}
+    latencies = {"keyword": [], "semantic": []}
+    for kind, query, target in queries:
+        start = time.perf_counter()
+        keyword_hits = keyword(query)
+        latencies["keyword"].append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        semantic_hits = semantic(query)
+        latencies["semantic"].append((time.perf_counter() - start) * 1000)
+        fused = reciprocal_rank_fusion(
+            [[SimpleNamespace(id=i) for i in ranking] for ranking in (keyword_hits, semantic_hits)]
+        )[:K]
+
+        hits["keyword"][kind].append(target in keyword_hits)
+        hits["semantic"][kind].append(target in semantic_hits)
+        hits["hybrid"][kind].append(target in [m.id for m in fused])
+
+    recall = {name: recall_at_k(found) for name, found in hits.items()}
+    for name, by_kind in recall.items():
+        extra = summarize(latencies[name]) if name in latencies else {}
+        report(f"recall@{K} over {size} bubbles, {name} (in-process)", **by_kind, **extra)
+
+    assert recall["keyword"]["exact"] >= 0.95
+    assert recall["semantic"]["variant"] > recall["keyword"]["variant"]
+    assert recall["hybrid"]["exact"] >= recall["keyword"]["exact"]
+    assert recall["hybrid"]["variant"] >= recall["semantic"]["variant"]
+
+
+def test_recall_neo4j(monkeypatch):
+    size = benchmark_size("BRAINOS_BENCHMARK_RECALL_BUBBLES", 2000)
+    contents, queries = build_corpus(size)
+    rng = random.Random(3)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "content": content,
+            "sector": rng.choice(SECTORS),
+            "salience": 0.9,
+            "memory_type": "thinking",
+            "entities": [],
+            "created_at": now,
+        }
+        for content in contents
+    ]
+    node = HybridRetrievalNode()
+
+    retrievers = {
+        "keyword": lambda q: search_bubbles(q, limit=K),
+        "semantic": lambda q: vector_search_bubbles(q, limit=K, min_score=MIN_VECTOR_SCORE),
+        "hybrid": node.exec_async,
+    }
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch, memory) as connection:
+            await seed_bubbles(connection, rows)
+            async with connection.session() as session:
+                await backfill_embeddings(session)
+            async with connection.session() as session:
+                result = await session.run("CALL db.awaitIndexes(300)")
+                await result.consume()
+
+            results = {}
+            for name, retrieve in retrievers.items():
+                found = {"exact": [], "variant": []}
+                latencies = []
+                for kind, query, target in queries:
+                    start = time.perf_counter()
+                    bubbles = await retrieve(query)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    found[kind].append(contents[target] in [b.content for b in bubbles[:K]])
+                results[name] = (recall_at_k(found), summarize(latencies))
+            return results
+
+    results = asyncio.run(run())
+    for name, (by_kind, latency) in results.items():
+        report(f"recall@{K} over {size} bubbles, {name} (Neo4j)", **by_kind, **latency)
+
+    assert results["hybrid"][0]["variant"] >= results["keyword"][0]["variant"]
@@ -0,0 +1,56 @@
+"""
+Benchmark: 200 parallel search_bubbles calls through the connection pool.
+
+Runs against the stub driver, which holds one pool slot per transaction for
+BRAINOS_BENCHMARK_QUERY_MS (default 10ms), and reports wall time, call
+latency and pool acquisition waits for several pool sizes.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.database.queries import memory
+from src.database.queries.memory import search_bubbles
+from tests.benchmarks.harness import report, summarize
+from tests.neo4j_stub import StubDriver, stub_connection
+
+PARALLEL_CALLS = 200
+
+
+@pytest.mark.parametrize("pool_size", [10, 50, 200])
+def test_parallel_search_pool_waits(monkeypatch, pool_size):
+    query_seconds = float(os.getenv("BRAINOS_BENCHMARK_QUERY_MS", "10")) / 1000
+    driver = StubDriver(latency=query_seconds, pool_size=pool_size)
+    connection = stub_connection(driver, max_connection_pool_size=pool_size)
+
+    async def get_connection():
+        return connection
+
+    monkeypatch.setattr(memory, "get_connection", get_connection)
+
+    async def timed_search(i: int) -> float:
+        start = time.perf_counter()
+        await search_bubbles(f"term{i}", limit=10)
+        return (time.perf_counter() - start) * 1000
+
+    async def run():
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(timed_search(i) for i in range(PARALLEL_CALLS)))
+        return (time.perf_counter() - start) * 1000, latencies
+
+    wall_ms, latencies = asyncio.run(run())
+    waits_ms = [wait * 1000 for wait in driver.acquisition_waits]
+    report(
+        f"{PARALLEL_CALLS} parallel search_bubbles, pool {pool_size}",
+        wall_ms=round(wall_ms, 1),
+        **summarize(latencies),
+        acquisition_wait_p99_ms=summarize(waits_ms)["p99_ms"],
+        max_in_use=driver.max_in_use,
+    )
+    assert driver.max_in_use <= pool_size
+    assert len(driver.calls) == PARALLEL_CALLS
+    # Calls queue for a connection once the pool is exhausted
+    assert wall_ms >= query_seconds * 1000 * (PARALLEL_CALLS / pool_size) * 0.9
@@ -0,0 +1,193 @@
+"""
+Benchmark: Bolt payload of whole-node reads vs field projections.
+
+Sizes are PackStream-encoded RECORD messages (chunk headers excluded) for
+RETURN b versus the map projections the listing and stats tools request.
+The synthetic benchmark encodes BRAINOS_BENCHMARK_PAYLOAD_ROWS rows
+(default 1000) shaped like stored bubbles, including a 256-dimension
+embedding. The Neo4j benchmark reads the same number of seeded bubbles back
+from a server and requires BRAINOS_BENCHMARK_NEO4J_URI.
+"""
+
+import asyncio
+import hashlib
+import random
+from datetime import date, datetime, timedelta, timezone
+
+from neo4j.graph import Node
+
+from src.database.queries import memory
+from src.database.queries.memory import _projection
+from src.database.schema import backfill_embeddings
+from src.utils.embeddings import HashingEmbedder
+from tests.benchmarks.harness import (
+    BENCHMARK_SOURCE, SECTORS, WORDS, benchmark_neo4j, benchmark_size, report, seed_bubbles, seed_rows,
+    synthetic_content
+)
+
+# Fields requested by each caller (see src/tools)
+PROJECTIONS = {
+    "default (all properties)": None,
+    "get_memory listing": ("content", "sector", "source", "salience", "created_at"),
+    "get_all_memories overview": ("content", "sector", "salience", "created_at"),
+    "visualize_memories stats": ("sector", "salience", "created_at"),
+    "system health sector stats": ("sector",),
+}
+
+
+def _container_header(size: int) -> int:
+    """Bytes of a PackStream string/list/map header."""
+    if size < 0x10:
+        return 1
+    if size < 0x100:
+        return 2
+    if size < 0x10000:
+        return 3
+    return 5
+
+
+def _int_size(value: int) -> int:
+    if -0x10 <= value < 0x80:
+        return 1
+    if -0x80 <= value < 0x80:
+        return 2
+    if -0x8000 <= value < 0x8000:
+        return 3
+    if -0x80000000 <= value < 0x80000000:
+        return 5
+    return 9
+
+
+def packstream_size(value) -> int:
+    """Encoded size of a value as Bolt 5 sends it."""
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, int):
+        return _int_size(value)
+    if isinstance(value, float):
+        return 9
+    if isinstance(value, str):
+        encoded = len(value.encode("utf-8"))
+        return _container_header(encoded) + encoded
+    if isinstance(value, (list, tuple)):
+        return _container_header(len(value)) + sum(packstream_size(v) for v in value)
+    if isinstance(value, dict):
+        return _container_header(len(value)) + sum(
+            packstream_size(k) + packstream_size(v) for k, v in value.items()
+        )
+    if isinstance(value, Node):
+        return node_size(value.id, list(value.labels), dict(value), value.element_id)
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, datetime):
+        # Structure I: epoch seconds, nanoseconds, UTC offset seconds
+        offset = int(value.utcoffset().total_seconds()) if value.utcoffset() else 0
+        return 2 + _int_size(int(value.timestamp())) + _int_size(value.microsecond * 1000) + _int_size(offset)
+    if isinstance(value, date):
+        return 2 + _int_size(value.toordinal())
+    raise TypeError(f"No PackStream size for {type(value).__name__}")
+
+
+def node_size(node_id: int, labels: list[str], properties: dict, element_id: str) -> int:
+    """Size of a node: Structure N with id, labels, properties and element_id."""
+    return 2 + _int_size(node_id) + packstream_size(labels) + packstream_size(properties) \
+        + packstream_size(element_id)
+
+
+def record_size(values: list) -> int:
+    """Size of a RECORD message carrying these values."""
+    return 2 + packstream_size(values)
+
+
+def synthetic_bubbles(count: int, seed: int = 5) -> list[dict]:
+    """Stored bubble properties: a paragraph of content, observations and an embedding."""
+    rng = random.Random(seed)
+    embedder = HashingEmbedder(256)
+    now = datetime.now(timezone.utc)
+    bubbles = []
+    for i in range(count):
+        content = synthetic_content(rng, 40)
+        created_at = now - timedelta(days=rng.uniform(0, 365))
+        bubbles.append({
+            "uid": f"0192f0c4-{i:04x}-7000-8000-{rng.getrandbits(48):012x}",
+            "content": content,
+            "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+            "sector": rng.choice(SECTORS),
+            "source": "conversation",
+            "salience": round(rng.random(), 3),
+            "memory_type": "thinking",
+            "activation_threshold": 0.65,
+            "entities": rng.sample(WORDS, 3),
+            "observations": [synthetic_content(rng, 15) for _ in range(3)],
+            "created_at": created_at,
+            "valid_from": created_at,
+            "last_accessed": created_at,
+            "access_count": rng.randrange(10),
+            "embedding": embedder.embed_one(content),
+        })
+    return bubbles
+
+
+def _project(properties: dict, fields) -> dict:
+    names = memory.BUBBLE_PROPERTIES if fields is None else [f for f in fields if f != "id"]
+    return {name: properties.get(name) for name in names}
+
+
+def test_projection_payload_synthetic():
+    rows = benchmark_size("BRAINOS_BENCHMARK_PAYLOAD_ROWS", 1000)
+    bubbles = synthetic_bubbles(rows)
+
+    def whole_node(i: int, properties: dict) -> int:
+        # A RECORD of (node, uid): 2 bytes of message, a 2-item list header, then the fields
+        return 2 + 1 + node_size(i, ["Bubble"], properties, f"4:{'0' * 36}:{i}") + packstream_size(properties["uid"])
+
+    whole = sum(whole_node(i, b) for i, b in enumerate(bubbles))
+    # RETURN b before bubbles stored embeddings
+    unembedded = sum(
+        whole_node(i, {k: v for k, v in b.items() if k != "embedding"}) for i, b in enumerate(bubbles)
+    )
+    report(f"RETURN b over {rows} bubbles", bytes=whole, bytes_per_row=whole // rows)
+    report(
+        f"RETURN b without embeddings over {rows} bubbles", bytes=unembedded,
+        bytes_per_row=unembedded // rows, vs_whole_node=f"{unembedded / whole:.1%}"
+    )
+    for name, fields in PROJECTIONS.items():
+        projected = sum(record_size([_project(b, fields), b["uid"]]) for b in bubbles)
+        report(
+            f"{name} over {rows} bubbles", bytes=projected, bytes_per_row=projected // rows,
+            vs_whole_node=f"{projected / whole:.1%}"
+        )
+        assert projected < whole
+
+
+def test_projection_payload_neo4j(monkeypatch):
+    rows = benchmark_size("BRAINOS_BENCHMARK_PAYLOAD_ROWS", 1000)
+
+    async def read_bytes(connection, returns: str) -> int:
+        records = await connection.read(
+            f"""
+            MATCH (b:Bubble {{source: $source}})
+            RETURN {returns}, b.uid AS uid
+            ORDER BY b.created_at DESC
+            LIMIT $limit
+            """,
+            source=BENCHMARK_SOURCE,
+            limit=rows
+        )
+        return sum(record_size(list(record.values())) for record in records)
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch, memory) as connection:
+            await seed_bubbles(connection, seed_rows(rows))
+            async with connection.session() as session:
+                await backfill_embeddings(session)
+            sizes = {"RETURN b": await read_bytes(connection, "b")}
+            for name, fields in PROJECTIONS.items():
+                sizes[name] = await read_bytes(connection, f"{_projection(fields)} AS bubble")
+            return sizes
+
+    sizes = asyncio.run(run())
+    whole = sizes["RETURN b"]
+    for name, size in sizes.items():
+        report(f"{name} over {rows} Neo4j bubbles", bytes=size, vs_whole_node=f"{size / whole:.1%}")
+    assert all(size < whole for name, size in sizes.items() if name != "RETURN b")
@@ -0,0 +1,53 @@
+"""
+Benchmark: time-scoped ("recent") retrieval over native DATETIME timestamps.
+
+Seeds BRAINOS_BENCHMARK_RECENT_BUBBLES bubbles (default 1M) spread over a
+year and reports p50/p99 of contextual queries restricted to the last 30
+days (a range seek on bubble_created_at) against the same queries over all
+time. Requires BRAINOS_BENCHMARK_NEO4J_URI.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.flows.contextual_retrieval import query_bubbles
+from tests.benchmarks.harness import (
+    WORDS, benchmark_neo4j, benchmark_size, report, seed_bubbles, seed_rows, summarize
+)
+
+QUERIES = 100
+
+
+async def _time_queries(driver, terms: list[str], since) -> list[float]:
+    samples = []
+    for term in terms:
+        start = time.perf_counter()
+        await query_bubbles(driver, [term], since=since)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def test_recent_window_latency(monkeypatch):
+    size = benchmark_size("BRAINOS_BENCHMARK_RECENT_BUBBLES", 1_000_000)
+    rng = random.Random(3)
+    terms = [rng.choice(WORDS) for _ in range(QUERIES)]
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch) as connection:
+            await seed_bubbles(connection, seed_rows(size))
+            since = datetime.now(timezone.utc) - timedelta(days=30)
+
+            records = await connection.read(
+                "MATCH (b:Bubble) WHERE b.created_at > $since RETURN count(b) AS recent",
+                since=since
+            )
+            recent = await _time_queries(connection.driver, terms, since)
+            all_time = await _time_queries(connection.driver, terms, None)
+            return records[0]["recent"], summarize(recent), summarize(all_time)
+
+    in_window, recent, all_time = asyncio.run(run())
+    report(f"recent window (30 days, {in_window}/{size} bubbles)", **recent)
+    report(f"all time ({size} bubbles)", **all_time)
+    assert recent["p50_ms"] < all_time["p50_ms"]
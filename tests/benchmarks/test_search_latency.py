@@ -0,0 +1,48 @@
+"""
+Benchmark: full-text index search vs CONTAINS label scan (search_bubbles).
+
+Seeds BRAINOS_BENCHMARK_BUBBLES bubbles (default 100k) and reports p50/p99
+latency of both search paths. Requires BRAINOS_BENCHMARK_NEO4J_URI.
+"""
+
+import asyncio
+import random
+import time
+
+from src.database.queries import memory
+from src.database.queries.memory import _search_bubbles_fulltext, _search_bubbles_scan, _to_fulltext_query
+from tests.benchmarks.harness import (
+    WORDS, benchmark_neo4j, benchmark_size, report, seed_bubbles, seed_rows, summarize
+)
+
+QUERIES = 200
+
+
+async def _time_queries(search, queries: list[str]) -> list[float]:
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        await search(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def test_fulltext_vs_contains_latency(monkeypatch):
+    size = benchmark_size("BRAINOS_BENCHMARK_BUBBLES", 100_000)
+    rng = random.Random(1)
+    queries = [rng.choice(WORDS) for _ in range(QUERIES)]
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch, memory) as connection:
+            await seed_bubbles(connection, seed_rows(size))
+
+            fulltext = await _time_queries(
+                lambda q: _search_bubbles_fulltext(_to_fulltext_query(q), 10), queries
+            )
+            scan = await _time_queries(lambda q: _search_bubbles_scan(q, 10), queries)
+            return summarize(fulltext), summarize(scan)
+
+    fulltext, scan = asyncio.run(run())
+    report(f"search_bubbles over {size} bubbles, full-text", **fulltext)
+    report(f"search_bubbles over {size} bubbles, CONTAINS scan", **scan)
+    assert fulltext["p50_ms"] < scan["p50_ms"]
@@ -0,0 +1,103 @@
+"""
+Benchmark: contextual retrieval with and without speculative querying.
+
+The Groq analysis and OpenRouter synthesis calls go to a local fake LLM
+server answering after BRAINOS_BENCHMARK_LLM_MS (default 50ms); Neo4j is the
+stub driver with BRAINOS_BENCHMARK_QUERY_MS (default 20ms) per query. Each
+scenario runs the flow BRAINOS_BENCHMARK_RUNS times (default 10) per mode and
+reports end-to-end latency. Both modes must return the same memories.
+"""
+
+import asyncio
+import json
+import os
+import time
+
+import groq
+import openai
+import pytest
+
+from src.flows import contextual_retrieval
+from src.flows.contextual_retrieval import contextual_retrieval_flow
+from src.utils import llm_cache
+from src.utils.llm_cache import LLMCache
+from tests.benchmarks.harness import benchmark_size, report, summarize
+from tests.fake_llm_server import FakeLLMServer
+from tests.neo4j_stub import StubDriver
+
+SCENARIOS = {
+    # Context adds nothing: the speculative query is the whole retrieval
+    "no new concepts": {"related_concepts": [], "time_scope": "all_time"},
+    # Context adds concepts: only the delta is queried after the LLM call
+    "new concepts": {"related_concepts": ["database"], "time_scope": "all_time"},
+    # Context narrows the filters: the raw term is re-queried with them
+    "stricter filters": {"related_concepts": ["database"], "time_scope": "recent"},
+}
+
+
+def handler(cypher: str, params: dict) -> list[dict]:
+    terms = [value for key, value in params.items() if key.startswith("search")]
+    return [
+        {
+            "bubble": {
+                "uid": f"{term}-{i}", "content": f"{term} note {i}", "sector": "Semantic",
+                "source": "benchmark", "salience": 0.5, "created_at": "2026-01-01T00:00:00Z",
+            },
+            "relations": [],
+        }
+        for term in terms for i in range(3)
+    ]
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_speculative_retrieval_latency(monkeypatch, scenario):
+    llm_seconds = float(os.getenv("BRAINOS_BENCHMARK_LLM_MS", "50")) / 1000
+    query_seconds = float(os.getenv("BRAINOS_BENCHMARK_QUERY_MS", "20")) / 1000
+    runs = benchmark_size("BRAINOS_BENCHMARK_RUNS", 10)
+
+    reply = json.dumps({
+        "intent": "search", "salience_filter": "any", **SCENARIOS[scenario],
+        "themes": [], "highlights": [], "relationships": [],
+    })
+    monkeypatch.setattr(llm_cache, "get_llm_cache", lambda: LLMCache(None))
+
+    async def run_mode(speculative: bool) -> tuple[list[float], list[list[str]]]:
+        latencies, results = [], []
+        for run in range(runs):
+            shared = {
+                "neo4j_driver": StubDriver(handler=handler, latency=query_seconds),
+                "user_input": f"postgres{run}",
+                "conversation_history": [],
+                "time_scope": "auto",
+                "salience_filter": "auto",
+                "speculative": speculative,
+            }
+            start = time.perf_counter()
+            await contextual_retrieval_flow.run_async(shared)
+            latencies.append((time.perf_counter() - start) * 1000)
+            results.append(sorted(b["id"] for b in shared["query_results"]))
+        return latencies, results
+
+    async def run():
+        async with FakeLLMServer(latency=llm_seconds, respond=lambda request: reply) as server:
+            groq_client = groq.AsyncGroq(api_key="test", base_url=server.url, max_retries=0)
+            openrouter_client = openai.AsyncOpenAI(api_key="test", base_url=server.url, max_retries=0)
+            monkeypatch.setattr(contextual_retrieval, "get_groq_client", lambda: groq_client)
+            monkeypatch.setattr(contextual_retrieval, "get_openrouter_client", lambda: openrouter_client)
+            return await run_mode(False), await run_mode(True)
+
+    (sequential_ms, sequential_results), (speculative_ms, speculative_results) = asyncio.run(run())
+
+    sequential, speculative = summarize(sequential_ms), summarize(speculative_ms)
+    report(
+        f"contextual retrieval, {scenario}, llm {llm_seconds * 1000:.0f}ms, query {query_seconds * 1000:.0f}ms",
+        sequential_p50_ms=sequential["p50_ms"],
+        speculative_p50_ms=speculative["p50_ms"],
+        sequential_p99_ms=sequential["p99_ms"],
+        speculative_p99_ms=speculative["p99_ms"],
+    )
+
+    assert speculative_results == sequential_results
+    if scenario == "no new concepts":
+        # The only query overlapped the LLM call
+        assert speculative["p50_ms"] < sequential["p50_ms"]
@@ -2,9 +2,14 @@
 Pytest configuration for Brain OS tests.
 """
 
+import os
 import sys
 from pathlib import Path
 
 # Add src directory to Python path
 src_dir = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_dir))
+
+# src.core.config requires API keys at import time; tests never call the APIs
+os.environ.setdefault("GROQ_API_KEY", "test-groq-key")
+os.environ.setdefault("OPENROUTER_API_KEY", "test-openrouter-key")
@@ -0,0 +1,98 @@
+"""
+Local fake of an OpenAI-compatible chat completions API (Groq, OpenRouter).
+
+Answers every POST .../chat/completions after a configurable latency and
+records how many requests were in flight at once. Point a real client at
+it with base_url:
+
+    async with FakeLLMServer(latency=0.1) as server:
+        client = groq.AsyncGroq(api_key="test", base_url=server.url)
+"""
+
+import asyncio
+import json
+from typing import Callable, Optional
+
+
+class FakeLLMServer:
+    """
+    Args:
+        latency: Seconds each completion takes
+        respond: Builds the reply content from the request body (dict);
+            defaults to "ok"
+    """
+
+    def __init__(self, latency: float = 0.0, respond: Optional[Callable[[dict], str]] = None):
+        self.latency = latency
+        self.respond = respond or (lambda request: "ok")
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "FakeLLMServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                key, _, value = line.decode("latin-1").partition(":")
+                headers[key.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", "0")))
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+            if method != "POST" or not path.rstrip("/").endswith("/chat/completions"):
+                await self._reply(writer, 404, {"error": {"message": f"no route {method} {path}"}})
+                return
+
+            request = json.loads(body or b"{}")
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(self.latency)
+            finally:
+                self.in_flight -= 1
+
+            await self._reply(writer, 200, {
+                "id": f"chatcmpl-{len(self.requests)}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request.get("model", "fake"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.respond(request)},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            })
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _reply(writer: asyncio.StreamWriter, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
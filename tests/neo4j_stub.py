@@ -0,0 +1,173 @@
+"""
+In-process stand-in for the async Neo4j driver.
+
+Implements the slice of the driver API that Neo4jConnection uses (session(),
+execute_read/execute_write, run, verify_connectivity), so the query layer can
+be exercised without a Neo4j server. Queries are answered by a handler
+function; a connection pool, per-query latency and transient failures can be
+simulated.
+
+Managed transactions follow the driver's contract: the transaction function
+is re-run from scratch after a retryable error, up to max_retries times.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from neo4j import READ_ACCESS, WRITE_ACCESS, Record
+
+from src.database.connection import Neo4jConnection
+
+
+@dataclass
+class StubCall:
+    """A query seen by the stub driver."""
+
+    cypher: str
+    params: dict
+    access_mode: Optional[str]
+    attempt: int
+
+
+class StubResult:
+    """Async-iterable result of a stubbed query."""
+
+    def __init__(self, rows: list[dict]):
+        self._records = [Record(row) for row in rows]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self._records:
+            yield record
+
+    async def single(self):
+        return self._records[0] if self._records else None
+
+    async def consume(self):
+        return None
+
+
+class StubTransaction:
+    """Transaction handed to transaction functions."""
+
+    def __init__(self, session: "StubSession", access_mode: str, attempt: int):
+        self._session = session
+        self._access_mode = access_mode
+        self._attempt = attempt
+
+    async def run(self, cypher: str, parameters: Optional[dict] = None, **params) -> StubResult:
+        return await self._session._query(cypher, {**(parameters or {}), **params}, self._access_mode, self._attempt)
+
+
+class StubSession:
+    """Session that borrows a pool slot for each transaction."""
+
+    def __init__(self, driver: "StubDriver", config: dict):
+        self.driver = driver
+        self.config = config
+
+    async def __aenter__(self) -> "StubSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def _query(self, cypher: str, params: dict, access_mode: Optional[str], attempt: int) -> StubResult:
+        driver = self.driver
+        driver.calls.append(StubCall(cypher, params, access_mode, attempt))
+        if driver.failures:
+            raise driver.failures.pop(0)
+        if driver.latency:
+            await asyncio.sleep(driver.latency)
+        rows = driver.handler(cypher, params) if driver.handler else []
+        if asyncio.iscoroutine(rows):
+            rows = await rows
+        return StubResult(rows or [])
+
+    async def _with_connection(self, work):
+        driver = self.driver
+        start = time.perf_counter()
+        async with driver.pool:
+            driver.acquisition_waits.append(time.perf_counter() - start)
+            driver.in_use += 1
+            driver.max_in_use = max(driver.max_in_use, driver.in_use)
+            try:
+                return await work()
+            finally:
+                driver.in_use -= 1
+
+    async def _execute(self, access_mode: str, transaction_function, *args, **kwargs):
+        attempt = 0
+        while True:
+            tx = StubTransaction(self, access_mode, attempt)
+            try:
+                return await self._with_connection(lambda: transaction_function(tx, *args, **kwargs))
+            except Exception as e:
+                retryable = getattr(e, "is_retryable", lambda: False)()
+                if not retryable or attempt >= self.driver.max_retries:
+                    raise
+                attempt += 1
+
+    async def execute_read(self, transaction_function, *args, **kwargs):
+        return await self._execute(READ_ACCESS, transaction_function, *args, **kwargs)
+
+    async def execute_write(self, transaction_function, *args, **kwargs):
+        return await self._execute(WRITE_ACCESS, transaction_function, *args, **kwargs)
+
+    async def run(self, cypher: str, parameters: Optional[dict] = None, **params) -> StubResult:
+        access_mode = self.config.get("default_access_mode")
+        return await self._with_connection(
+            lambda: self._query(cypher, {**(parameters or {}), **params}, access_mode, 0)
+        )
+
+
+@dataclass
+class StubDriver:
+    """
+    Stand-in for neo4j.AsyncDriver.
+
+    Args:
+        handler: Called with (cypher, params) for every query; returns the
+            result rows as dicts (may be a coroutine). None returns no rows.
+        latency: Seconds each query takes
+        pool_size: Concurrent transactions allowed (max_connection_pool_size)
+        failures: Exceptions raised by the next queries, one per query
+        max_retries: Retries of a managed transaction after retryable errors
+    """
+
+    handler: Optional[Callable[[str, dict], list]] = None
+    latency: float = 0.0
+    pool_size: int = 100
+    failures: list = field(default_factory=list)
+    max_retries: int = 3
+
+    def __post_init__(self):
+        self.pool = asyncio.Semaphore(self.pool_size)
+        self.calls: list[StubCall] = []
+        self.sessions: list[StubSession] = []
+        self.acquisition_waits: list[float] = []
+        self.in_use = 0
+        self.max_in_use = 0
+        self.execute_query_bookmark_manager = object()
+
+    def session(self, **config) -> StubSession:
+        session = StubSession(self, config)
+        self.sessions.append(session)
+        return session
+
+    async def verify_connectivity(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+def stub_connection(driver: Optional[StubDriver] = None, **connection_options) -> Neo4jConnection:
+    """Neo4jConnection wired to a stub driver instead of a server."""
+    connection = Neo4jConnection("bolt://stub:7687", "neo4j", "stub", **connection_options)
+    connection.driver = driver or StubDriver()
+    return connection
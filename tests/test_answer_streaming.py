@@ -0,0 +1,131 @@
+"""
+Tests for streaming answer synthesis in query_memories.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.flows import query_memories
+from src.flows.query_memories import AnswerSynthesisConfig, AnswerSynthesisNode
+from src.utils.schemas import BubbleResponse
+
+ANSWER = (
+    "Alice chose PostgreSQL for the billing service because it handles transactions well. "
+    "It replaced MySQL after the 2025 outage."
+)
+REASONING = "Memory [1] records the decision. Memory [2] describes the MySQL outage."
+COMPLETION = f"## Answer\n{ANSWER}\n\n## Reasoning\n{REASONING}\n\n## Confidence\n0.9\n"
+
+
+class FakeStreamingClient:
+    """Returns the completion whole, or streamed in the given chunks."""
+
+    def __init__(self, completion: str, chunks: list[str]):
+        self.completion = completion
+        self.chunks = chunks
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, stream: bool = False, **params):
+        if not stream:
+            message = SimpleNamespace(content=self.completion)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        return self._stream()
+
+    async def _stream(self):
+        # Keep-alive chunks carry no choices or no content
+        yield SimpleNamespace(choices=[])
+        for text in self.chunks:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None))])
+
+
+def split_every(text: str, size: int) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def split_inside_headers(text: str) -> list[str]:
+    """Chunks that end part-way through each "## " heading."""
+    chunks, start = [], 0
+    for heading in ("## Answer", "## Reasoning", "## Confidence"):
+        at = text.index(heading, start)
+        for cut in (at + 1, at + 2, at + 6):
+            chunks.append(text[start:cut])
+            start = cut
+    chunks.append(text[start:])
+    return [chunk for chunk in chunks if chunk]
+
+
+def memories() -> list[BubbleResponse]:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        BubbleResponse(
+            id=f"bubble-{i}", content=content, sector="Semantic", source="test",
+            salience=0.8, created_at=now, valid_from=now
+        )
+        for i, content in enumerate(("Alice chose PostgreSQL for billing", "MySQL outage in 2025"))
+    ]
+
+
+def synthesize(monkeypatch, chunks: list[str], stream_min_chars: int, streamed: bool = True):
+    client = FakeStreamingClient(COMPLETION, chunks)
+    monkeypatch.setattr(query_memories, "get_openrouter_client", lambda: client)
+    node = AnswerSynthesisNode()
+    node.config = AnswerSynthesisConfig(stream_min_chars=stream_min_chars)
+    partials = []
+
+    async def on_partial(answer: str) -> None:
+        partials.append(answer)
+
+    async def run():
+        return await node.synthesize(
+            "Why PostgreSQL?", {"query_type": "rationale"}, memories(),
+            on_partial=on_partial if streamed else None
+        )
+
+    return asyncio.run(run()), partials
+
+
+@pytest.mark.parametrize("stream_min_chars", [1, 40])
+@pytest.mark.parametrize("chunking", ["headers", 1, 3, 7, 64])
+def test_streamed_partials_grow_and_final_result_matches(monkeypatch, chunking, stream_min_chars):
+    chunks = split_inside_headers(COMPLETION) if chunking == "headers" else split_every(COMPLETION, chunking)
+    assert "".join(chunks) == COMPLETION
+
+    result, partials = synthesize(monkeypatch, chunks, stream_min_chars)
+    expected, _ = synthesize(monkeypatch, [], stream_min_chars, streamed=False)
+
+    assert result == expected
+    assert (result["answer"], result["reasoning"]) == (ANSWER, REASONING)
+
+    assert partials and partials[-1] == ANSWER
+    for previous, current in zip(partials, partials[1:]):
+        assert len(current) > len(previous) and current.startswith(previous)
+    for partial in partials:
+        assert ANSWER.startswith(partial)
+        assert "#" not in partial and "Reasoning" not in partial and "Memory [" not in partial
+
+
+def test_partial_answer_holds_back_split_heading():
+    partial = AnswerSynthesisNode._partial_answer
+
+    assert partial("## Ans") == ("", False)
+    assert partial("## Answer\nPostgreSQL.\n\n#") == ("PostgreSQL.", False)
+    assert partial("## Answer\nPostgreSQL.\n\n##") == ("PostgreSQL.", False)
+    assert partial("## Answer\nPostgreSQL.\n\n## Rea") == ("PostgreSQL.", True)
+
+
+def test_failed_progress_delivery_does_not_abort_synthesis(monkeypatch):
+    client = FakeStreamingClient(COMPLETION, split_every(COMPLETION, 5))
+    monkeypatch.setattr(query_memories, "get_openrouter_client", lambda: client)
+
+    async def on_partial(answer: str) -> None:
+        raise ConnectionError("client went away")
+
+    result = asyncio.run(AnswerSynthesisNode().synthesize(
+        "Why PostgreSQL?", {}, memories(), on_partial=on_partial
+    ))
+
+    assert (result["answer"], result["reasoning"]) == (ANSWER, REASONING)
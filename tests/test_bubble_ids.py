@@ -0,0 +1,57 @@
+"""
+Tests for bubble ID parsing in lookups.
+"""
+
+import asyncio
+
+import pytest
+
+from src.database.queries import memory
+from src.database.queries.memory import (
+    bubble_id_predicate, delete_bubble, get_bubble_by_id, update_bubble_observations
+)
+from tests.neo4j_stub import StubDriver, stub_connection
+
+UID = "01927c3e-8f1a-7b2c-9d4e-5f6a7b8c9d0e"
+
+
+def test_uid_seeks_uid_property():
+    assert bubble_id_predicate(f" {UID.upper()} ") == ("b.uid = $bubble_ref", UID)
+
+
+def test_legacy_numeric_id_uses_internal_id():
+    assert bubble_id_predicate("42", alias="center") == ("id(center) = $bubble_ref", 42)
+    assert bubble_id_predicate(7) == ("id(b) = $bubble_ref", 7)
+
+
+def test_element_id_uses_element_id():
+    element_id = "4:c0a65d96-4993-4b0c-b036-e7ebd9174905:14"
+    assert bubble_id_predicate(element_id) == ("elementId(b) = $bubble_ref", element_id)
+    assert bubble_id_predicate("4:abc123:14") == ("elementId(b) = $bubble_ref", "4:abc123:14")
+
+
+@pytest.mark.parametrize("bubble_id", [
+    "", "   ", "not-an-id", "-4", "4.5", "01927c3e-8f1a-7b2c", "abc:def", "4:abc123", "4:abc:14:2", "4: :14",
+])
+def test_malformed_id_rejected(bubble_id):
+    with pytest.raises(ValueError, match="Invalid bubble ID"):
+        bubble_id_predicate(bubble_id)
+
+
+@pytest.mark.parametrize("lookup", [
+    lambda: get_bubble_by_id("not-an-id"),
+    lambda: delete_bubble("not-an-id"),
+    lambda: update_bubble_observations("not-an-id", ["note"]),
+])
+def test_lookups_reject_malformed_id_before_querying(monkeypatch, lookup):
+    driver = StubDriver()
+    connection = stub_connection(driver)
+
+    async def get_connection():
+        return connection
+
+    monkeypatch.setattr(memory, "get_connection", get_connection)
+
+    with pytest.raises(ValueError):
+        asyncio.run(lookup())
+    assert driver.calls == []
@@ -0,0 +1,127 @@
+"""
+Tests for incremental cloud synthesis (clustering, watermark, supersession).
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from src.database.queries import clouds, memory, tasks
+from src.database.queries.clouds import merge_cooccurring_clusters
+from src.flows import cloud_synthesis
+from src.tasks.background import cloud_synthesis_task
+from src.utils.schemas import BubbleResponse
+from tests.neo4j_stub import StubDriver, stub_connection
+
+
+def _members(*uids):
+    return [{"uid": uid, "content": f"memory {uid}", "sector": "Semantic", "salience": 0.8} for uid in uids]
+
+
+def _cluster(entity, *uids):
+    return {"entity": entity, "size": len(uids), "members": _members(*uids)}
+
+
+def test_merge_cooccurring_clusters():
+    merged = merge_cooccurring_clusters([
+        _cluster("fastapi", "a", "b", "c", "d"),
+        _cluster("brain os", "a", "b", "c"),
+        _cluster("alice", "x", "y", "z"),
+    ])
+
+    assert [c["key"] for c in merged] == ["brain os|fastapi", "alice"]
+    assert merged[0]["entities"] == ["brain os", "fastapi"]
+    assert [m["uid"] for m in merged[0]["members"]] == ["a", "b", "c", "d"]
+
+
+def test_clouds_identified_by_source_not_sector(monkeypatch):
+    driver = StubDriver()
+    connection = stub_connection(driver)
+
+    async def get_connection():
+        return connection
+
+    monkeypatch.setattr(clouds, "get_connection", get_connection)
+
+    async def run():
+        await clouds.find_entity_clusters(datetime(2026, 1, 1, tzinfo=timezone.utc))
+        await clouds.link_cloud("cloud-1", "alice", ["alice"], ["a"])
+
+    asyncio.run(run())
+    # User-authored Reflective memories are clustered and never retired as clouds
+    for call in driver.calls:
+        assert "sector" not in call.cypher.replace(".sector", "")
+        assert call.params["cloud_source"] == clouds.CLOUD_SOURCE
+
+
+class FakeCloudStore:
+    """Stand-ins for the queries and LLM call used by cloud_synthesis_task."""
+
+    def __init__(self, clusters, fail_topics=()):
+        self.clusters = clusters
+        self.fail_topics = set(fail_topics)
+        self.watermark = None
+        self.links = []
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(clouds, "find_entity_clusters", self.find_entity_clusters)
+        monkeypatch.setattr(clouds, "link_cloud", self.link_cloud)
+        monkeypatch.setattr(memory, "upsert_bubble", self.upsert_bubble)
+        monkeypatch.setattr(tasks, "get_task_watermark", self.get_task_watermark)
+        monkeypatch.setattr(tasks, "set_task_watermark", self.set_task_watermark)
+        monkeypatch.setattr(cloud_synthesis, "synthesize_cloud", self.synthesize_cloud)
+
+    async def find_entity_clusters(self, since, **options):
+        self.since = since
+        return self.clusters
+
+    async def synthesize_cloud(self, topic, members):
+        if topic in self.fail_topics:
+            raise RuntimeError("LLM unavailable")
+        return f"Insight about {topic}"
+
+    async def upsert_bubble(self, data):
+        now = datetime.now(timezone.utc)
+        return BubbleResponse.model_construct(
+            id=f"cloud-{len(self.links)}", content=data.content, sector=data.sector,
+            source=data.source, salience=data.salience, created_at=now, valid_from=now,
+            entities=data.entities,
+        )
+
+    async def link_cloud(self, cloud_uid, cloud_key, entities, source_uids):
+        self.links.append((cloud_key, entities, source_uids))
+        return len(source_uids)
+
+    async def get_task_watermark(self, name):
+        return self.watermark
+
+    async def set_task_watermark(self, name, watermark):
+        self.watermark = watermark
+
+
+def test_every_cluster_processed_and_watermark_advanced(monkeypatch):
+    clusters = [_cluster(f"entity{i}", *(f"e{i}-{j}" for j in range(5))) for i in range(30)]
+    store = FakeCloudStore(clusters)
+    store.install(monkeypatch)
+
+    result = asyncio.run(cloud_synthesis_task())
+
+    assert result["clouds_generated"] == 30
+    assert "error" not in result
+    assert store.watermark is not None
+    key, entities, source_uids = store.links[0]
+    assert key == "entity0" and entities == ["entity0"]
+    assert source_uids == [f"e0-{j}" for j in range(5)]
+
+
+def test_watermark_held_when_a_cluster_fails(monkeypatch):
+    store = FakeCloudStore(
+        [_cluster("alice", "a", "b", "c", "d", "e"), _cluster("bob", "v", "w", "x", "y", "z")],
+        fail_topics={"bob"},
+    )
+    store.install(monkeypatch)
+
+    result = asyncio.run(cloud_synthesis_task())
+
+    assert result["clouds_generated"] == 1
+    assert "watermark not advanced" in result["error"]
+    assert store.watermark is None
@@ -0,0 +1,102 @@
+"""
+Tests for Neo4jConnection managed transactions, using the stub driver.
+
+The stub follows the driver's managed-transaction contract: the transaction
+function is re-run from scratch after a retryable error.
+"""
+
+import asyncio
+
+import pytest
+from neo4j import READ_ACCESS, WRITE_ACCESS
+from neo4j.exceptions import ClientError, ServiceUnavailable, TransientError
+
+from src.database.connection import Neo4jConnection
+from src.database.queries import memory
+from tests.neo4j_stub import StubDriver, stub_connection
+
+
+def _rows(cypher, params):
+    return [{"n": 1}, {"n": 2}]
+
+
+def test_read_uses_managed_read_transaction():
+    driver = StubDriver(handler=_rows)
+    records = asyncio.run(stub_connection(driver).read("MATCH (n) RETURN n", limit=5))
+
+    assert [record["n"] for record in records] == [1, 2]
+    assert [call.access_mode for call in driver.calls] == [READ_ACCESS]
+    assert driver.calls[0].params == {"limit": 5}
+
+
+def test_write_uses_managed_write_transaction():
+    driver = StubDriver(handler=_rows)
+    asyncio.run(stub_connection(driver).write("CREATE (n) RETURN n"))
+
+    assert [call.access_mode for call in driver.calls] == [WRITE_ACCESS]
+
+
+def test_sessions_use_configured_database_and_bookmarks():
+    driver = StubDriver()
+    connection = stub_connection(driver, database="brainos", fetch_size=250)
+    asyncio.run(connection.read("RETURN 1"))
+
+    config = driver.sessions[0].config
+    assert config["database"] == "brainos"
+    assert config["fetch_size"] == 250
+    assert config["bookmark_manager"] is driver.execute_query_bookmark_manager
+
+
+@pytest.mark.parametrize("error", [TransientError("deadlock"), ServiceUnavailable("leader switch")])
+def test_transient_errors_are_retried(error):
+    driver = StubDriver(handler=_rows, failures=[error])
+    records = asyncio.run(stub_connection(driver).read("MATCH (n) RETURN n"))
+
+    # The retry re-runs the transaction function, so records are not duplicated
+    assert [record["n"] for record in records] == [1, 2]
+    assert [call.attempt for call in driver.calls] == [0, 1]
+
+
+def test_write_retried_after_transient_error():
+    driver = StubDriver(handler=_rows, failures=[TransientError("lock timeout"), TransientError("deadlock")])
+    asyncio.run(stub_connection(driver).write("CREATE (n) RETURN n"))
+
+    assert len(driver.calls) == 3
+    assert {call.access_mode for call in driver.calls} == {WRITE_ACCESS}
+
+
+def test_client_errors_are_not_retried():
+    driver = StubDriver(handler=_rows, failures=[ClientError("syntax error")])
+    with pytest.raises(ClientError):
+        asyncio.run(stub_connection(driver).read("MATCH (n RETURN n"))
+    assert len(driver.calls) == 1
+
+
+def test_retries_give_up_after_limit():
+    driver = StubDriver(handler=_rows, failures=[TransientError("busy")] * 4, max_retries=3)
+    with pytest.raises(TransientError):
+        asyncio.run(stub_connection(driver).read("MATCH (n) RETURN n"))
+    assert len(driver.calls) == 4
+
+
+def test_session_requires_connect():
+    with pytest.raises(RuntimeError):
+        Neo4jConnection("bolt://stub:7687", "neo4j", "stub").session()
+
+
+def test_query_helpers_route_reads_and_writes(monkeypatch):
+    driver = StubDriver()
+    connection = stub_connection(driver)
+
+    async def get_connection():
+        return connection
+
+    monkeypatch.setattr(memory, "get_connection", get_connection)
+
+    async def run():
+        assert await memory.get_bubble_by_id("0190c5d2-7a3b-7c4d-8e5f-0123456789ab") is None
+        assert await memory.get_all_bubbles(limit=5) == []
+        assert await memory.delete_bubble("0190c5d2-7a3b-7c4d-8e5f-0123456789ab") is False
+
+    asyncio.run(run())
+    assert [call.access_mode for call in driver.calls] == [READ_ACCESS, READ_ACCESS, WRITE_ACCESS]
@@ -0,0 +1,85 @@
+"""
+Tests for token-budgeted context packing.
+"""
+
+from src.utils.context_packing import (
+    TRUNCATION_MARKER, estimate_tokens, pack_memories, truncate_to_tokens
+)
+
+
+def render(index, memory, content) -> str:
+    return f"[{index}] {content}"
+
+
+def memory(index: int, words: int = 20, salience: float = 0.5) -> dict:
+    """A memory whose words are unique to it, so it is never a duplicate."""
+    return {"content": " ".join(f"m{index}w{i}" for i in range(words)), "salience": salience}
+
+
+def test_empty_input_packs_nothing():
+    packed = pack_memories([], budget_tokens=1000, render=render)
+
+    assert packed.memories == [] and packed.text() == ""
+    assert (packed.tokens, packed.dropped, packed.truncated) == (0, 0, 0)
+
+
+def test_memories_over_budget_are_dropped():
+    memories = [memory(i) for i in range(10)]
+    one = estimate_tokens(render(0, memories[0], memories[0]["content"]))
+
+    packed = pack_memories(memories, budget_tokens=one * 3, render=render, min_truncated_tokens=10_000)
+
+    assert packed.memories == memories[:3]
+    assert packed.dropped == 7 and packed.truncated == 0
+    assert packed.tokens <= one * 3
+
+
+def test_single_oversized_memory_is_truncated_to_budget():
+    big = memory(0, words=2000)
+
+    packed = pack_memories([big], budget_tokens=200, render=render)
+
+    assert packed.memories == [big] and packed.truncated == 1 and packed.dropped == 0
+    assert packed.tokens <= 200
+    assert packed.texts[0].startswith("[0] m0w0 ") and packed.texts[0].endswith(TRUNCATION_MARKER)
+
+
+def test_oversized_memory_dropped_when_too_little_room():
+    packed = pack_memories([memory(0, words=2000)], budget_tokens=20, render=render, min_truncated_tokens=32)
+
+    assert packed.memories == [] and packed.dropped == 1
+
+
+def test_orders_by_relevance_times_salience():
+    low, high, mid = memory(0, salience=0.1), memory(1, salience=0.9), memory(2, salience=0.5)
+
+    packed = pack_memories([low, high, mid], budget_tokens=10_000, render=render)
+
+    assert packed.memories == [high, mid, low]
+    # Rendered with their original indices
+    assert [text.split()[0] for text in packed.texts] == ["[1]", "[2]", "[0]"]
+
+
+def test_query_match_outranks_retrieval_order():
+    first = {"content": "notes about the garden", "salience": 0.5}
+    second = {"content": "PostgreSQL chosen for the database", "salience": 0.5}
+
+    packed = pack_memories([first, second], budget_tokens=10_000, render=render, query="postgresql database")
+
+    assert packed.memories == [second, first]
+
+
+def test_near_duplicates_and_max_items():
+    original = {"content": "Alice chose PostgreSQL for the billing service", "salience": 0.9}
+    duplicate = {"content": "Alice chose PostgreSQL for the billing service.", "salience": 0.5}
+    others = [memory(i) for i in range(1, 4)]
+
+    packed = pack_memories([original, duplicate, *others], budget_tokens=10_000, render=render, max_items=2)
+
+    assert packed.memories == [original, others[0]]
+    assert packed.duplicates == 1 and packed.dropped == 2
+
+
+def test_truncate_to_tokens_keeps_short_text():
+    assert truncate_to_tokens("short text", 100) == "short text"
+    assert truncate_to_tokens("some longer text here", 0) == ""
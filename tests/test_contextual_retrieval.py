@@ -0,0 +1,135 @@
+"""
+Tests for speculative retrieval in the contextual retrieval flow.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.flows import contextual_retrieval
+from src.flows.contextual_retrieval import contextual_retrieval_flow
+from src.utils import llm_cache
+from src.utils.llm_cache import LLMCache
+from tests.neo4j_stub import StubDriver
+
+
+class FakeClient:
+    """Answers chat completions with a fixed JSON content."""
+
+    def __init__(self, content: dict, latency: float = 0.0):
+        self.content = json.dumps(content)
+        self.latency = latency
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **params):
+        await asyncio.sleep(self.latency)
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def bubble_row(uid: str, content: str, salience: float = 0.5) -> dict:
+    return {
+        "bubble": {
+            "uid": uid, "content": content, "sector": "Semantic", "source": "test",
+            "salience": salience, "created_at": "2026-01-01T00:00:00Z",
+        },
+        "relations": [],
+    }
+
+
+def search_terms(params: dict) -> list[str]:
+    return [value for key, value in params.items() if key.startswith("search")]
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """Patches the flow's LLM clients; returns a setter for the analyzed context."""
+    monkeypatch.setattr(llm_cache, "get_llm_cache", lambda: LLMCache(None))
+    monkeypatch.setattr(contextual_retrieval, "get_openrouter_client", lambda: FakeClient({"themes": []}))
+
+    def analyze(context: dict, latency: float = 0.0):
+        client = FakeClient(context, latency)
+        monkeypatch.setattr(contextual_retrieval, "get_groq_client", lambda: client)
+
+    return analyze
+
+
+def run_flow(driver: StubDriver, user_input: str = "postgres", **options) -> dict:
+    shared = {
+        "neo4j_driver": driver,
+        "user_input": user_input,
+        "conversation_history": [],
+        "time_scope": "auto",
+        "salience_filter": "auto",
+        **options,
+    }
+    asyncio.run(contextual_retrieval_flow.run_async(shared))
+    return shared
+
+
+def test_speculative_results_reused_when_filters_match(llm):
+    llm({"intent": "db", "related_concepts": ["database"], "time_scope": "all_time", "salience_filter": "any"})
+    driver = StubDriver(handler=lambda cypher, params: [
+        bubble_row(term, f"about {term}") for term in search_terms(params)
+    ])
+
+    shared = run_flow(driver)
+
+    assert [search_terms(call.params) for call in driver.calls] == [["postgres"], ["database"]]
+    assert [b["id"] for b in shared["query_results"]] == ["postgres", "database"]
+
+
+def test_speculative_query_rerun_with_stricter_resolved_filters(llm):
+    llm({"intent": "db", "related_concepts": ["database"], "time_scope": "recent", "salience_filter": "high"})
+    driver = StubDriver(handler=lambda cypher, params: [bubble_row(term, term) for term in search_terms(params)])
+
+    shared = run_flow(driver)
+
+    speculative, resolved = driver.calls
+    assert "since" not in speculative.params and "min_salience" not in speculative.params
+    assert search_terms(resolved.params) == ["postgres", "database"]
+    assert resolved.params["since"] is not None
+    assert resolved.params["min_salience"] == contextual_retrieval.HIGH_SALIENCE
+    assert "speculative_query" not in shared
+
+
+def test_speculative_query_cancelled_when_flow_fails(llm, monkeypatch):
+    llm({"intent": "db", "related_concepts": [], "time_scope": "all_time", "salience_filter": "any"})
+    cancelled = []
+
+    async def slow_handler(cypher, params):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(search_terms(params))
+            raise
+        return []
+
+    async def fail(self, shared):
+        raise RuntimeError("query node failed")
+
+    monkeypatch.setattr(contextual_retrieval.ContextualQueryNode, "prep_async", fail)
+    driver = StubDriver(handler=slow_handler)
+
+    async def run():
+        shared = {"neo4j_driver": driver, "user_input": "postgres", "time_scope": "auto", "salience_filter": "auto"}
+        with pytest.raises(RuntimeError):
+            await contextual_retrieval_flow.run_async(shared)
+        await asyncio.sleep(0)
+        # Checked before asyncio.run() cancels leftover tasks on shutdown
+        assert cancelled == [["postgres"]]
+        assert "speculative_query" not in shared
+
+    asyncio.run(run())
+
+
+def test_non_speculative_runs_one_query(llm):
+    llm({"intent": "db", "related_concepts": ["database"], "time_scope": "all_time", "salience_filter": "any"})
+    driver = StubDriver(handler=lambda cypher, params: [bubble_row(term, term) for term in search_terms(params)])
+
+    shared = run_flow(driver, speculative=False)
+
+    assert [search_terms(call.params) for call in driver.calls] == [["postgres", "database"]]
+    assert [b["id"] for b in shared["query_results"]] == ["postgres", "database"]
@@ -0,0 +1,67 @@
+"""
+Concurrency tests for the Groq client against a local fake Groq server.
+"""
+
+import asyncio
+import time
+
+import groq
+
+from src.utils import llm
+from src.utils.llm import ConcurrencyLimitedClient, get_groq_client
+from tests.fake_llm_server import FakeLLMServer
+
+LATENCY = 0.2
+
+
+async def _complete(client) -> str:
+    response = await client.chat.completions.create(
+        model="openai/gpt-oss-120b",
+        messages=[{"role": "user", "content": "ping"}],
+        temperature=0,
+    )
+    return response.choices[0].message.content
+
+
+async def _run_parallel(requests: int, max_concurrency: int) -> tuple[float, FakeLLMServer, list]:
+    async with FakeLLMServer(latency=LATENCY) as server:
+        client = ConcurrencyLimitedClient(
+            groq.AsyncGroq(api_key="test", base_url=server.url, max_retries=0),
+            max_concurrency
+        )
+        start = time.perf_counter()
+        results = await asyncio.gather(*(_complete(client) for _ in range(requests)))
+        return time.perf_counter() - start, server, results
+
+
+def test_parallel_requests_take_max_not_sum_of_latency():
+    elapsed, server, results = asyncio.run(_run_parallel(requests=8, max_concurrency=8))
+
+    assert results == ["ok"] * 8
+    assert server.max_in_flight == 8
+    # Sequential calls would take 8 * LATENCY
+    assert elapsed < 3 * LATENCY
+
+
+def test_in_flight_requests_never_exceed_limit():
+    elapsed, server, results = asyncio.run(_run_parallel(requests=9, max_concurrency=3))
+
+    assert len(results) == 9
+    assert len(server.requests) == 9
+    assert server.max_in_flight == 3
+    # Three waves of three
+    assert elapsed >= 3 * LATENCY * 0.9
+
+
+def test_get_groq_client_applies_configured_limit(monkeypatch):
+    monkeypatch.setenv("GROQ_MAX_CONCURRENCY", "4")
+    get_groq_client.cache_clear()
+    try:
+        client = get_groq_client()
+        assert isinstance(client, ConcurrencyLimitedClient)
+        assert client.max_concurrency == 4
+        assert isinstance(client._client, groq.AsyncGroq)
+        # Other attributes reach the wrapped client
+        assert client.api_key == llm.GroqConfig.from_env().api_key
+    finally:
+        get_groq_client.cache_clear()
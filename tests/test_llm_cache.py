@@ -0,0 +1,180 @@
+"""
+Tests for the LLM response cache (memory LRU/TTL and SQLite backends).
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.utils import llm_cache
+from src.utils.llm_cache import (
+    LLMCache, MemoryCacheBackend, SQLiteCacheBackend, cached_completion, get_llm_cache
+)
+
+MESSAGES = [{"role": "user", "content": "Extract concepts: Alice chose PostgreSQL"}]
+
+
+class FakeClient:
+    """Counts chat completion calls and answers with a fixed content."""
+
+    def __init__(self, content: str = "postgresql, alice"):
+        self.content = content
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **params):
+        self.calls += 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+
+    async def run():
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        assert await backend.get("a") == "1"  # a is now most recent
+        await backend.set("c", "3")
+        return [await backend.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(run()) == ["1", None, "3"]
+    assert len(backend) == 2
+
+
+def test_memory_backend_expires_entries(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "monotonic", clock)
+    backend = MemoryCacheBackend(ttl_seconds=60)
+
+    async def run():
+        await backend.set("a", "1")
+        clock.now += 59
+        fresh = await backend.get("a")
+        clock.now += 2
+        return fresh, await backend.get("a")
+
+    assert asyncio.run(run()) == ("1", None)
+    assert len(backend) == 0
+
+
+def test_sqlite_backend_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+
+    async def run():
+        await SQLiteCacheBackend(path).set("a", "1")
+        return await SQLiteCacheBackend(path).get("a")
+
+    assert asyncio.run(run()) == "1"
+
+
+def test_sqlite_backend_ttl_and_lru(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "time", clock)
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), max_entries=2, ttl_seconds=60)
+
+    async def run():
+        await backend.set("a", "1")
+        clock.now += 1
+        await backend.set("b", "2")
+        clock.now += 1
+        await backend.get("a")  # a is now most recent
+        clock.now += 1
+        await backend.set("c", "3")
+        evicted = [await backend.get(key) for key in ("a", "b", "c")]
+        clock.now += 120
+        expired = await backend.get("c")
+        return evicted, expired
+
+    assert asyncio.run(run()) == (["1", None, "3"], None)
+
+
+def test_cache_key_covers_model_temperature_and_prompt():
+    key = LLMCache.make_key("m", MESSAGES, 0, max_tokens=200)
+    assert key == LLMCache.make_key("m", list(MESSAGES), 0, max_tokens=200)
+    assert key != LLMCache.make_key("other", MESSAGES, 0, max_tokens=200)
+    assert key != LLMCache.make_key("m", MESSAGES, 0.5, max_tokens=200)
+    assert key != LLMCache.make_key("m", MESSAGES, 0, max_tokens=100)
+    assert key != LLMCache.make_key("m", [{"role": "user", "content": "other"}], 0, max_tokens=200)
+
+
+def test_deterministic_requests_hit_the_cache():
+    client = FakeClient()
+    cache = LLMCache(MemoryCacheBackend())
+
+    async def run():
+        return [
+            await cached_completion(client, model="m", messages=MESSAGES, temperature=0, cache=cache)
+            for _ in range(3)
+        ]
+
+    assert asyncio.run(run()) == ["postgresql, alice"] * 3
+    assert client.calls == 1
+    assert cache.stats() == {
+        "backend": "MemoryCacheBackend", "hits": 2, "misses": 1, "bypassed": 0, "hit_rate": 0.667,
+    }
+
+
+def test_sampled_requests_bypass_the_cache():
+    client = FakeClient()
+    cache = LLMCache(MemoryCacheBackend())
+
+    async def run():
+        for _ in range(2):
+            await cached_completion(client, model="m", messages=MESSAGES, temperature=0.7, cache=cache)
+
+    asyncio.run(run())
+    assert client.calls == 2
+    assert (cache.hits, cache.misses, cache.bypassed) == (0, 0, 2)
+
+
+def test_empty_responses_are_not_cached():
+    client = FakeClient(content="")
+    cache = LLMCache(MemoryCacheBackend())
+
+    async def run():
+        for _ in range(2):
+            await cached_completion(client, model="m", messages=MESSAGES, temperature=0, cache=cache)
+
+    asyncio.run(run())
+    assert client.calls == 2
+
+
+def test_backend_failure_falls_through_to_the_llm():
+    class BrokenBackend:
+        async def get(self, key):
+            raise OSError("disk full")
+
+        async def set(self, key, value):
+            raise OSError("disk full")
+
+    client = FakeClient()
+    cache = LLMCache(BrokenBackend())
+    content = asyncio.run(
+        cached_completion(client, model="m", messages=MESSAGES, temperature=0, cache=cache)
+    )
+
+    assert content == "postgresql, alice"
+    assert cache.misses == 1
+
+
+def test_get_llm_cache_backend_from_env(monkeypatch, tmp_path):
+    get_llm_cache.cache_clear()
+    try:
+        monkeypatch.setenv("BRAINOS_LLM_CACHE_BACKEND", "sqlite")
+        monkeypatch.setenv("BRAINOS_LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        assert isinstance(get_llm_cache().backend, SQLiteCacheBackend)
+
+        get_llm_cache.cache_clear()
+        monkeypatch.setenv("BRAINOS_LLM_CACHE_BACKEND", "off")
+        assert get_llm_cache().backend is None
+        assert not get_llm_cache().cacheable(0)
+    finally:
+        get_llm_cache.cache_clear()
@@ -0,0 +1,90 @@
+"""
+Tests for atomic observation updates.
+
+The Neo4j test runs concurrent appends against a real server and requires
+BRAINOS_BENCHMARK_NEO4J_URI.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+from src.database.queries import memory
+from src.database.queries.memory import update_bubble_observations
+from tests.benchmarks.harness import BENCHMARK_SOURCE, benchmark_neo4j, benchmark_size, seed_bubbles
+from tests.neo4j_stub import StubDriver, stub_connection
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+UID = "0192f0c4-0000-7000-8000-000000000001"
+
+
+def _use_stub(monkeypatch, handler) -> StubDriver:
+    driver = StubDriver(handler=handler)
+    connection = stub_connection(driver)
+
+    async def get_connection():
+        return connection
+
+    monkeypatch.setattr(memory, "get_connection", get_connection)
+    return driver
+
+
+def test_append_is_one_write_statement(monkeypatch):
+    def handler(cypher, params):
+        bubble = {
+            "content": "memory", "sector": "Semantic", "salience": 0.5, "created_at": NOW,
+            "observations": params["observations"],
+        }
+        return [{"bubble": bubble, "uid": UID}]
+
+    driver = _use_stub(monkeypatch, handler)
+
+    bubble = asyncio.run(update_bubble_observations(UID, ["a", "b"], append=True))
+
+    assert bubble.observations == ["a", "b"]
+    assert len(driver.calls) == 1
+    call = driver.calls[0]
+    assert call.access_mode == "WRITE"
+    assert call.params["append"] is True and call.params["bubble_ref"] == UID
+    # The merge happens server-side, after the lock taken by the first SET
+    assert call.cypher.index("SET b.last_accessed") < call.cypher.index("coalesce(b.observations, [])")
+
+
+def test_missing_bubble_returns_none(monkeypatch):
+    _use_stub(monkeypatch, lambda cypher, params: [])
+
+    assert asyncio.run(update_bubble_observations(UID, ["a"], append=True)) is None
+
+
+def test_concurrent_appends_keep_every_observation(monkeypatch):
+    writers = benchmark_size("BRAINOS_BENCHMARK_OBSERVATION_WRITERS", 20)
+    marker = uuid.uuid4().hex
+    row = {
+        "content": f"observed {marker}", "sector": "Semantic", "salience": 0.5,
+        "memory_type": "thinking", "entities": [], "created_at": NOW,
+    }
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch, memory) as connection:
+            await seed_bubbles(connection, [row])
+            records = await connection.read(
+                "MATCH (b:Bubble {source: $source, content: $content}) RETURN b.uid AS uid",
+                source=BENCHMARK_SOURCE,
+                content=row["content"]
+            )
+            uid = records[0]["uid"]
+            # Every writer also appends the shared observation, which must be kept once
+            await asyncio.gather(*(
+                update_bubble_observations(uid, [f"writer {i}", "shared"], append=True)
+                for i in range(writers)
+            ))
+            records = await connection.read(
+                "MATCH (b:Bubble {uid: $uid}) RETURN b.observations AS observations",
+                uid=uid
+            )
+            return records[0]["observations"]
+
+    observations = asyncio.run(run())
+
+    assert len(observations) == len(set(observations))
+    assert set(observations) == {f"writer {i}" for i in range(writers)} | {"shared"}
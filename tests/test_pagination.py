@@ -0,0 +1,91 @@
+"""
+Tests for keyset pagination of bubble listings and searches.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from src.database.queries import memory
+from src.database.queries.memory import (
+    decode_cursor, encode_cursor, get_bubbles_page, search_bubbles_page
+)
+from tests.neo4j_stub import StubDriver, stub_connection
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _use_stub(monkeypatch, handler) -> StubDriver:
+    driver = StubDriver(handler=handler)
+    connection = stub_connection(driver)
+
+    async def get_connection():
+        return connection
+
+    monkeypatch.setattr(memory, "get_connection", get_connection)
+    return driver
+
+
+def _bubble(i: int) -> dict:
+    return {"content": f"memory {i}", "sector": "Semantic", "salience": 0.5, "created_at": NOW}
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(NOW, "u1")) == (NOW, "u1")
+    assert decode_cursor(encode_cursor(1.25, "u2")) == (1.25, "u2")
+
+
+def test_malformed_cursor_rejected():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_search_pages_follow_score_order(monkeypatch):
+    scores = [3.0, 2.5, 2.5, 1.0]
+
+    def handler(cypher, params):
+        rows = [
+            {"bubble": _bubble(i), "uid": f"u{9 - i}", "score": score}
+            for i, score in enumerate(scores)
+        ]
+        if "cursor_score" in params:
+            rows = [
+                row for row in rows
+                if row["score"] < params["cursor_score"]
+                or (row["score"] == params["cursor_score"] and row["uid"] < params["cursor_uid"])
+            ]
+        return rows[:params["page_limit"]]
+
+    driver = _use_stub(monkeypatch, handler)
+
+    async def walk():
+        first = await search_bubbles_page("memory", limit=2)
+        second = await search_bubbles_page("memory", limit=2, cursor=first.next_cursor)
+        return first, second
+
+    first, second = asyncio.run(walk())
+    assert [b.id for b in first.bubbles] == ["u9", "u8"]
+    assert decode_cursor(first.next_cursor) == (2.5, "u8")
+    assert [b.id for b in second.bubbles] == ["u7", "u6"]
+    assert second.next_cursor is None
+    assert "ORDER BY score DESC, b.uid DESC" in driver.calls[0].cypher
+
+
+def test_listing_cursor_cannot_resume_search(monkeypatch):
+    _use_stub(monkeypatch, lambda cypher, params: [])
+    with pytest.raises(ValueError):
+        asyncio.run(search_bubbles_page("memory", cursor=encode_cursor(NOW, "u1")))
+    with pytest.raises(ValueError):
+        asyncio.run(get_bubbles_page(cursor=encode_cursor(1.0, "u1")))
+
+
+def test_listing_pages_seek_created_at(monkeypatch):
+    driver = _use_stub(monkeypatch, lambda cypher, params: [])
+    asyncio.run(get_bubbles_page(limit=10, cursor=encode_cursor(NOW, "u1")))
+
+    call = driver.calls[0]
+    assert call.params["cursor_created_at"] == NOW
+    assert call.params["page_limit"] == 11
+    assert call.cypher.index("$cursor_created_at") < call.cypher.index("ORDER BY")
+
@@ -0,0 +1,468 @@
+"""
+Tests for the background task scheduler, driven by a fake clock.
+
+The replica test runs schedulers in separate processes against a real Neo4j
+server and runs only when BRAINOS_BENCHMARK_NEO4J_URI points at a
+disposable instance.
+"""
+
+import asyncio
+import multiprocessing
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from src.database.queries import tasks as task_queries
+from src.tasks.scheduler import TaskScheduler
+from tests.benchmarks.harness import benchmark_connection, benchmark_neo4j, benchmark_size
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+TICK_SECONDS = 60
+
+
+class FakeClock:
+    """
+    Clock that tests move forward explicitly.
+
+    Sleepers wait until the fake time reaches their wake-up time, so several
+    schedulers and lease renewals can share one clock.
+    """
+
+    def __init__(self, now: datetime = START):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        wake = self.now + timedelta(seconds=seconds)
+        while self.now < wake:
+            await asyncio.sleep(0)
+
+    async def advance_to(self, until: datetime, step: timedelta = timedelta(seconds=TICK_SECONDS)) -> None:
+        """Step time forward, letting sleepers and started tasks run at each step."""
+        while True:
+            for _ in range(20):
+                await asyncio.sleep(0)
+            if self.now >= until:
+                return
+            self.now = min(self.now + step, until)
+
+
+def _scheduler(clock: FakeClock, registry: dict, **options) -> TaskScheduler:
+    options.setdefault("jitter_fraction", 0.0)
+    options.setdefault("persist", False)
+    return TaskScheduler(
+        registry,
+        tick_seconds=TICK_SECONDS,
+        clock=clock,
+        sleep=clock.sleep,
+        rng=random.Random(0),
+        **options
+    )
+
+
+def _recording_task(clock: FakeClock, runs: list):
+    async def task():
+        runs.append(clock.now)
+        return {"status": "completed"}
+    return task
+
+
+def test_runs_on_interval():
+    clock = FakeClock()
+    runs = []
+    registry = {"hourly": {"interval_hours": 1, "function": _recording_task(clock, runs)}}
+
+    async def run():
+        scheduler = _scheduler(clock, registry)
+        await scheduler.start()
+        await clock.advance_to(START + timedelta(hours=2))
+        await scheduler.stop()
+
+    asyncio.run(run())
+    assert runs == [START, START + timedelta(hours=1), START + timedelta(hours=2)]
+    assert registry["hourly"]["status"] == "completed"
+    assert registry["hourly"]["next_run"] == (START + timedelta(hours=3)).isoformat()
+
+
+def test_jitter_delays_runs_within_fraction():
+    clock = FakeClock()
+    runs = []
+    registry = {"hourly": {"interval_hours": 1, "function": _recording_task(clock, runs)}}
+
+    async def run():
+        scheduler = _scheduler(clock, registry, jitter_fraction=0.1)
+        await scheduler.start()
+        await clock.advance_to(START + timedelta(hours=6))
+        await scheduler.stop()
+
+    asyncio.run(run())
+    # The first run falls within the first jitter window
+    assert runs[0] <= START + timedelta(hours=0.1, seconds=TICK_SECONDS)
+    gaps = [later - earlier for earlier, later in zip(runs, runs[1:])]
+    assert len(gaps) >= 4
+    for gap in gaps:
+        assert timedelta(hours=1) <= gap <= timedelta(hours=1.1, seconds=TICK_SECONDS)
+    # Jitter is random, so runs do not land on a fixed hourly grid
+    assert len(set(gaps)) > 1
+
+
+def test_skips_task_still_running():
+    clock = FakeClock()
+    runs = []
+    state = {}
+
+    async def slow_task():
+        runs.append(clock.now)
+        await state["release"].wait()
+        return {"status": "completed"}
+
+    registry = {"slow": {"interval_hours": 1, "function": slow_task}}
+
+    async def run():
+        state["release"] = asyncio.Event()
+        scheduler = _scheduler(clock, registry)
+        await scheduler.start()
+        await clock.advance_to(START + timedelta(hours=3))
+        # Due three more times while running, but never started twice
+        assert runs == [START]
+        assert "slow" in scheduler._running
+        assert scheduler.run_due() == []
+
+        state["release"].set()
+        await clock.advance_to(clock.now + timedelta(minutes=5))
+        await scheduler.stop()
+
+    asyncio.run(run())
+    # The overdue run starts once, as soon as the slow one finishes
+    assert len(runs) == 2
+    assert runs[1] > START + timedelta(hours=3)
+    assert registry["slow"]["next_run"] == (runs[1] + timedelta(hours=1)).isoformat()
+
+
+def test_concurrency_bound():
+    clock = FakeClock()
+    in_flight = {"now": 0, "max": 0}
+    started = []
+    state = {}
+
+    def blocking_task(name):
+        async def task():
+            started.append(name)
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await state["release"].wait()
+            in_flight["now"] -= 1
+            return {"status": "completed"}
+        return task
+
+    registry = {
+        f"task{i}": {"interval_hours": 24, "function": blocking_task(f"task{i}")}
+        for i in range(4)
+    }
+
+    async def run():
+        state["release"] = asyncio.Event()
+        scheduler = _scheduler(clock, registry, max_concurrency=2)
+        await scheduler.start()
+        await clock.advance_to(START + timedelta(minutes=10))
+        # All four are due and started, but only two hold the semaphore
+        assert len(scheduler._running) == 4
+        assert len(started) == 2
+
+        state["release"].set()
+        await clock.advance_to(clock.now + timedelta(minutes=5))
+        await scheduler.stop()
+
+    asyncio.run(run())
+    assert in_flight["max"] == 2
+    assert sorted(started) == sorted(registry)
+    assert all(info["status"] == "completed" for info in registry.values())
+
+
+class LeaseStore:
+    """In-memory stand-in for the :TaskLease / :TaskRun queries."""
+
+    def __init__(self):
+        self.leases: dict[str, dict] = {}
+        self.runs: dict[str, dict] = {}
+        self.renewals = 0
+        self.fenced = 0
+
+    def install(self, monkeypatch) -> None:
+        for name in ("get_task_runs", "save_task_run", "acquire_task_lease",
+                     "renew_task_lease", "release_task_lease"):
+            monkeypatch.setattr(task_queries, name, getattr(self, name))
+
+    def _lease(self, name: str) -> dict:
+        return self.leases.setdefault(
+            name, {"token": 0, "owner": None, "expires_at": None, "next_due": None}
+        )
+
+    async def get_task_runs(self) -> dict:
+        return dict(self.runs)
+
+    async def save_task_run(self, name, last_run, next_run, duration_seconds, status,
+                            error=None, fencing_token=None) -> bool:
+        if fencing_token is not None and self._lease(name)["token"] != fencing_token:
+            self.fenced += 1
+            return False
+        self.runs[name] = {"last_run": last_run, "next_run": next_run,
+                           "duration_seconds": duration_seconds, "status": status, "error": error}
+        return True
+
+    async def acquire_task_lease(self, name, owner, now, lease_seconds):
+        lease = self._lease(name)
+        granted = (
+            (lease["owner"] is None or lease["expires_at"] < now)
+            and (lease["next_due"] is None or lease["next_due"] <= now)
+        )
+        if not granted:
+            return None, lease["next_due"]
+        lease.update(owner=owner, expires_at=now + timedelta(seconds=lease_seconds))
+        lease["token"] += 1
+        return lease["token"], None
+
+    async def renew_task_lease(self, name, token, now, lease_seconds) -> bool:
+        lease = self._lease(name)
+        if lease["token"] != token:
+            return False
+        lease["expires_at"] = now + timedelta(seconds=lease_seconds)
+        self.renewals += 1
+        return True
+
+    async def release_task_lease(self, name, token, next_due) -> bool:
+        lease = self._lease(name)
+        if lease["token"] != token:
+            return False
+        lease.update(owner=None, expires_at=None, next_due=next_due)
+        return True
+
+
+def _replicas(clock: FakeClock, functions: dict, **options) -> list[TaskScheduler]:
+    """One scheduler per replica, each with its own registry entry for the shared task."""
+    return [
+        _scheduler(
+            clock,
+            {"shared": {"interval_hours": 1, "function": function}},
+            persist=True,
+            owner=owner,
+            **options
+        )
+        for owner, function in functions.items()
+    ]
+
+
+def test_two_replicas_run_each_interval_once(monkeypatch):
+    clock = FakeClock()
+    store = LeaseStore()
+    store.install(monkeypatch)
+    runs = []
+
+    def replica_task(owner):
+        async def task():
+            runs.append((owner, clock.now))
+            return {"status": "completed"}
+        return task
+
+    async def run():
+        schedulers = _replicas(clock, {"a": replica_task("a"), "b": replica_task("b")})
+        for scheduler in schedulers:
+            await scheduler.start()
+        await clock.advance_to(START + timedelta(hours=3))
+        for scheduler in schedulers:
+            await scheduler.stop()
+        return schedulers
+
+    schedulers = asyncio.run(run())
+    assert [when for _, when in runs] == [START + timedelta(hours=h) for h in range(4)]
+    assert store.fenced == 0
+    # Both replicas follow the schedule recorded on release
+    for scheduler in schedulers:
+        assert scheduler._next_run["shared"] == START + timedelta(hours=4)
+
+
+def test_lease_renewed_while_long_task_runs(monkeypatch):
+    clock = FakeClock()
+    store = LeaseStore()
+    store.install(monkeypatch)
+    runs = []
+    state = {}
+
+    async def long_task():
+        runs.append("a")
+        await clock.sleep(timedelta(minutes=20).total_seconds())
+        return {"status": "completed"}
+
+    async def other_task():
+        runs.append("b")
+        return {"status": "completed"}
+
+    async def run():
+        schedulers = _replicas(clock, {"a": long_task, "b": other_task}, lease_seconds=300)
+        await schedulers[0].start()
+        await clock.advance_to(START + timedelta(seconds=1), step=timedelta(seconds=1))
+        await schedulers[1].start()
+        # B keeps trying every tick while A's 20-minute run outlives the 5-minute lease
+        await clock.advance_to(START + timedelta(minutes=30), step=timedelta(seconds=10))
+        state["status"] = schedulers[0].registry["shared"]["status"]
+        for scheduler in schedulers:
+            await scheduler.stop()
+
+    asyncio.run(run())
+    assert runs == ["a"]
+    assert store.renewals >= 3
+    assert state["status"] == "completed"
+    assert store.runs["shared"]["status"] == "completed"
+
+
+def test_expired_lease_fences_stale_replica(monkeypatch):
+    clock = FakeClock()
+    store = LeaseStore()
+    store.install(monkeypatch)
+    state = {}
+
+    async def stalled_task():
+        # Renewals stop (e.g. a network partition) and the lease expires
+        state["renewal_fails"] = True
+        await state["release"].wait()
+        return {"status": "completed"}
+
+    async def takeover_task():
+        return {"status": "completed"}
+
+    renew = store.renew_task_lease
+
+    async def flaky_renew(name, token, now, lease_seconds):
+        if state.get("renewal_fails"):
+            raise ConnectionError("partitioned")
+        return await renew(name, token, now, lease_seconds)
+
+    monkeypatch.setattr(task_queries, "renew_task_lease", flaky_renew)
+
+    async def run():
+        state["release"] = asyncio.Event()
+        schedulers = _replicas(clock, {"a": stalled_task, "b": takeover_task}, lease_seconds=300)
+        await schedulers[0].start()
+        await clock.advance_to(START + timedelta(seconds=1), step=timedelta(seconds=1))
+        await schedulers[1].start()
+        await clock.advance_to(START + timedelta(minutes=10))
+        state["release"].set()
+        await clock.advance_to(START + timedelta(minutes=11))
+        for scheduler in schedulers:
+            await scheduler.stop()
+
+    asyncio.run(run())
+    # B took over once the lease expired; A's late result was fenced off
+    assert store.leases["shared"]["token"] == 2
+    assert store.fenced == 1
+    assert store.runs["shared"]["last_run"] > START
+
+
+REPLICA_INTERVAL_SECONDS = 2.0
+REPLICA_RUN_SECONDS = 9.0
+
+
+async def _run_replica(name: str, owner: str) -> None:
+    """Run one scheduler replica on its own driver, recording each execution."""
+    connection = benchmark_connection()
+    await connection.connect()
+
+    async def get_connection():
+        return connection
+
+    task_queries.get_connection = get_connection
+
+    async def task():
+        # Record which lease (holder and fencing token) this execution ran under
+        await connection.write(
+            """
+            MATCH (l:TaskLease {name: $name})
+            CREATE (:TaskExecution {
+                name: $name, owner: $owner, lease_owner: l.owner,
+                token: l.token, started_at: datetime()
+            })
+            """,
+            name=name,
+            owner=owner
+        )
+        # Hold the lease for a while, so overlapping runs would show
+        await asyncio.sleep(REPLICA_INTERVAL_SECONDS / 4)
+        return {"status": "completed"}
+
+    scheduler = TaskScheduler(
+        {name: {"interval_hours": REPLICA_INTERVAL_SECONDS / 3600, "function": task}},
+        jitter_fraction=0.0,
+        tick_seconds=0.05,
+        lease_seconds=5.0,
+        owner=owner
+    )
+    try:
+        await scheduler.start()
+        await asyncio.sleep(REPLICA_RUN_SECONDS)
+        await scheduler.stop()
+    finally:
+        await connection.close()
+
+
+def _replica_process(name: str, owner: str) -> None:
+    asyncio.run(_run_replica(name, owner))
+
+
+def test_replica_processes_share_one_neo4j(monkeypatch):
+    replicas = benchmark_size("BRAINOS_BENCHMARK_REPLICAS", 4)
+    name = f"replica_test_{uuid.uuid4().hex[:8]}"
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch) as connection:
+            context = multiprocessing.get_context("spawn")
+            processes = [
+                context.Process(target=_replica_process, args=(name, f"replica-{i}"))
+                for i in range(replicas)
+            ]
+            try:
+                for process in processes:
+                    process.start()
+                for process in processes:
+                    await asyncio.to_thread(process.join, REPLICA_RUN_SECONDS * 3)
+                assert [process.exitcode for process in processes] == [0] * replicas
+
+                executions = await connection.read(
+                    """
+                    MATCH (e:TaskExecution {name: $name})
+                    RETURN e.owner AS owner, e.lease_owner AS lease_owner,
+                           e.token AS token, e.started_at AS started_at
+                    ORDER BY e.started_at
+                    """,
+                    name=name
+                )
+                runs = await connection.read(
+                    "MATCH (t:TaskRun {name: $name}) RETURN t.status AS status", name=name
+                )
+                return [dict(record) for record in executions], [record["status"] for record in runs]
+            finally:
+                for process in processes:
+                    if process.is_alive():
+                        process.kill()
+                await connection.write(
+                    """
+                    MATCH (n)
+                    WHERE (n:TaskExecution OR n:TaskLease OR n:TaskRun) AND n.name = $name
+                    DETACH DELETE n
+                    """,
+                    name=name
+                )
+
+    executions, statuses = asyncio.run(run())
+    assert len(executions) >= 3
+    # Every execution ran under its own replica's lease
+    assert all(e["lease_owner"] == e["owner"] for e in executions)
+    # Fencing tokens only increase
+    tokens = [e["token"] for e in executions]
+    assert tokens == sorted(set(tokens))
+    # One execution per interval: starts are at least an interval apart
+    starts = [e["started_at"].to_native() for e in executions]
+    for earlier, later in zip(starts, starts[1:]):
+        assert later - earlier >= timedelta(seconds=REPLICA_INTERVAL_SECONDS * 0.9)
+    assert statuses == ["completed"]
@@ -0,0 +1,164 @@
+"""
+Tests for the Neo4j schema migrations.
+
+The EXPLAIN plan checks and the content-hash backfill test need a real
+server and run only when BRAINOS_BENCHMARK_NEO4J_URI points at a disposable
+Neo4j 5.11+ instance.
+"""
+
+import asyncio
+import re
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.database.schema import MIGRATIONS, SCHEMA_VERSION, backfill_content_hash, run_migrations
+from tests.benchmarks.harness import BENCHMARK_SOURCE, benchmark_neo4j
+from tests.neo4j_stub import StubDriver, stub_connection
+
+
+def _schema_statements(driver: StubDriver) -> list[str]:
+    return [
+        " ".join(call.cypher.split())
+        for call in driver.calls
+        if re.match(r"\s*(CREATE|DROP) ", call.cypher)
+    ]
+
+
+def test_migration_versions_increase():
+    versions = [m.version for m in MIGRATIONS]
+    assert versions == sorted(set(versions))
+    assert SCHEMA_VERSION == versions[-1]
+
+
+def test_schema_statements_are_idempotent():
+    for migration in MIGRATIONS:
+        for statement in migration.statements:
+            if re.match(r"\s*CREATE ", statement):
+                assert "IF NOT EXISTS" in statement, statement
+            if re.match(r"\s*DROP ", statement):
+                assert "IF EXISTS" in statement, statement
+
+
+def test_no_constraint_on_raw_content():
+    # Large contents exceed the index key size limit
+    for migration in MIGRATIONS:
+        for statement in migration.statements:
+            assert "REQUIRE b.content IS UNIQUE" not in statement
+
+
+def test_run_migrations_applies_pending_and_records_version():
+    version = {"value": 0}
+
+    def handler(cypher, params):
+        if "RETURN v.version" in cypher:
+            return [{"version": version["value"]}]
+        if "SET v.version" in cypher:
+            version["value"] = params["version"]
+        return []
+
+    driver = StubDriver(handler=handler)
+    applied = asyncio.run(run_migrations(stub_connection(driver)))
+
+    assert applied == SCHEMA_VERSION
+    assert version["value"] == SCHEMA_VERSION
+    statements = _schema_statements(driver)
+    assert any("CREATE FULLTEXT INDEX bubble_fulltext" in s for s in statements)
+    assert any("CREATE CONSTRAINT bubble_uid_unique" in s for s in statements)
+
+    # A second run finds the schema current and runs nothing
+    driver.calls.clear()
+    assert asyncio.run(run_migrations(stub_connection(driver))) == SCHEMA_VERSION
+    assert _schema_statements(driver) == []
+
+
+def test_run_migrations_resumes_after_applied_version():
+    driver = StubDriver(handler=lambda cypher, params: (
+        [{"version": 4}] if "RETURN v.version" in cypher else []
+    ))
+    asyncio.run(run_migrations(stub_connection(driver)))
+
+    statements = _schema_statements(driver)
+    assert not any("bubble_fulltext" in s for s in statements)
+    assert any("bubble_last_accessed" in s for s in statements)
+
+
+def _operators(plan: dict) -> list[str]:
+    operators = [plan["operatorType"]]
+    for child in plan.get("children", []):
+        operators.extend(_operators(child))
+    return operators
+
+
+# Filters of the query layer that must be served by an index
+INDEXED_QUERIES = {
+    "content_hash": "MATCH (b:Bubble {content_hash: $value}) RETURN b.uid",
+    "uid": "MATCH (b:Bubble {uid: $value}) RETURN b.uid",
+    "memory_type": "MATCH (b:Bubble) WHERE b.memory_type = $value RETURN b.uid",
+    "sector": "MATCH (b:Bubble) WHERE b.sector = $value RETURN b.uid",
+    "source": "MATCH (b:Bubble) WHERE b.source = $value RETURN b.uid",
+    "created_at": "MATCH (b:Bubble) WHERE b.created_at > datetime() - duration('P30D') RETURN b.uid",
+    "last_accessed": "MATCH (b:Bubble) WHERE b.last_accessed < datetime() RETURN b.uid",
+}
+
+
+@pytest.mark.parametrize("name", sorted(INDEXED_QUERIES))
+def test_explain_plans_use_index_seeks(monkeypatch, name):
+    async def run():
+        async with benchmark_neo4j(monkeypatch) as connection:
+            async with connection.session() as session:
+                result = await session.run(f"EXPLAIN {INDEXED_QUERIES[name]}", value="x")
+                summary = await result.consume()
+                return _operators(summary.plan)
+
+    operators = asyncio.run(run())
+    assert any("IndexSeek" in operator for operator in operators), operators
+
+
+def test_content_hash_backfill_prefers_active_then_oldest(monkeypatch):
+    marker = uuid.uuid4().hex
+    # Created in this order so internal ids disagree with created_at
+    bubbles = [
+        ("active_newer", f"Alice chose PostgreSQL {marker}", datetime(2025, 1, 1, tzinfo=timezone.utc), None),
+        ("deleted_oldest", f"alice chose postgresql {marker}", datetime(2020, 1, 1, tzinfo=timezone.utc),
+         datetime(2021, 1, 1, tzinfo=timezone.utc)),
+        ("active_older", f"ALICE  chose PostgreSQL {marker}", datetime(2024, 1, 1, tzinfo=timezone.utc), None),
+    ]
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch) as connection:
+            await connection.write(
+                """
+                UNWIND $rows AS row
+                CREATE (:Bubble {
+                    uid: randomUUID(), name: row.name, content: row.content, source: $source,
+                    created_at: row.created_at, valid_to: row.valid_to
+                })
+                """,
+                rows=[
+                    {"name": name, "content": content, "created_at": created_at, "valid_to": valid_to}
+                    for name, content, created_at, valid_to in bubbles
+                ],
+                source=BENCHMARK_SOURCE
+            )
+            async with connection.session() as session:
+                await backfill_content_hash(session)
+            records = await connection.read(
+                """
+                MATCH (b:Bubble {source: $source}) WHERE b.content ENDS WITH $marker
+                RETURN b.name AS name, b.content_hash IS NOT NULL AS hashed,
+                       b.duplicate_of_hash IS NOT NULL AS duplicate, b.valid_to AS valid_to
+                """,
+                source=BENCHMARK_SOURCE,
+                marker=marker
+            )
+            return {record["name"]: record for record in records}
+
+    results = asyncio.run(run())
+    # The oldest active bubble keeps the hash and stays live
+    assert results["active_older"]["hashed"] and results["active_older"]["valid_to"] is None
+    assert results["active_newer"]["duplicate"] and results["active_newer"]["valid_to"] is not None
+    # The stale soft-deleted copy does not claim it, and keeps its deletion time
+    assert results["deleted_oldest"]["duplicate"] and not results["deleted_oldest"]["hashed"]
+    assert results["deleted_oldest"]["valid_to"].to_native() == datetime(2021, 1, 1, tzinfo=timezone.utc)
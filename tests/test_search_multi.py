@@ -0,0 +1,118 @@
+"""
+Tests for the single-round-trip multi-term bubble search.
+
+The stub tests check how terms are sent and results are read back; the
+Neo4j test checks the UNWIND query itself and requires
+BRAINOS_BENCHMARK_NEO4J_URI.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from neo4j.exceptions import ClientError
+
+from src.database.queries import memory
+from src.database.queries.memory import search_bubbles_multi
+from tests.benchmarks.harness import benchmark_neo4j, seed_bubbles
+from tests.neo4j_stub import StubDriver, stub_connection
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _use_stub(monkeypatch, handler, failures=None) -> StubDriver:
+    driver = StubDriver(handler=handler, failures=failures or [])
+    connection = stub_connection(driver)
+
+    async def get_connection():
+        return connection
+
+    monkeypatch.setattr(memory, "get_connection", get_connection)
+    return driver
+
+
+def _row(uid: str, content: str, terms: list[str]) -> dict:
+    bubble = {"content": content, "sector": "Semantic", "salience": 0.5, "created_at": NOW}
+    return {"bubble": bubble, "uid": uid, "matched_terms": terms}
+
+
+def test_duplicate_and_blank_terms_sent_once(monkeypatch):
+    driver = _use_stub(monkeypatch, lambda cypher, params: [])
+
+    asyncio.run(search_bubbles_multi(["PostgreSQL", " postgresql", "", "  ", "PostgreSQL ", "billing", None]))
+
+    assert len(driver.calls) == 1
+    call = driver.calls[0]
+    assert call.params["terms"] == [
+        {"text": "PostgreSQL", "query": "postgresql"},
+        {"text": "billing", "query": "billing"},
+    ]
+    assert call.cypher.lstrip().startswith("UNWIND $terms AS term")
+
+
+def test_no_usable_terms_runs_no_query(monkeypatch):
+    driver = _use_stub(monkeypatch, lambda cypher, params: [])
+
+    assert asyncio.run(search_bubbles_multi([])) == []
+    assert asyncio.run(search_bubbles_multi(["", "   "])) == []
+    assert driver.calls == []
+
+
+def test_results_carry_matched_terms(monkeypatch):
+    _use_stub(monkeypatch, lambda cypher, params: [
+        _row("u1", "PostgreSQL for billing", ["postgres", "billing"]),
+        _row("u2", "billing service", ["billing"]),
+    ])
+
+    results = asyncio.run(search_bubbles_multi(["postgres", "billing"]))
+
+    assert [(bubble.id, terms) for bubble, terms in results] == [
+        ("u1", ["postgres", "billing"]),
+        ("u2", ["billing"]),
+    ]
+
+
+def test_falls_back_to_scan_without_fulltext_index(monkeypatch):
+    driver = _use_stub(
+        monkeypatch,
+        lambda cypher, params: [_row("u1", "PostgreSQL", ["postgres"])],
+        failures=[ClientError("no such index")]
+    )
+
+    results = asyncio.run(search_bubbles_multi(["postgres"], memory_type="thinking"))
+
+    assert [bubble.id for bubble, _ in results] == ["u1"]
+    assert "db.index.fulltext.queryNodes" not in driver.calls[-1].cypher
+    assert "CONTAINS toLower(term.text)" in driver.calls[-1].cypher
+    assert driver.calls[-1].params["memory_type"] == "thinking"
+
+
+def test_union_deduplicated_in_neo4j(monkeypatch):
+    marker = uuid.uuid4().hex
+    alpha, beta, unused = f"alpha{marker[:10]}", f"beta{marker[10:20]}", f"gamma{marker[20:30]}"
+    contents = {
+        "both": f"notes on {alpha} and {beta}",
+        "alpha": f"only {alpha} here",
+        "beta": f"only {beta} here",
+    }
+    rows = [
+        {
+            "content": content, "sector": "Semantic", "salience": 0.5, "memory_type": "thinking",
+            "entities": [], "created_at": NOW - timedelta(days=i),
+        }
+        for i, content in enumerate(contents.values())
+    ]
+
+    async def run():
+        async with benchmark_neo4j(monkeypatch, memory) as connection:
+            await seed_bubbles(connection, rows)
+            return await search_bubbles_multi([alpha, beta, alpha, unused, " "], limit_per_term=5)
+
+    results = asyncio.run(run())
+    by_content = {bubble.content: terms for bubble, terms in results}
+
+    assert len(results) == len(by_content) == 3
+    assert results[0][0].content == contents["both"]
+    assert sorted(by_content[contents["both"]]) == sorted([alpha, beta])
+    assert by_content[contents["alpha"]] == [alpha]
+    assert by_content[contents["beta"]] == [beta]
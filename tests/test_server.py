@@ -0,0 +1,65 @@
+"""
+Tests for the server lifespan: startup failures must not leak the Neo4j driver.
+"""
+
+import asyncio
+
+import pytest
+
+import brainos_server
+from src.tasks import scheduler
+from src.utils import embeddings
+
+
+@pytest.fixture
+def startup(monkeypatch):
+    """Patches the lifespan's startup steps; returns the order they ran in."""
+    events = []
+
+    def step(name, error=None):
+        async def run(*args, **kwargs):
+            events.append(name)
+            if error:
+                raise error
+        return run
+
+    monkeypatch.setattr(brainos_server, "get_connection", step("connect"))
+    monkeypatch.setattr(brainos_server, "run_migrations", step("migrate"))
+    monkeypatch.setattr(brainos_server, "close_connection", step("close"))
+    monkeypatch.setattr(embeddings, "load_embedder", step("embedder"))
+    monkeypatch.setattr(scheduler, "start_scheduler", step("start"))
+    monkeypatch.setattr(scheduler, "stop_scheduler", step("stop"))
+
+    def fail(module, name):
+        monkeypatch.setattr(module, name, step(name, RuntimeError(f"{name} failed")))
+
+    return events, fail
+
+
+async def _serve():
+    async with brainos_server.lifespan(brainos_server.mcp):
+        pass
+
+
+@pytest.mark.parametrize("module, name", [
+    (brainos_server, "run_migrations"),
+    (embeddings, "load_embedder"),
+])
+def test_startup_failure_closes_connection(startup, module, name):
+    events, fail = startup
+    fail(module, name)
+
+    with pytest.raises(RuntimeError, match=f"{name} failed"):
+        asyncio.run(_serve())
+
+    assert events[-2:] == ["stop", "close"]
+
+
+def test_scheduler_stop_failure_still_closes_connection(startup):
+    events, fail = startup
+    fail(scheduler, "stop_scheduler")
+
+    with pytest.raises(RuntimeError, match="stop_scheduler failed"):
+        asyncio.run(_serve())
+
+    assert events[-1] == "close"